@@ -1,6 +1,8 @@
-from fastapi import FastAPI, HTTPException
-from typing import List
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, Iterator, List
 import os
+import asyncio
 from datetime import datetime
 
 # 유틸리티 모듈 임포트
@@ -8,14 +10,26 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from lib.models import (
     SearchRequest, SearchResponse, 
+    BatchSearchRequest, BatchSearchItem, BatchSearchResponse,
     AnalyzeRequest, AnalyzeResponse,
     SyncRequest, SyncResponse,
-    NotifyRequest, NotifyResponse
+    NotifyRequest, NotifyResponse, NotifyTicketResponse
 )
-from lib.search_utils import search_keywords, get_cached_results, save_to_cache
-from lib.rag_engine import generate_analysis_text
+from lib.search_utils import (
+    get_search_results, search_many, get_search_metrics, apply_scoring_profile,
+    search_cache, SEARCH_BATCH_MAX_SEEDS
+)
+from lib.scoring import get_profile, DEFAULT_PROFILE
+from lib.rag_engine import generate_analysis_text, stream_analysis_text, category_cache
 from lib.google_client import save_keywords_to_sheet
-from lib.telegram_client import send_telegram_message, format_keywords_message
+from lib.telegram_client import (
+    send_long_telegram_message_async, close_telegram_clients, format_keywords_message, is_chat_allowed
+)
+from lib.telegram_queue import notification_outbox
+from lib.sheets_sync import sheet_sync_buffer
+from lib.logger import log_api_request
+from lib.metrics import metrics_registry, MetricsMiddleware, METRICS_ENABLED, PROMETHEUS_CONTENT_TYPE
+from lib.tracing import traced, traced_iter, bind_context, TracingMiddleware, TRACE_ENABLED
 
 app = FastAPI(
     title="KeywordPulse API",
@@ -23,25 +37,54 @@ app = FastAPI(
     description="서버리스 환경에서 동작하는 키워드 분석 API"
 )
 
+# 요청 로깅 미들웨어, 단계별 구간 추적 미들웨어와, 가장 바깥에서 요청 지연/오류를 기록하는 지표 미들웨어 등록
+app.middleware("http")(log_api_request)
+if TRACE_ENABLED:
+    app.add_middleware(TracingMiddleware)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# 캐시 히트율은 수집 시점에 캐시 통계에서 읽음
+metrics_registry.register_cache("search", lambda: search_cache.stats)
+metrics_registry.register_cache("category", lambda: category_cache.stats)
+
+@app.on_event("startup")
+async def start_workers():
+    """이전 실행에서 디스크에 보관된 동기화 행이 있으면 재기록 워커를 시작합니다."""
+    sheet_sync_buffer.start()
+
+@app.on_event("shutdown")
+async def shutdown_clients():
+    """발신 큐/동기화 버퍼 워커와 공유 HTTP 클라이언트 세션을 정리합니다."""
+    await notification_outbox.stop()
+    await sheet_sync_buffer.stop()
+    await close_telegram_clients()
+
 # --- API 엔드포인트 ---
 @app.post("/api/search", response_model=SearchResponse)
+@traced("api.search")
 async def search_keywords_api(request: SearchRequest):
     """
     키워드 검색 및 분석을 수행합니다.
     """
+    try:
+        profile = get_profile(request.profile)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         print(f"[search] 키워드 검색 시작: {request.keyword}")
-        # 캐시 확인
-        cached_results = get_cached_results(request.keyword)
-        if cached_results:
-            print(f"[search] 캐시된 결과 사용: {request.keyword}")
-            return SearchResponse(keywords=cached_results, cached=True)
-        
-        # 신규 검색 수행
-        keywords_data = search_keywords(request.keyword)
+        # 캐시 확인 (소프트 TTL이 지난 결과는 즉시 반환하고 백그라운드에서 갱신,
+        # 캐시가 없으면 동일 키워드 동시 요청을 하나로 병합하여 신규 검색)
+        result = await get_search_results(request.keyword)
+        keywords_data = result.keywords
+        if profile is not DEFAULT_PROFILE:
+            keywords_data = apply_scoring_profile(keywords_data, profile)
         
-        # 캐시에 저장
-        save_to_cache(request.keyword, keywords_data)
+        if result.cached:
+            print(f"[search] 캐시된 결과 사용: {request.keyword} (age={result.age:.1f}s, stale={result.stale})")
+            return SearchResponse(keywords=keywords_data, cached=True,
+                                  cacheAge=round(result.age, 3), stale=result.stale)
         
         print(f"[search] 검색 완료: {len(keywords_data)}개 키워드 발견")
         return SearchResponse(keywords=keywords_data, cached=False)
@@ -49,7 +92,59 @@ async def search_keywords_api(request: SearchRequest):
         print(f"[search] 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/search/batch", response_model=BatchSearchResponse)
+@traced("api.search_batch")
+async def search_keywords_batch_api(request: BatchSearchRequest):
+    """
+    여러 시드 키워드를 한 번에 검색합니다.
+    """
+    if len(request.keywords) > SEARCH_BATCH_MAX_SEEDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {SEARCH_BATCH_MAX_SEEDS}개 키워드까지 검색할 수 있습니다."
+        )
+    
+    try:
+        profile = get_profile(request.profile)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        print(f"[search/batch] 일괄 검색 시작: {len(request.keywords)}개 시드")
+        results = await search_many(request.keywords)
+        
+        items = {}
+        error_count = 0
+        for seed, result in results.items():
+            if isinstance(result, Exception):
+                error_count += 1
+                items[seed] = BatchSearchItem(error=str(result))
+            else:
+                keywords_data = result.keywords
+                if profile is not DEFAULT_PROFILE:
+                    keywords_data = apply_scoring_profile(keywords_data, profile)
+                items[seed] = BatchSearchItem(
+                    keywords=keywords_data,
+                    cached=result.cached,
+                    cacheAge=round(result.age, 3) if result.age is not None else None,
+                    stale=result.stale
+                )
+        
+        print(f"[search/batch] 일괄 검색 완료: {len(items)}개 시드, 오류 {error_count}개")
+        return BatchSearchResponse(results=items, errorCount=error_count)
+    except Exception as e:
+        print(f"[search/batch] 오류 발생: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/search/stats")
+async def search_stats_api():
+    """
+    검색 캐시 및 요청 병합 지표를 반환합니다.
+    """
+    return get_search_metrics()
+
 @app.post("/api/analyze", response_model=AnalyzeResponse)
+@traced("api.analyze")
 async def generate_analysis_api(request: AnalyzeRequest):
     """
     RAG 기반으로 키워드 분석 텍스트를 생성합니다.
@@ -58,16 +153,7 @@ async def generate_analysis_api(request: AnalyzeRequest):
         print(f"[analyze] 분석 시작: {len(request.keywords)}개 키워드")
         
         # 분석 텍스트 생성
-        keywords_info = []
-        for keyword in request.keywords:
-            # 간소화를 위해 임시 데이터 생성
-            keywords_info.append({
-                "keyword": keyword,
-                "monthlySearches": 10000,  # 실제로는 DB나 검색 결과에서 가져와야 함
-                "competitionRate": 0.5,
-                "score": 75
-            })
-        
+        keywords_info = build_keywords_info(request.keywords)
         analysis_text = generate_analysis_text(keywords_info)
         
         print(f"[analyze] 분석 완료: {len(analysis_text)} 글자")
@@ -76,18 +162,69 @@ async def generate_analysis_api(request: AnalyzeRequest):
         print(f"[analyze] 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/analyze/stream")
+async def stream_analysis_api(request: AnalyzeRequest, raw_request: Request):
+    """
+    분석 텍스트를 섹션이 만들어지는 대로 스트리밍합니다.
+    
+    기본은 청크 단위 Markdown 텍스트(text/markdown)이며,
+    Accept 헤더에 text/event-stream이 있으면 SSE(data 이벤트, 마지막에 end 이벤트)로 보냅니다.
+    """
+    print(f"[analyze/stream] 분석 스트리밍 시작: {len(request.keywords)}개 키워드")
+    # 핸들러는 응답 객체만 반환하고 생성은 본문을 보낼 때 일어나므로, 추적 구간은 본문 소비 전체를 감쌈
+    chunks = traced_iter("api.analyze_stream", stream_analysis_text(build_keywords_info(request.keywords)))
+    
+    if "text/event-stream" in raw_request.headers.get("accept", ""):
+        return StreamingResponse(format_sse_events(chunks), media_type="text/event-stream",
+                                 headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    return StreamingResponse(chunks, media_type="text/markdown; charset=utf-8",
+                             headers={"X-Accel-Buffering": "no"})
+
+def build_keywords_info(keywords: List[str]) -> List[Dict[str, Any]]:
+    """
+    분석 요청의 키워드 문자열을 분석용 키워드 정보로 바꿉니다.
+    """
+    # 간소화를 위해 임시 데이터 생성 (실제로는 DB나 검색 결과에서 가져와야 함)
+    return [{
+        "keyword": keyword,
+        "monthlySearches": 10000,
+        "competitionRate": 0.5,
+        "score": 75
+    } for keyword in keywords]
+
+def format_sse_events(chunks: Iterator[str]) -> Iterator[str]:
+    """
+    텍스트 조각을 SSE 이벤트로 바꿉니다. (조각 안의 줄바꿈은 data 줄 여러 개로 나눔)
+
+    SSE는 CRLF, CR, LF를 모두 줄 끝으로 보므로, 키워드에 들어 있는 CR이 필드를 끼워 넣거나
+    이벤트를 일찍 끝내지 않도록 먼저 LF로 통일한 뒤 나눕니다.
+    """
+    for chunk in chunks:
+        chunk = chunk.replace("\r\n", "\n").replace("\r", "\n")
+        yield "".join(f"data: {line}\n" for line in chunk.split("\n")) + "\n"
+    yield "event: end\ndata: \n\n"
+
 @app.post("/api/sync", response_model=SyncResponse)
+@traced("api.sync")
 async def sync_to_sheets_api(request: SyncRequest):
     """
     키워드 분석 결과를 Google Sheets에 저장합니다.
     """
     try:
         print(f"[sync] 구글 시트 저장 시작: {len(request.keywords)}개 키워드")
+        keywords = [dict(kw) for kw in request.keywords]
+        
+        # 버퍼 사용 시 백그라운드 워커가 모아서 일괄 기록하고 즉시 반환
+        if request.queued:
+            pending = sheet_sync_buffer.add(keywords, request.timestamp)
+            print(f"[sync] 동기화 버퍼 등록: 대기 중인 행 {pending}개")
+            return SyncResponse(success=True, spreadsheetUrl=sheet_sync_buffer.last_url,
+                                queued=True, pendingRows=pending)
         
-        # Google Sheets에 저장
-        spreadsheet_url = save_keywords_to_sheet(
-            [dict(kw) for kw in request.keywords],
-            request.timestamp
+        # Google Sheets에 저장 (블로킹 gspread 호출은 실행기 스레드에서 수행, 추적 구간은 이어짐)
+        loop = asyncio.get_running_loop()
+        spreadsheet_url = await loop.run_in_executor(
+            None, bind_context(save_keywords_to_sheet, keywords, request.timestamp)
         )
         
         print(f"[sync] 저장 완료: {spreadsheet_url}")
@@ -96,26 +233,69 @@ async def sync_to_sheets_api(request: SyncRequest):
         print(f"[sync] 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/sync/stats")
+async def sync_stats_api():
+    """
+    동기화 버퍼의 대기 행 수와 기록 지표를 반환합니다.
+    """
+    return sheet_sync_buffer.get_stats()
+
 @app.post("/api/notify", response_model=NotifyResponse)
+@traced("api.notify")
 async def send_notification_api(request: NotifyRequest):
     """
     분석 결과를 Telegram으로 전송합니다.
     """
+    if not is_chat_allowed(request.chatId):
+        print(f"[notify] 허용되지 않은 채팅 ID: {request.chatId}")
+        raise HTTPException(status_code=403, detail="허용되지 않은 채팅 ID입니다.")
+
     try:
         print(f"[notify] 텔레그램 알림 전송 시작")
         
-        # Telegram으로 전송
-        response = send_telegram_message(request.analysisText)
+        # 발신 큐 사용 시 속도 제한에 맞춰 백그라운드에서 전송하고 티켓 ID만 반환
+        if request.queued:
+            ticket = notification_outbox.enqueue(request.analysisText, chat_id=request.chatId)
+            print(f"[notify] 발신 큐 등록: ticket_id={ticket.ticket_id}")
+            return NotifyResponse(success=True, ticketId=ticket.ticket_id)
+        
+        # Telegram으로 전송 (길이 제한을 넘으면 나누어 같은 연결에서 순서대로 전송)
+        responses = await send_long_telegram_message_async(request.analysisText, chat_id=request.chatId)
         
         # API 응답에서 message_id 추출
-        message_id = str(response.get('result', {}).get('message_id', ''))
+        message_ids = [str(response.get('result', {}).get('message_id', '')) for response in responses]
         
-        print(f"[notify] 전송 완료: message_id={message_id}")
-        return NotifyResponse(success=True, messageId=message_id)
+        print(f"[notify] 전송 완료: message_ids={message_ids}")
+        return NotifyResponse(success=True, messageId=message_ids[0] if message_ids else None,
+                              messageIds=message_ids)
     except Exception as e:
         print(f"[notify] 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/notify/tickets/{ticket_id}", response_model=NotifyTicketResponse)
+async def get_notification_ticket_api(ticket_id: str):
+    """
+    발신 큐에 등록된 알림의 처리 상태를 반환합니다.
+    """
+    ticket = notification_outbox.get_ticket(ticket_id)
+    if ticket is None:
+        raise HTTPException(status_code=404, detail=f"알 수 없는 티켓: {ticket_id}")
+    return NotifyTicketResponse(**ticket.to_dict())
+
+@app.get("/api/notify/stats")
+async def notification_stats_api():
+    """
+    발신 큐 깊이와 전송 지연 지표를 반환합니다.
+    """
+    return notification_outbox.get_stats()
+
+@app.get("/metrics")
+async def metrics_api():
+    """
+    요청 지연 히스토그램, 처리 중 요청 수, 오류 수, 캐시 히트율을 Prometheus 텍스트 형식으로 반환합니다.
+    """
+    return Response(content=metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
 # Root 경로 추가
 @app.get("/")
 async def root():
@@ -0,0 +1,87 @@
+"""
+카테고리 분류 벤치마크
+
+기존 categorize_keyword 방식(호출마다 패턴 사전을 만들고 카테고리×용어 포함 검사)과
+컴파일된 Aho-Corasick 분류 엔진의 단건/일괄 분류 처리량을 비교하고 결과가 같은지 확인합니다.
+용어 수가 늘어날 때의 차이를 보기 위해 큰 무작위 분류 표로도 측정합니다. (캐시 미적용)
+
+실행: python benchmarks/bench_categorize.py [키워드 수]
+"""
+import random
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.categorizer import CategoryMatcher, DEFAULT_CATEGORY_TERMS
+
+def baseline_categorize(keyword: str) -> str:
+    """비교 기준: 캐시를 제외한 기존 categorize_keyword 본문"""
+    k = keyword.lower().strip()
+    category = "일반"
+    patterns = {
+        '디지털 마케팅': ['마케팅', 'seo', '광고', '콘텐츠', '퍼포먼스', '인플루언서', '바이럴', '브랜딩'],
+        'AI 기술': ['ai', '인공지능', '머신러닝', 'gpt', '딥러닝', '자연어', '신경망', '강화학습'],
+        '앱 개발': ['개발', '프로그래밍', '앱', 'app', '코딩', '소프트웨어', '웹', '모바일'],
+        '3D 모델링/AI': ['3d', '모델링', '블렌더', 'blender', '렌더링', '애니메이션', 'cg', '그래픽']
+    }
+    for cat, keywords in patterns.items():
+        if any(kw in k for kw in keywords):
+            category = cat
+            break
+    return category
+
+def table_scan(keyword: str, table) -> str:
+    """큰 분류 표용 기존 방식 (표는 미리 만들어 둠)"""
+    k = keyword.lower().strip()
+    for cat, terms in table.items():
+        if any(term in k for term in terms):
+            return cat
+    return "일반"
+
+def make_keywords(n: int, vocab, rng: random.Random):
+    return [" ".join(rng.choice(vocab) for _ in range(rng.randint(1, 3))) + f" {rng.randint(0, 999)}"
+            for _ in range(n)]
+
+def timed(label: str, fn, n: int):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<22} {elapsed:7.3f}s  {n / elapsed / 1e3:8.1f}K keywords/s")
+    return result
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+
+    vocab = [t for terms in DEFAULT_CATEGORY_TERMS.values() for t in terms]
+    vocab += ["여행", "맛집", "부동산", "주식", "캠핑", "요리", "육아", "패션", "건강", "자동차", "AI", "SEO"]
+    keywords = make_keywords(n, vocab, rng)
+
+    start = time.perf_counter()
+    matcher = CategoryMatcher(DEFAULT_CATEGORY_TERMS)
+    print(f"기본 분류 표: 카테고리 {len(matcher.categories)}개, 용어 {matcher.term_count}개, "
+          f"컴파일 {(time.perf_counter() - start) * 1e3:.2f}ms, 키워드 {n:,}개")
+    expected = timed("baseline", lambda: [baseline_categorize(k) for k in keywords], n)
+    single = timed("compiled categorize", lambda: [matcher.categorize(k) for k in keywords], n)
+    bulk = timed("compiled many", lambda: matcher.categorize_many(keywords), n)
+    assert single == expected and bulk == expected, "분류 결과가 기존 방식과 다릅니다."
+
+    # 큰 분류 표: 카테고리 300개 × 용어 20개
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+    table = {f"카테고리 {c}": ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(20)]
+             for c in range(300)}
+    terms = [t for ts in table.values() for t in ts]
+    big_n = max(1, n // 20)
+    big_keywords = make_keywords(big_n, terms + syllables, rng)
+    start = time.perf_counter()
+    big_matcher = CategoryMatcher(table)
+    print(f"큰 분류 표: 카테고리 {len(table)}개, 용어 {big_matcher.term_count}개, "
+          f"컴파일 {(time.perf_counter() - start) * 1e3:.2f}ms, 키워드 {big_n:,}개")
+    expected = timed("baseline", lambda: [table_scan(k, table) for k in big_keywords], big_n)
+    bulk = timed("compiled many", lambda: big_matcher.categorize_many(big_keywords), big_n)
+    assert bulk == expected, "분류 결과가 기존 방식과 다릅니다."
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+지연 컨텍스트 마이크로벤치마크
+
+INFO 레벨에서 버려지는 DEBUG 로그의 호출 비용을, 컨텍스트 사전을 즉시 만드는 방식과
+함수로 넘겨 지연 생성하는 방식으로 비교하고, rag_engine 핫 패스의 호출당 시간을 측정합니다.
+
+실행: python benchmarks/bench_lazy_context.py [반복 수]
+"""
+import logging
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.logger import get_logger
+from lib.rag_engine import categorize_keyword, generate_analysis_text
+
+def bench(label: str, fn, n: int) -> None:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed / n * 1e9:8.1f}ns/call")
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    # 출력 비용을 제외하도록 핸들러를 떼어 내고 INFO 레벨로 고정
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(logging.INFO)
+    logger = get_logger("bench.lazy")
+
+    top_keywords = [{"keyword": f"키워드 {i}", "score": 100 - i} for i in range(5)]
+    print(f"반복 수: {n:,}, 레벨: INFO")
+
+    print("[DEBUG 로그 호출 비용]")
+    bench("eager context", lambda: logger.debug("상위 키워드 선별 완료", context={
+        "top_keywords": [kw.get("keyword") for kw in top_keywords],
+        "top_scores": [kw.get("score") for kw in top_keywords]
+    }), n)
+    bench("lazy context", lambda: logger.debug("상위 키워드 선별 완료", context=lambda: {
+        "top_keywords": [kw.get("keyword") for kw in top_keywords],
+        "top_scores": [kw.get("score") for kw in top_keywords]
+    }), n)
+
+    print("[rag_engine 핫 패스]")
+    categorize_keyword("AI 마케팅")
+    bench("categorize_keyword (cache)", lambda: categorize_keyword("AI 마케팅"), n)
+    keywords = [{"keyword": f"키워드 {i}", "monthlySearches": i * 100,
+                 "competitionRate": 0.5, "score": i % 100} for i in range(20)]
+    bench("generate_analysis_text", lambda: generate_analysis_text(keywords), n // 10)
+
+if __name__ == "__main__":
+    main()
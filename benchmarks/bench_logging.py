@@ -0,0 +1,116 @@
+"""
+로깅 벤치마크
+
+1. generate_analysis_text 호출(요청 하나에 해당)의 지연 시간을 동기 FileHandler와
+   큐 기반 비동기 로깅에서 각각 측정해 비교합니다.
+2. JSONFormatter의 직렬화 백엔드별 처리량을 기존 방식(레코드마다 사전 생성 + json.dumps)과 비교합니다.
+
+실행: python benchmarks/bench_logging.py [요청 수]
+"""
+import json
+import logging
+import random
+import sys
+import os
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib import logger as logger_module
+from lib.logger import JSONFormatter, get_json_serializer
+from lib.rag_engine import generate_analysis_text
+
+def make_keywords(n: int):
+    rng = random.Random(0)
+    return [{"keyword": f"키워드 {i}", "monthlySearches": rng.randint(0, 60000),
+             "competitionRate": round(rng.random(), 2), "score": rng.randint(0, 100)}
+            for i in range(n)]
+
+def percentile(values, p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+def run(label: str, handler: logging.Handler, requests: int, keywords) -> None:
+    root = logging.getLogger()
+    root.addHandler(handler)
+    latencies = []
+    try:
+        for _ in range(requests):
+            start = time.perf_counter()
+            generate_analysis_text(keywords)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        root.removeHandler(handler)
+    print(f"  {label:<6} p50 {percentile(latencies, 0.5) * 1e6:8.1f}us  "
+          f"p99 {percentile(latencies, 0.99) * 1e6:8.1f}us  "
+          f"total {sum(latencies):6.3f}s")
+
+class BaselineJSONFormatter(logging.Formatter):
+    """비교 기준: 레코드마다 사전을 만들고 현재 시각을 다시 구해 표준 json으로 직렬화"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log_data = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "level": record.levelname,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if getattr(record, "context", None):
+            log_data["context"] = record.context
+        return json.dumps(log_data)
+
+def bench_formatters(n: int) -> None:
+    records = []
+    for i in range(n):
+        record = logging.LogRecord("rag_engine", logging.INFO, "/app/lib/rag_engine.py", 85,
+                                   "키워드 분석 텍스트 생성 완료", None, None, func="generate_analysis_text")
+        record.context = {"keyword_count": 20, "top_keyword": f"키워드 {i}",
+                          "high_score_count": 4, "processing_time_ms": 0.12}
+        records.append(record)
+
+    formatters = [("baseline", BaselineJSONFormatter()),
+                  ("json", JSONFormatter(serializer=get_json_serializer("json"))),
+                  ("auto", JSONFormatter(serializer=get_json_serializer("auto")))]
+    print(f"포맷터 처리량 (레코드 {n:,}개)")
+    for label, formatter in formatters:
+        for record in records:
+            record.__dict__.pop("_json_line", None)
+        start = time.perf_counter()
+        for record in records:
+            formatter.format(record)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<8} {elapsed:6.3f}s  {n / elapsed / 1e3:8.1f}K records/s")
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    keywords = make_keywords(20)
+
+    # 기본 설정된 핸들러를 떼어 내고 측정용 파일 핸들러만 사용
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"요청 수: {requests:,}, 레벨: {logging.getLevelName(root.level)}")
+
+        sync_handler = logging.FileHandler(os.path.join(tmp, "sync.log"))
+        sync_handler.setFormatter(JSONFormatter())
+        run("sync", sync_handler, requests, keywords)
+        sync_handler.close()
+
+        async_target = logging.FileHandler(os.path.join(tmp, "async.log"))
+        async_target.setFormatter(JSONFormatter())
+        queue_handler = logger_module.start_async_logging([async_target], policy="block")
+        run("async", queue_handler, requests, keywords)
+        logger_module.stop_async_logging()
+        async_target.close()
+        print(f"  async 통계: {queue_handler.stats.to_dict()}")
+
+    bench_formatters(requests * 5)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+지표 기록 오버헤드 마이크로벤치마크
+
+MetricsMiddleware가 요청 하나마다 수행하는 작업(라우트 템플릿 조회, 처리 중 게이지 증감,
+히스토그램 기록, 카운터 증가)의 호출당 시간과 /metrics 출력 시간을 측정합니다.
+
+실행: python benchmarks/bench_metrics.py [반복 수]
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.metrics import (
+    MetricsMiddleware, metrics_registry, http_request_duration, http_requests,
+    http_requests_in_flight
+)
+
+def bench(label: str, fn, n: int) -> None:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {elapsed / n * 1e9:8.1f}ns/call")
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    from api.main import app
+    middleware = MetricsMiddleware(app)
+    static_scope = {"app": app, "path": "/api/search"}
+    param_scope = {"app": app, "path": "/api/notify/tickets/abc"}
+
+    def record_request(scope=static_scope) -> None:
+        route = middleware.resolve_route(scope)
+        in_flight = http_requests_in_flight.labels(route)
+        in_flight.inc()
+        in_flight.dec()
+        http_request_duration.labels("POST", route).observe(0.012)
+        http_requests.labels("POST", route, "200").inc()
+
+    print(f"반복 수: {n:,}")
+    print("[요청당 기록 비용]")
+    bench("resolve_route (static)", lambda: middleware.resolve_route(static_scope), n)
+    bench("resolve_route (param)", lambda: middleware.resolve_route(param_scope), n)
+    bench("histogram observe", lambda: http_request_duration.labels("POST", "/api/search").observe(0.012), n)
+    bench("full request record", record_request, n)
+
+    print("[수집 비용]")
+    bench("render /metrics", metrics_registry.render, max(1, n // 1000))
+
+if __name__ == "__main__":
+    main()
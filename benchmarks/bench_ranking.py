@@ -0,0 +1,50 @@
+"""
+키워드 순위 벤치마크
+
+기존 포맷터 방식(전체 정렬 후 상위 5개 + 고득점 개수를 따로 세는 목록 순회)과
+rank_top_k의 힙 기반 단일 순회를 비교하고, 동점이 많은 입력에서 결과가 같은지 확인합니다.
+
+실행: python benchmarks/bench_ranking.py [키워드 수]
+"""
+import random
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.ranking import rank_top_k
+
+def baseline_rank(keywords, k: int = 5):
+    """비교 기준: 기존 iter_analysis_text의 상위 키워드 선별과 고득점 집계"""
+    top_keywords = sorted(keywords, key=lambda x: x.get('score', 0), reverse=True)[:k]
+    high_score_count = sum(1 for kw in keywords if kw.get('score', 0) >= 80)
+    return top_keywords, high_score_count
+
+def heap_rank(keywords, k: int = 5):
+    result = rank_top_k(keywords, k=k, thresholds=(80,))
+    return result.top, result.count_at_least(80)
+
+def timed(label: str, fn, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {label:<12} {best * 1e3:8.2f}ms")
+    return result
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(0)
+    keywords = [{"keyword": f"키워드 {i}", "score": rng.randint(0, 100)} for i in range(n)]
+
+    for label, data in (("무작위", keywords), ("오름차순", sorted(keywords, key=lambda x: x["score"]))):
+        print(f"{label} 점수, 키워드 {n:,}개 (최소 시간)")
+        expected_top, expected_count = timed("baseline", lambda: baseline_rank(data))
+        top, count = timed("rank_top_k", lambda: heap_rank(data))
+        assert [id(kw) for kw in top] == [id(kw) for kw in expected_top], "상위 키워드가 기존 방식과 다릅니다."
+        assert count == expected_count, "고득점 개수가 기존 방식과 다릅니다."
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+점수화 프로필 처리량 벤치마크
+
+100만 개의 합성 키워드에 대해 프로필별로 단건 루프와 일괄(열 단위) 계산의 처리량을 비교합니다.
+
+실행: python benchmarks/bench_scoring.py [키워드 수]
+"""
+import random
+import sys
+import os
+import time
+from array import array
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib import scoring
+from lib.scoring import ScoringProfile, register_profile, get_profile
+
+PROFILES = [
+    ScoringProfile(name="volume_heavy", volume_baseline=20000, volume_max_points=70,
+                   competition_max_points=30),
+    ScoringProfile(name="niche", volume_baseline=2000, volume_max_points=30,
+                   competition_max_points=70, high_threshold=75, mid_threshold=45),
+]
+
+def make_columns(n: int):
+    rng = random.Random(0)
+    searches = array("q", (rng.randint(0, 60000) for _ in range(n)))
+    rates = array("d", (round(rng.random(), 2) for _ in range(n)))
+    return searches, rates
+
+def bench(label: str, fn, n: int) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<10} {elapsed:8.3f}s  {n / elapsed / 1e6:8.2f}M keywords/s")
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    searches, rates = make_columns(n)
+    for profile in PROFILES:
+        register_profile(profile)
+
+    print(f"키워드 수: {n:,}, NumPy: {'사용' if scoring.np is not None else '미설치'}")
+    for name in ["default"] + [p.name for p in PROFILES]:
+        profile = get_profile(name)
+        print(f"[{name}]")
+
+        def scalar_loop():
+            score, label = profile.score, profile.label
+            for m, c in zip(searches, rates):
+                label(score(m, c))
+
+        bench("scalar", scalar_loop, n)
+        if scoring.np is not None:
+            np_searches = scoring.np.frombuffer(searches, dtype=scoring.np.int64)
+            np_rates = scoring.np.frombuffer(rates, dtype=scoring.np.float64)
+            bench("bulk", lambda: profile.score_and_label_many(np_searches, np_rates), n)
+        else:
+            bench("bulk", lambda: profile.score_and_label_many(searches, rates), n)
+
+if __name__ == "__main__":
+    main()
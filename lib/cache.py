@@ -0,0 +1,363 @@
+"""
+결과 캐시 모듈
+
+검색 결과 등을 저장하는 캐시 서브시스템입니다.
+프로세스 내 TTL+LRU 캐시와 여러 워커가 공유하는 SQLite 파일 캐시를 제공하며,
+두 계층을 묶는 TieredCache를 통해 함께 사용할 수 있습니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+def normalize_key(keyword: str) -> str:
+    """
+    캐시 키를 정규화합니다.
+
+    유니코드 NFC 정규화 후 앞뒤 공백을 제거하고, 연속 공백을 하나로 합치며, 소문자로 변환합니다.
+    따라서 "AI 마케팅"과 " ai  마케팅 "은 같은 키가 됩니다.
+
+    Args:
+        keyword: 원본 키워드
+
+    Returns:
+        str: 정규화된 캐시 키
+    """
+    return " ".join(unicodedata.normalize("NFC", keyword).split()).lower()
+
+def estimate_size(value: Any) -> int:
+    """
+    값의 크기(바이트)를 JSON 직렬화 길이로 추정합니다.
+
+    Args:
+        value: 크기를 추정할 값
+
+    Returns:
+        int: 추정 바이트 수
+    """
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+@dataclass
+class CacheStats:
+    """캐시 히트/미스/퇴출 카운터"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """전체 조회 대비 히트 비율 (조회가 없으면 0.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """카운터를 사전 형태로 반환"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": round(self.hit_ratio, 4)
+        }
+
+@dataclass
+class CacheEntry:
+    """캐시 항목 (값과 저장/만료 시각)"""
+    value: Any
+    stored_at: float
+    expires_at: Optional[float]
+    size: int = 0
+
+    def is_expired(self, now: float) -> bool:
+        """만료 여부 확인"""
+        return self.expires_at is not None and now >= self.expires_at
+
+    def age(self, now: float) -> float:
+        """저장 후 경과 시간(초)"""
+        return max(0.0, now - self.stored_at)
+
+class CacheBackend(ABC):
+    """
+    캐시 백엔드 인터페이스
+
+    하위 클래스는 get_entry, set, delete, clear, __len__을 구현해야 합니다.
+    키는 호출 측에서 normalize_key로 정규화한 값을 사용합니다.
+    """
+
+    def __init__(self, default_ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.time):
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """만료되지 않은 캐시 항목을 반환 (없으면 None)"""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """값을 저장 (ttl이 None이면 default_ttl 사용, 둘 다 None이면 만료 없음)"""
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """항목 삭제"""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """모든 항목 삭제"""
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """값만 반환하는 편의 메서드"""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None else default
+
+    def _expires_at(self, now: float, ttl: Optional[float]) -> Optional[float]:
+        ttl = self.default_ttl if ttl is None else ttl
+        return now + ttl if ttl is not None else None
+
+class MemoryCache(CacheBackend):
+    """
+    프로세스 내 TTL+LRU 캐시
+
+    max_entries 또는 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 퇴출합니다.
+    모든 연산은 락으로 보호되므로 여러 스레드에서 안전하게 사용할 수 있습니다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None,
+                 default_ttl: Optional[float] = None, clock: Callable[[], float] = time.time,
+                 sizeof: Callable[[Any], int] = estimate_size):
+        super().__init__(default_ttl=default_ttl, clock=clock)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.total_bytes = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry.is_expired(self.clock()):
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.set_entry(key, value, ttl=ttl)
+
+    def set_entry(self, key: str, value: Any, ttl: Optional[float] = None,
+                  stored_at: Optional[float] = None, expires_at: Optional[float] = None) -> None:
+        """
+        저장/만료 시각을 지정하여 값을 저장합니다.
+
+        상위 계층에서 가져온 항목을 원래 시각 그대로 승격할 때 사용합니다.
+        """
+        now = self.clock()
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            # 단일 항목이 전체 한도를 넘으면 저장하지 않음
+            return
+        entry = CacheEntry(
+            value=value,
+            stored_at=now if stored_at is None else stored_at,
+            expires_at=self._expires_at(now, ttl) if expires_at is None else expires_at,
+            size=size
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.total_bytes += size
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries) or
+            (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self.total_bytes -= entry.size
+            self.stats.evictions += 1
+
+class SQLiteCache(CacheBackend):
+    """
+    SQLite 파일 기반 공유 캐시
+
+    같은 파일을 여는 여러 워커 프로세스가 캐시를 공유할 수 있습니다.
+    값은 JSON으로 저장되며 max_entries를 넘으면 마지막 접근 시각이 가장 오래된 항목부터 퇴출합니다.
+    """
+
+    def __init__(self, path: str, max_entries: Optional[int] = 10000,
+                 default_ttl: Optional[float] = None, clock: Callable[[], float] = time.time):
+        super().__init__(default_ttl=default_ttl, clock=clock)
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL, "
+            "expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache(accessed_at)")
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        now = self.clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            value, stored_at, expires_at = row
+            if expires_at is not None and now >= expires_at:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self.stats.hits += 1
+        return CacheEntry(value=json.loads(value), stored_at=stored_at,
+                          expires_at=expires_at, size=len(value))
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        now = self.clock()
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, stored_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, now, self._expires_at(now, ttl), now)
+            )
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        if self.max_entries is None:
+            return
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN "
+                "(SELECT key FROM cache ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,)
+            )
+            self.stats.evictions += overflow
+
+class TieredCache(CacheBackend):
+    """
+    2계층 캐시 (프로세스 내 캐시 + 공유 캐시)
+
+    조회 시 로컬 계층을 먼저 확인하고, 없으면 공유 계층에서 가져와 로컬에 승격합니다.
+    저장은 두 계층 모두에 기록합니다.
+    """
+
+    def __init__(self, local: MemoryCache, shared: CacheBackend):
+        super().__init__(default_ttl=local.default_ttl, clock=local.clock)
+        self.local = local
+        self.shared = shared
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self.local.get_entry(key)
+        if entry is None:
+            entry = self.shared.get_entry(key)
+            if entry is not None:
+                self.local.set_entry(key, entry.value, stored_at=entry.stored_at,
+                                     expires_at=entry.expires_at)
+        if entry is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return entry
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self.local.set(key, value, ttl=ttl)
+        self.shared.set(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        self.local.delete(key)
+        self.shared.delete(key)
+
+    def clear(self) -> None:
+        self.local.clear()
+        self.shared.clear()
+
+    def __len__(self) -> int:
+        return len(self.shared)
+
+def create_cache(max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None,
+                 default_ttl: Optional[float] = None,
+                 shared_path: Optional[str] = None) -> CacheBackend:
+    """
+    설정값으로 캐시 백엔드를 생성합니다.
+
+    Args:
+        max_entries: 프로세스 내 캐시의 최대 항목 수
+        max_bytes: 프로세스 내 캐시의 최대 바이트 수
+        default_ttl: 기본 TTL(초)
+        shared_path: (선택) 공유 캐시로 사용할 SQLite 파일 경로
+
+    Returns:
+        CacheBackend: shared_path가 있으면 TieredCache, 없으면 MemoryCache
+    """
+    local = MemoryCache(max_entries=max_entries, max_bytes=max_bytes, default_ttl=default_ttl)
+    if not shared_path:
+        return local
+    return TieredCache(local, SQLiteCache(shared_path, default_ttl=default_ttl))
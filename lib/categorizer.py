@@ -0,0 +1,328 @@
+"""
+키워드 카테고리 분류 엔진
+
+카테고리별 용어 표를 한 번만 Aho-Corasick 오토마톤으로 컴파일해 두고, 키워드를 한 번 훑으면서
+포함된 모든 용어를 찾아 가장 앞선 카테고리를 고릅니다. 기존의 '카테고리 순서대로 용어 포함 여부를
+검사해 처음 맞는 카테고리' 규칙과 같은 결과를 내면서, 키워드 하나의 비용이 카테고리/용어 수와
+무관하게 키워드 길이에 비례합니다.
+
+분류 표는 JSON 파일(CATEGORY_TAXONOMY_PATH)에서 읽어 시작 시 오토마톤으로 만들어 두며,
+TaxonomyIndex가 파일 변경을 주기적으로 확인해 백그라운드 스레드에서 새 오토마톤을 만든 뒤
+참조 하나를 바꿔 끼웁니다. 읽는 쪽은 락 없이 현재 오토마톤을 사용합니다.
+"""
+import os
+import json
+import time
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+DEFAULT_CATEGORY = "일반"
+
+# 분류 표 파일 설정
+CATEGORY_TAXONOMY_PATH = os.getenv(
+    "CATEGORY_TAXONOMY_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy", "ko.json")
+)  # 로케일별 분류 표 JSON 파일
+CATEGORY_TAXONOMY_RELOAD_INTERVAL = float(os.getenv("CATEGORY_TAXONOMY_RELOAD_INTERVAL", "30"))  # 파일 변경 확인 주기(초), 0이면 자동 재적재 안 함
+
+# 파일을 읽을 수 없을 때 사용하는 기본 분류 표 (앞에 있는 카테고리가 우선)
+DEFAULT_CATEGORY_TERMS: Dict[str, List[str]] = {
+    '디지털 마케팅': ['마케팅', 'seo', '광고', '콘텐츠', '퍼포먼스', '인플루언서', '바이럴', '브랜딩'],
+    'AI 기술': ['ai', '인공지능', '머신러닝', 'gpt', '딥러닝', '자연어', '신경망', '강화학습'],
+    '앱 개발': ['개발', '프로그래밍', '앱', 'app', '코딩', '소프트웨어', '웹', '모바일'],
+    '3D 모델링/AI': ['3d', '모델링', '블렌더', 'blender', '렌더링', '애니메이션', 'cg', '그래픽']
+}
+
+class CategoryMatcher:
+    """
+    카테고리 표로 만든 Aho-Corasick 오토마톤
+
+    각 상태에는 그 상태에서 끝나는 용어(실패 링크로 이어지는 접미사 포함) 중 가장 앞선 카테고리의
+    순위를 미리 계산해 두며, 전이 표는 실패 링크를 펼쳐 루트 전이를 제외하고 미리 합쳐 두어
+    문자 하나당 사전 조회 한두 번으로 진행합니다.
+
+    Args:
+        category_terms: 카테고리 이름 -> 용어 목록 (순서가 우선순위)
+        default: 어떤 용어도 포함하지 않을 때의 카테고리
+
+    Raises:
+        ValueError: 빈 용어가 있는 경우
+    """
+
+    def __init__(self, category_terms: Mapping[str, Sequence[str]], default: str = DEFAULT_CATEGORY):
+        self.categories: List[str] = list(category_terms)
+        self.default = default
+        # 순위 -> 카테고리 이름 (마지막 칸은 기본 카테고리)
+        self._names = self.categories + [default]
+        self.term_count = 0
+
+        no_match = len(self.categories)
+        goto: List[Dict[str, int]] = [{}]
+        best: List[int] = [no_match]
+        for rank, terms in enumerate(category_terms.values()):
+            for term in terms:
+                term = term.lower().strip()
+                if not term:
+                    raise ValueError(f"빈 용어는 사용할 수 없습니다: 카테고리 '{self.categories[rank]}'")
+                state = 0
+                for ch in term:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto.append({})
+                        best.append(no_match)
+                        goto[state][ch] = nxt
+                    state = nxt
+                if rank < best[state]:
+                    best[state] = rank
+                self.term_count += 1
+
+        # 너비 우선으로 실패 링크를 계산하며 접미사 용어의 순위와 전이 표를 합침
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [{} for _ in goto]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            if fail[state]:
+                delta[state].update(delta[fail[state]])
+            delta[state].update(goto[state])
+            for ch, child in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                if best[fail[child]] < best[child]:
+                    best[child] = best[fail[child]]
+                queue.append(child)
+
+        self._root = goto[0]
+        self._delta = delta
+        self._best = best
+        self.state_count = len(goto)
+
+    def categorize(self, keyword: str) -> str:
+        """
+        키워드 하나를 분류합니다.
+
+        Args:
+            keyword: 분류할 키워드
+
+        Returns:
+            str: 포함된 용어 중 가장 앞선 카테고리, 없으면 기본 카테고리
+        """
+        return self._names[self._rank(keyword.lower())]
+
+    def categorize_many(self, keywords: Iterable[str]) -> List[str]:
+        """
+        여러 키워드를 한 번에 분류합니다. (결과는 categorize를 각각 호출한 것과 같음)
+
+        Args:
+            keywords: 분류할 키워드들
+
+        Returns:
+            List[str]: 입력 순서대로의 카테고리
+        """
+        names = self._names
+        delta = self._delta
+        root = self._root
+        best_of = self._best
+        no_match = len(self.categories)
+        result = []
+        append = result.append
+        for keyword in keywords:
+            state = 0
+            best = no_match
+            for ch in keyword.lower():
+                state = delta[state].get(ch) or root.get(ch, 0)
+                rank = best_of[state]
+                if rank < best:
+                    best = rank
+                    if not rank:
+                        break
+            append(names[best])
+        return result
+
+    def _rank(self, text: str) -> int:
+        delta = self._delta
+        root = self._root
+        best_of = self._best
+        state = 0
+        best = len(self.categories)
+        for ch in text:
+            state = delta[state].get(ch) or root.get(ch, 0)
+            rank = best_of[state]
+            if rank < best:
+                best = rank
+                if not rank:
+                    break
+        return best
+
+def load_taxonomy(path: str) -> Tuple[Dict[str, List[str]], str]:
+    """
+    분류 표 JSON 파일을 읽습니다.
+
+    형식: {"locale": "ko", "default": "일반", "categories": [{"name": "...", "terms": ["..."]}, ...]}
+    categories의 순서가 우선순위이며, 같은 이름이 여러 번 나오면 용어를 합칩니다.
+
+    Args:
+        path: 분류 표 파일 경로
+
+    Returns:
+        Tuple[Dict[str, List[str]], str]: (카테고리 -> 용어 목록, 기본 카테고리)
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        ValueError: JSON 형식이나 구조가 잘못된 경우
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get("categories"), list):
+        raise ValueError(f"분류 표에 categories 목록이 없습니다: {path}")
+
+    category_terms: Dict[str, List[str]] = {}
+    for item in data["categories"]:
+        name = item.get("name") if isinstance(item, dict) else None
+        terms = item.get("terms") if isinstance(item, dict) else None
+        if not isinstance(name, str) or not name or not isinstance(terms, list):
+            raise ValueError(f"잘못된 카테고리 항목: {item!r}")
+        if not all(isinstance(term, str) for term in terms):
+            raise ValueError(f"카테고리 '{name}'의 용어는 문자열이어야 합니다.")
+        category_terms.setdefault(name, []).extend(terms)
+    default = data.get("default")
+    if default is not None and not isinstance(default, str):
+        raise ValueError(f"기본 카테고리는 문자열이어야 합니다: {default!r}")
+    return category_terms, default or DEFAULT_CATEGORY
+
+class TaxonomyIndex:
+    """
+    분류 표 파일에서 만든 분류 엔진을 보관하고 파일이 바뀌면 교체하는 인덱스
+
+    matcher 속성 읽기는 락이 없으며, 재적재는 새 CategoryMatcher를 완성한 뒤 (버전, 분류 엔진)
+    참조를 한 번에 바꾸므로 읽는 쪽은 항상 이전 또는 새 오토마톤 중 하나를 온전히 사용합니다.
+    분류 결과를 캐시하는 쪽은 snapshot()으로 둘을 함께 읽어 결과에 버전을 붙여 둡니다.
+
+    Args:
+        path: 분류 표 파일 경로
+        reload_interval: maybe_reload가 파일 변경을 확인하는 최소 간격(초), 0이면 확인 안 함
+        clock: 단조 시계 (테스트용)
+    """
+
+    def __init__(self, path: str = CATEGORY_TAXONOMY_PATH,
+                 reload_interval: float = CATEGORY_TAXONOMY_RELOAD_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic):
+        self.path = path
+        self.reload_interval = reload_interval
+        self.clock = clock
+        self.load_ms = 0.0
+        self.errors = 0
+        self.source = "builtin"
+        self._current: Tuple[int, CategoryMatcher] = (0, CategoryMatcher(DEFAULT_CATEGORY_TERMS))
+        self._signature: Optional[Tuple[float, int]] = None
+        self._next_check = 0.0
+        self._reload_lock = threading.Lock()
+        self._listeners: List[Callable[[], None]] = []
+        self.reload(force=True)
+
+    @property
+    def matcher(self) -> CategoryMatcher:
+        """현재 분류 엔진"""
+        return self._current[1]
+
+    @property
+    def version(self) -> int:
+        """분류 엔진을 교체한 횟수 (내장 분류 표는 0)"""
+        return self._current[0]
+
+    def snapshot(self) -> Tuple[int, CategoryMatcher]:
+        """현재 (버전, 분류 엔진)을 한 번에 반환"""
+        return self._current
+
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """분류 엔진이 교체된 뒤 호출할 함수를 등록 (예: 분류 결과 캐시 무효화)"""
+        self._listeners.append(callback)
+
+    def _file_signature(self) -> Optional[Tuple[float, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime, stat.st_size)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        파일이 바뀌었으면 분류 표를 다시 읽어 분류 엔진을 교체합니다.
+
+        읽기나 컴파일에 실패하면 기존 분류 엔진을 그대로 유지합니다.
+
+        Args:
+            force: 변경 여부와 관계없이 다시 읽을지 여부
+
+        Returns:
+            bool: 분류 엔진을 교체했는지 여부
+        """
+        with self._reload_lock:
+            signature = self._file_signature()
+            if signature is None:
+                if force:
+                    print(f"[categorizer] 분류 표 파일이 없어 기본 분류 표 사용: {self.path}")
+                return False
+            if not force and signature == self._signature:
+                return False
+
+            start = time.perf_counter()
+            try:
+                category_terms, default = load_taxonomy(self.path)
+                matcher = CategoryMatcher(category_terms, default)
+            except (OSError, ValueError) as e:
+                self.errors += 1
+                self._signature = signature  # 같은 잘못된 파일을 반복해서 읽지 않음
+                print(f"[categorizer] 분류 표 적재 오류, 기존 분류 표 유지: {str(e)}")
+                return False
+
+            self._current = (self.version + 1, matcher)
+            self._signature = signature
+            self.load_ms = (time.perf_counter() - start) * 1000
+            self.source = self.path
+            print(f"[categorizer] 분류 표 적재: 카테고리 {len(matcher.categories)}개, "
+                  f"용어 {matcher.term_count}개, {self.load_ms:.1f}ms (version={self.version})")
+
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except Exception as e:
+                print(f"[categorizer] 분류 표 교체 알림 오류: {str(e)}")
+        return True
+
+    def maybe_reload(self) -> None:
+        """
+        확인 주기가 지났고 파일이 바뀌었으면 백그라운드 스레드에서 재적재를 시작합니다.
+        호출한 스레드는 기다리지 않고 현재 분류 엔진을 계속 사용합니다.
+        """
+        if not self.reload_interval:
+            return
+        now = self.clock()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.reload_interval
+        signature = self._file_signature()
+        if signature is None or signature == self._signature or self._reload_lock.locked():
+            return
+        threading.Thread(target=self.reload, name="taxonomy-reload", daemon=True).start()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        현재 분류 표 정보를 반환합니다.
+
+        Returns:
+            Dict: 출처, 버전, 카테고리/용어/상태 수, 마지막 적재 시간, 오류 수
+        """
+        matcher = self.matcher
+        return {
+            "source": self.source,
+            "version": self.version,
+            "categories": len(matcher.categories),
+            "terms": matcher.term_count,
+            "states": matcher.state_count,
+            "load_ms": round(self.load_ms, 2),
+            "errors": self.errors
+        }
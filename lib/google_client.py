@@ -5,15 +5,36 @@ gspread를 활용한 Google Sheets 연결, 인증, 데이터 저장 기능을 
 """
 import os
 import json
+import time
 import base64
-from typing import List, Dict, Any, Optional
+import threading
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Callable, Tuple
 import gspread
+import httplib2
 from oauth2client.service_account import ServiceAccountCredentials
 
-def get_google_credentials():
+from lib.tracing import traced, span
+
+# 클라이언트 관리자 설정
+SHEETS_HANDLE_TTL = float(os.getenv('SHEETS_HANDLE_TTL', '300'))  # 스프레드시트/워크시트 핸들 유지 시간(초)
+GOOGLE_TOKEN_REFRESH_MARGIN = float(os.getenv('GOOGLE_TOKEN_REFRESH_MARGIN', '300'))  # 만료 몇 초 전에 토큰을 갱신할지
+
+# 스프레드시트 레지스트리 설정
+SHEETS_REGISTRY_PATH = os.getenv('SHEETS_REGISTRY_PATH', os.path.join('data', 'sheets_registry.json'))
+SHEETS_PARTITION = os.getenv('SHEETS_PARTITION', 'month')  # day, month, none
+SHEETS_TENANT = os.getenv('SHEETS_TENANT', 'default')
+
+SPREADSHEET_TITLE = 'KeywordPulse 분석 결과'
+_PARTITION_FORMATS = {'day': '%Y-%m-%d', 'month': '%Y-%m', 'none': None}
+
+def get_google_credentials(service_account_json: Optional[str] = None):
     """
     Google API 인증 정보를 환경변수에서 가져와 생성합니다.
     
+    Args:
+        service_account_json: (선택) Base64로 인코딩된 서비스 계정 JSON. 없으면 환경변수 사용
+    
     Returns:
         ServiceAccountCredentials: Google API 인증 정보
     
@@ -21,7 +42,8 @@ def get_google_credentials():
         ValueError: 환경변수가 설정되지 않은 경우
     """
     # 환경변수에서 Base64로 인코딩된 서비스 계정 JSON 가져오기
-    service_account_json = os.getenv('GOOGLE_SERVICE_ACCOUNT')
+    if service_account_json is None:
+        service_account_json = os.getenv('GOOGLE_SERVICE_ACCOUNT')
     
     if not service_account_json:
         print("[google_client] 경고: GOOGLE_SERVICE_ACCOUNT 환경변수가 설정되지 않았습니다. 테스트 모드로 전환합니다.")
@@ -42,27 +64,490 @@ def get_google_credentials():
     
     return ServiceAccountCredentials.from_json_keyfile_dict(credentials_dict, scope)
 
+# 결과 시트 헤더
+SHEET_HEADERS = ['키워드', '검색량', '경쟁률', '점수', '추천도', '날짜']
+
+def _column_letter(index: int) -> str:
+    """1부터 시작하는 열 번호를 A1 표기의 열 문자로 변환합니다."""
+    letters = ''
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+class _Flight:
+    """진행 중인 조회 하나의 결과를 기다리는 스레드들이 공유하는 상태"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+def _single_flight(lock, flights: Dict[Tuple, _Flight], key: Tuple, fetch: Callable[[], Any]):
+    """
+    같은 키의 동시 호출 중 한 스레드만 fetch를 실행하고 나머지는 그 결과(예외 포함)를 받습니다.
+    
+    lock은 flights 사전을 읽고 바꾸는 동안만 잡으며, fetch는 락 밖에서 실행됩니다.
+    """
+    with lock:
+        flight = flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = flights[key] = _Flight()
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+    try:
+        flight.result = fetch()
+        return flight.result
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with lock:
+            flights.pop(key, None)
+        flight.done.set()
+
+class SheetClientManager:
+    """
+    프로세스 전역 Google Sheets 클라이언트 관리자
+    
+    서비스 계정 JSON은 값이 바뀔 때만 다시 디코딩하고, 액세스 토큰은 만료가 가까워졌을 때만
+    갱신합니다. 스프레드시트/워크시트 핸들은 ID별로 TTL 동안 캐싱하여 반복 동기화 시
+    인증과 메타데이터 조회 왕복을 생략합니다.
+    
+    락은 캐시를 읽고 바꿔 끼우는 동안만 잡고, 인증/토큰 갱신/핸들 조회 같은 네트워크 호출은
+    락 밖에서 수행합니다. 같은 키를 동시에 조회하면 한 스레드만 호출하고 나머지는 결과를 기다립니다.
+    """
+    
+    def __init__(self, handle_ttl: Optional[float] = None, refresh_margin: Optional[float] = None,
+                 credentials_factory: Callable[[str], Any] = None,
+                 authorize: Callable[[Any], Any] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            handle_ttl: 핸들 캐시 유지 시간(초)
+            refresh_margin: 토큰 만료 몇 초 전부터 갱신할지
+            credentials_factory: 서비스 계정 JSON(Base64)으로 인증 정보를 만드는 함수
+            authorize: 인증 정보로 gspread 클라이언트를 만드는 함수
+            clock: 현재 시각(epoch 초)을 반환하는 함수
+        """
+        self.handle_ttl = SHEETS_HANDLE_TTL if handle_ttl is None else handle_ttl
+        self.refresh_margin = GOOGLE_TOKEN_REFRESH_MARGIN if refresh_margin is None else refresh_margin
+        self._credentials_factory = credentials_factory or get_google_credentials
+        self._authorize = authorize or gspread.authorize
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._raw_credentials: Optional[str] = None
+        self._credentials = None
+        self._client = None
+        self._handles: Dict[Tuple, Tuple[Any, float]] = {}
+        self._flights: Dict[Tuple, _Flight] = {}
+        # 클라이언트가 바뀔 때마다 증가 (이전 세션으로 조회한 핸들을 캐시에 넣지 않기 위함)
+        self._generation = 0
+        self.stats = {"authorizations": 0, "refreshes": 0, "handle_hits": 0, "handle_misses": 0}
+    
+    def get_client(self):
+        """
+        인증된 gspread 클라이언트를 반환합니다. 필요할 때만 인증/토큰 갱신을 수행합니다.
+        
+        Returns:
+            gspread.Client: 인증된 gspread 클라이언트 또는 None (테스트 모드)
+        
+        Raises:
+            ValueError: 서비스 계정 JSON 디코딩에 실패한 경우
+        """
+        raw = os.getenv('GOOGLE_SERVICE_ACCOUNT') or ''
+        with self._lock:
+            if raw == self._raw_credentials and (self._client is None or not self._token_expiring()):
+                # 인증 정보가 바뀌지 않았으면 기존 클라이언트 재사용 (테스트 모드 포함)
+                return self._client
+        return self._single_flight(('client', raw), lambda: self._connect(raw))
+    
+    def _connect(self, raw: str):
+        """인증 또는 토큰 갱신 후 새 클라이언트로 교체합니다. (네트워크 호출은 락 밖에서 수행)"""
+        with self._lock:
+            if raw == self._raw_credentials:
+                if self._client is None or not self._token_expiring():
+                    # 앞선 조회가 이미 갱신함
+                    return self._client
+                credentials = self._credentials
+                refresh = True
+            else:
+                credentials = None
+                refresh = False
+        
+        if refresh:
+            print("[google_client] 액세스 토큰 만료 임박: 토큰 갱신")
+            credentials.refresh(httplib2.Http())
+        else:
+            credentials = self._credentials_factory(raw)
+        client = self._authorize(credentials) if credentials is not None else None
+        
+        with self._lock:
+            # 기존 핸들은 이전 세션을 참조하므로 폐기
+            self._reset_locked()
+            self._credentials = credentials
+            self._client = client
+            self._raw_credentials = raw
+            if refresh:
+                self.stats["refreshes"] += 1
+            elif client is not None:
+                self.stats["authorizations"] += 1
+            return client
+    
+    def _single_flight(self, key: Tuple, fetch: Callable[[], Any]):
+        return _single_flight(self._lock, self._flights, key, fetch)
+    
+    def _cached(self, key: Tuple, fetch: Callable[[], Any]):
+        """핸들 캐시에 없을 때만 락 밖에서 fetch로 조회해 TTL 동안 캐싱합니다."""
+        with self._lock:
+            handle = self._get_handle(key)
+        if handle is not None:
+            return handle
+        
+        def load():
+            with self._lock:
+                entry = self._handles.get(key)
+                if entry is not None and self._clock() < entry[1]:
+                    # 앞선 조회가 방금 캐싱함
+                    return entry[0]
+                generation = self._generation
+            handle = fetch()
+            with self._lock:
+                if generation == self._generation:
+                    self._put_handle(key, handle)
+            return handle
+        
+        return self._single_flight(key, load)
+    
+    def _token_expiring(self) -> bool:
+        """액세스 토큰이 갱신 여유 시간 안에 만료되는지 확인합니다."""
+        expiry = getattr(self._credentials, 'token_expiry', None)
+        if expiry is None:
+            # 아직 토큰을 발급받지 않았으면 첫 요청 시 라이브러리가 발급함
+            return False
+        now = datetime.fromtimestamp(self._clock(), timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds() <= self.refresh_margin
+    
+    def _get_handle(self, key: Tuple):
+        entry = self._handles.get(key)
+        if entry is not None:
+            handle, expires_at = entry
+            if self._clock() < expires_at:
+                self.stats["handle_hits"] += 1
+                return handle
+            del self._handles[key]
+        self.stats["handle_misses"] += 1
+        return None
+    
+    def _put_handle(self, key: Tuple, handle) -> None:
+        self._handles[key] = (handle, self._clock() + self.handle_ttl)
+    
+    def open_spreadsheet(self, spreadsheet_id: str):
+        """
+        스프레드시트 핸들을 반환합니다. 캐시에 없을 때만 API를 호출합니다.
+        
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+        
+        Returns:
+            gspread.Spreadsheet: 스프레드시트 핸들
+        
+        Raises:
+            gspread.exceptions.SpreadsheetNotFound: 스프레드시트가 없는 경우
+        """
+        client = self.get_client()
+        return self._cached(('spreadsheet', spreadsheet_id), lambda: client.open_by_key(spreadsheet_id))
+    
+    def create_spreadsheet(self, title: str):
+        """
+        새 스프레드시트를 만들고 핸들을 캐시에 등록합니다.
+        
+        Args:
+            title: 스프레드시트 제목
+        
+        Returns:
+            gspread.Spreadsheet: 생성된 스프레드시트 핸들
+        """
+        client = self.get_client()
+        spreadsheet = client.create(title)
+        with self._lock:
+            self._put_handle(('spreadsheet', spreadsheet.id), spreadsheet)
+        return spreadsheet
+    
+    def get_worksheet(self, spreadsheet, title: str, rows: int = 1000, cols: int = 20):
+        """
+        워크시트 핸들을 반환합니다. 없으면 새로 만듭니다.
+        
+        Args:
+            spreadsheet: 스프레드시트 핸들
+            title: 워크시트 제목
+            rows: 새로 만들 때의 행 수
+            cols: 새로 만들 때의 열 수
+        
+        Returns:
+            gspread.Worksheet: 워크시트 핸들
+        """
+        def fetch():
+            try:
+                return spreadsheet.worksheet(title)
+            except gspread.exceptions.WorksheetNotFound:
+                return spreadsheet.add_worksheet(title=title, rows=rows, cols=cols)
+        
+        return self._cached(('worksheet', spreadsheet.id, title), fetch)
+    
+    def ensure_header(self, spreadsheet, worksheet, headers: List[str]) -> None:
+        """
+        워크시트 첫 행에 헤더가 없을 때만 헤더를 기록합니다.
+        
+        확인 결과는 핸들과 같은 TTL로 캐싱되어, 반복 동기화 시에는 첫 행 조회도 생략합니다.
+        
+        Args:
+            spreadsheet: 스프레드시트 핸들
+            worksheet: 워크시트 핸들
+            headers: 헤더 값 리스트
+        """
+        def fetch():
+            # 시트 전체가 아니라 첫 행만 조회
+            if worksheet.row_values(1) != headers:
+                worksheet.update(f'A1:{_column_letter(len(headers))}1', [headers])
+            return True
+        
+        self._cached(('header', spreadsheet.id, worksheet.title), fetch)
+    
+    def invalidate(self, spreadsheet_id: Optional[str] = None) -> None:
+        """
+        캐시된 핸들을 무효화합니다.
+        
+        Args:
+            spreadsheet_id: (선택) 해당 스프레드시트의 핸들만 무효화. 없으면 전체 무효화
+        """
+        with self._lock:
+            self._generation += 1
+            if spreadsheet_id is None:
+                self._handles.clear()
+                return
+            for key in [k for k in self._handles if k[1] == spreadsheet_id]:
+                del self._handles[key]
+    
+    def reset(self) -> None:
+        """인증 정보, 클라이언트, 핸들 캐시를 모두 초기화합니다."""
+        with self._lock:
+            self._reset_locked()
+            self._raw_credentials = None
+    
+    def _reset_locked(self) -> None:
+        self._credentials = None
+        self._client = None
+        self._handles.clear()
+        self._generation += 1
+
+# 프로세스 전역 클라이언트 관리자
+sheet_manager = SheetClientManager()
+
 def get_sheet_client():
     """
-    Google Sheets 클라이언트를 생성합니다.
+    공유 클라이언트 관리자에서 Google Sheets 클라이언트를 가져옵니다.
     
     Returns:
         gspread.Client: 인증된 gspread 클라이언트 또는 None (테스트 모드)
     """
-    credentials = get_google_credentials()
-    if credentials is None:
-        return None
-    return gspread.authorize(credentials)
+    return sheet_manager.get_client()
+
+class SpreadsheetRegistry:
+    """
+    파티션별 스프레드시트 레지스트리
+    
+    테넌트와 날짜 파티션(일/월)을 고정된 스프레드시트 ID에 대응시켜 로컬 JSON 파일에 저장합니다.
+    새 파티션으로 넘어갈 때만 스프레드시트를 만들고, 공유 설정은 스프레드시트마다 한 번만 적용합니다.
+    
+    락은 레지스트리 사전과 파일을 읽고 쓰는 동안만 잡고, 스프레드시트 조회/생성/공유 호출은
+    락 밖에서 키별로 한 스레드만 수행하므로 한 파티션의 생성이 다른 파티션의 동기화를 막지 않습니다.
+    """
+    
+    def __init__(self, path: str = SHEETS_REGISTRY_PATH, partition: str = SHEETS_PARTITION,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path: 레지스트리 JSON 파일 경로
+            partition: 파티션 단위 (day, month, none)
+            clock: 현재 시각(epoch 초)을 반환하는 함수
+        
+        Raises:
+            ValueError: 알 수 없는 파티션 단위인 경우
+        """
+        if partition not in _PARTITION_FORMATS:
+            raise ValueError(f"알 수 없는 파티션 단위: {partition} (day, month, none 중 하나)")
+        self.path = path
+        self.partition = partition
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._partitions: Dict[str, Dict[str, Any]] = {}
+        self._shared: set = set()
+        self._flights: Dict[Tuple, _Flight] = {}
+        self._load()
+    
+    def partition_key(self, tenant: Optional[str] = None, when: Optional[float] = None) -> str:
+        """
+        테넌트와 시각으로 파티션 키를 만듭니다.
+        
+        Args:
+            tenant: (선택) 테넌트 이름, 없으면 SHEETS_TENANT
+            when: (선택) 기준 시각(epoch 초), 없으면 현재 시각
+        
+        Returns:
+            str: '테넌트:기간' 형식의 파티션 키
+        """
+        fmt = _PARTITION_FORMATS[self.partition]
+        period = 'all'
+        if fmt:
+            moment = datetime.fromtimestamp(self._clock() if when is None else when, timezone.utc)
+            period = moment.strftime(fmt)
+        return f"{tenant or SHEETS_TENANT}:{period}"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """파티션 키에 등록된 스프레드시트 정보 반환"""
+        with self._lock:
+            entry = self._partitions.get(key)
+            return dict(entry) if entry else None
+    
+    def resolve(self, manager: "SheetClientManager", tenant: Optional[str] = None,
+                when: Optional[float] = None):
+        """
+        현재 파티션의 스프레드시트 핸들을 반환합니다. 등록되지 않았거나 삭제된 경우에만 새로 만듭니다.
+        
+        Args:
+            manager: 클라이언트 관리자
+            tenant: (선택) 테넌트 이름
+            when: (선택) 기준 시각(epoch 초)
+        
+        Returns:
+            gspread.Spreadsheet: 파티션의 스프레드시트 핸들
+        """
+        key = self.partition_key(tenant, when)
+        return _single_flight(self._lock, self._flights, ('partition', key),
+                              lambda: self._open_or_create(manager, key))
+    
+    def _open_or_create(self, manager: "SheetClientManager", key: str):
+        with self._lock:
+            entry = self._partitions.get(key)
+        if entry is not None:
+            try:
+                return manager.open_spreadsheet(entry['id'])
+            except gspread.exceptions.SpreadsheetNotFound:
+                print(f"[google_client] 등록된 스프레드시트를 찾을 수 없어 새로 생성: {key}")
+            except gspread.exceptions.APIError as e:
+                if e.code != 403:
+                    raise
+                # 서비스 계정이 만든 시트의 권한을 잃었으면 더 이상 쓸 수 없으므로 새로 생성
+                print(f"[google_client] 등록된 스프레드시트에 접근할 수 없어 새로 생성: {key}")
+        
+        title = SPREADSHEET_TITLE if self.partition == 'none' else f"{SPREADSHEET_TITLE} ({key.split(':', 1)[1]})"
+        spreadsheet = manager.create_spreadsheet(title)
+        with self._lock:
+            self._partitions[key] = {'id': spreadsheet.id, 'url': spreadsheet.url, 'createdAt': self._clock()}
+            self._save()
+        return spreadsheet
+    
+    def ensure_shared(self, spreadsheet) -> None:
+        """
+        스프레드시트에 읽기 공유 설정이 적용되지 않았을 때만 적용합니다.
+        
+        Args:
+            spreadsheet: 스프레드시트 핸들
+        """
+        with self._lock:
+            if spreadsheet.id in self._shared:
+                return
+        
+        def share():
+            with self._lock:
+                if spreadsheet.id in self._shared:
+                    # 앞선 호출이 이미 공유함
+                    return
+            spreadsheet.share(None, perm_type='anyone', role='reader')
+            with self._lock:
+                self._shared.add(spreadsheet.id)
+                self._save()
+        
+        _single_flight(self._lock, self._flights, ('share', spreadsheet.id), share)
+    
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._partitions = data.get('partitions', {})
+            self._shared = set(data.get('shared', []))
+        except (OSError, ValueError) as e:
+            print(f"[google_client] 레지스트리 파일 읽기 오류, 빈 레지스트리로 시작: {str(e)}")
+    
+    def _save(self) -> None:
+        """레지스트리 파일을 원자적으로 교체"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'partitions': self._partitions, 'shared': sorted(self._shared)},
+                      f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+# 프로세스 전역 스프레드시트 레지스트리
+sheet_registry = SpreadsheetRegistry()
+
+def keywords_to_rows(keywords: List[Dict[str, Any]], timestamp: str) -> List[List[Any]]:
+    """
+    키워드 정보를 시트 행 리스트로 변환합니다.
+    
+    Args:
+        keywords: 키워드 정보 리스트
+        timestamp: 분석 시간 (ISO 8601 형식)
+    
+    Returns:
+        List[List[Any]]: SHEET_HEADERS 순서의 행 리스트
+    """
+    return [
+        [
+            kw.get('keyword', ''),
+            kw.get('monthlySearches', 0),
+            kw.get('competitionRate', 0),
+            kw.get('score', 0),
+            kw.get('recommendation', ''),
+            timestamp
+        ]
+        for kw in keywords
+    ]
+
+def append_keyword_rows(worksheet, rows: List[List[Any]]) -> None:
+    """
+    Sheets append API로 표 끝에 행을 추가합니다.
+    
+    다음 빈 행을 찾기 위해 시트 전체를 내려받지 않으므로 비용은 추가하는 행 수에만 비례합니다.
+    
+    Args:
+        worksheet: 워크시트 핸들
+        rows: 추가할 행 리스트
+    """
+    if not rows:
+        return
+    worksheet.append_rows(rows, value_input_option='RAW', insert_data_option='INSERT_ROWS',
+                          table_range=f'A1:{_column_letter(len(SHEET_HEADERS))}1')
 
 def save_keywords_to_sheet(keywords: List[Dict[str, Any]], timestamp: str, 
-                          spreadsheet_id: Optional[str] = None) -> str:
+                          spreadsheet_id: Optional[str] = None, tenant: Optional[str] = None) -> str:
     """
     키워드 분석 결과를 Google Sheets에 저장합니다.
     
     Args:
         keywords: 키워드 정보 리스트
         timestamp: 분석 시간 (ISO 8601 형식)
-        spreadsheet_id: (선택) 기존 스프레드시트 ID
+        spreadsheet_id: (선택) 기존 스프레드시트 ID, 없으면 레지스트리의 현재 파티션 스프레드시트
+        tenant: (선택) 레지스트리 테넌트 이름
     
     Returns:
         str: 스프레드시트 URL
@@ -70,6 +555,26 @@ def save_keywords_to_sheet(keywords: List[Dict[str, Any]], timestamp: str,
     Raises:
         Exception: Sheets API 오류 발생 시
     """
+    return save_rows_to_sheet(keywords_to_rows(keywords, timestamp), spreadsheet_id, tenant)
+
+@traced("sheets.save")
+def save_rows_to_sheet(rows: List[List[Any]], spreadsheet_id: Optional[str] = None,
+                       tenant: Optional[str] = None) -> str:
+    """
+    SHEET_HEADERS 순서의 행들을 Google Sheets에 한 번의 append 호출로 저장합니다.
+    
+    Args:
+        rows: 저장할 행 리스트
+        spreadsheet_id: (선택) 기존 스프레드시트 ID, 없으면 레지스트리의 현재 파티션 스프레드시트
+        tenant: (선택) 레지스트리 테넌트 이름
+    
+    Returns:
+        str: 스프레드시트 URL
+    
+    Raises:
+        Exception: Sheets API 오류 발생 시
+    """
+    spreadsheet = None
     try:
         client = get_sheet_client()
         
@@ -79,48 +584,37 @@ def save_keywords_to_sheet(keywords: List[Dict[str, Any]], timestamp: str,
             # 테스트 환경에서는 가상 URL 반환
             return "https://docs.google.com/spreadsheets/d/test-sheet-id/edit#gid=0"
         
-        # 기존 스프레드시트 사용 또는 새로 생성
-        if spreadsheet_id:
-            try:
-                spreadsheet = client.open_by_key(spreadsheet_id)
-            except gspread.exceptions.SpreadsheetNotFound:
-                spreadsheet = client.create('KeywordPulse 분석 결과')
-        else:
-            spreadsheet = client.create('KeywordPulse 분석 결과')
+        # 지정한 스프레드시트 사용, 없으면 레지스트리에서 현재 파티션의 스프레드시트 사용
+        # (파티션이 바뀔 때만 새로 생성)
+        with span("sheets.open"):
+            if spreadsheet_id:
+                try:
+                    spreadsheet = sheet_manager.open_spreadsheet(spreadsheet_id)
+                except gspread.exceptions.SpreadsheetNotFound:
+                    spreadsheet = sheet_manager.create_spreadsheet(SPREADSHEET_TITLE)
+            else:
+                spreadsheet = sheet_registry.resolve(sheet_manager, tenant)
+            
+            # 워크시트 설정 (기존 또는 새로 생성)
+            worksheet = sheet_manager.get_worksheet(spreadsheet, 'Keywords', rows=1000, cols=20)
+            
+            # 헤더 설정 (없을 때만 한 번 기록)
+            sheet_manager.ensure_header(spreadsheet, worksheet, SHEET_HEADERS)
         
-        # 워크시트 설정 (기존 또는 새로 생성)
-        try:
-            worksheet = spreadsheet.worksheet('Keywords')
-        except gspread.exceptions.WorksheetNotFound:
-            worksheet = spreadsheet.add_worksheet(title='Keywords', rows=1000, cols=20)
-        
-        # 헤더 설정
-        headers = ['키워드', '검색량', '경쟁률', '점수', '추천도', '날짜']
-        worksheet.update('A1:F1', [headers])
-        
-        # 데이터 준비
-        rows = []
-        for kw in keywords:
-            rows.append([
-                kw.get('keyword', ''),
-                kw.get('monthlySearches', 0),
-                kw.get('competitionRate', 0),
-                kw.get('score', 0),
-                kw.get('recommendation', ''),
-                timestamp
-            ])
-        
-        # 데이터 추가 (기존 데이터 아래에 추가)
-        if rows:
-            next_row = len(worksheet.get_all_values()) + 1
-            cell_range = f'A{next_row}:F{next_row + len(rows) - 1}'
-            worksheet.update(cell_range, rows)
-        
-        # 스프레드시트 공유 설정
-        spreadsheet.share(None, perm_type='anyone', role='reader')
+        # 데이터 추가 (append API로 기존 데이터 아래에 추가하므로 시트 크기와 무관)
+        with span("sheets.append", rows=len(rows)):
+            append_keyword_rows(worksheet, rows)
+        
+        # 스프레드시트 공유 설정 (스프레드시트마다 한 번만)
+        with span("sheets.share"):
+            sheet_registry.ensure_shared(spreadsheet)
         
         return spreadsheet.url
     
     except Exception as e:
         print(f"[google_client] 시트 저장 오류: {str(e)}")
-        raise 
\ No newline at end of file
+        # 삭제되었거나 권한이 바뀐 시트의 오래된 핸들을 재사용하지 않도록 무효화
+        # (레지스트리로 찾은 시트도 다음 동기화에서 다시 조회되어, 없거나 접근할 수 없으면 새로 생성됨)
+        for stale_id in {spreadsheet_id, getattr(spreadsheet, 'id', None)} - {None, ''}:
+            sheet_manager.invalidate(stale_id)
+        raise
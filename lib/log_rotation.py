@@ -0,0 +1,303 @@
+"""
+로그 파일 회전/압축 모듈
+
+크기 또는 시간 기준으로 로그 파일을 회전하고, 회전된 세그먼트를 백그라운드 스레드에서
+gzip(zstandard가 설치되어 있으면 zstd)으로 압축합니다. 보존 개수를 넘는 오래된 세그먼트는 삭제하며,
+세그먼트별 기록 시간 범위를 인덱스 파일(<로그 파일>.index.json)에 남겨 특정 시간대의 로그만
+골라 읽을 수 있게 합니다.
+
+회전은 파일 이름 변경으로 이루어지므로 한 프로세스만 같은 로그 파일에 기록하는 경우에만 사용할 수 있습니다.
+여러 워커 프로세스가 같은 LOG_FILE을 쓰면 각자 회전하면서 세그먼트가 섞이거나 유실되므로,
+그때는 워커별로 LOG_FILE을 다르게 지정해야 합니다. 기본값에서는 회전하지 않습니다.
+"""
+import io
+import os
+import gzip
+import json
+import time
+import shutil
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, IO, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 gzip 사용
+    zstandard = None
+
+# 로그 회전 설정
+LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", "0"))  # 세그먼트 최대 크기 (0이면 크기 기준 회전 안 함, 예: 104857600)
+LOG_ROTATE_INTERVAL = float(os.environ.get("LOG_ROTATE_INTERVAL", "0"))  # 회전 주기(초, UTC 기준 정렬, 0이면 시간 기준 회전 안 함, 예: 86400)
+LOG_RETENTION = int(os.environ.get("LOG_RETENTION", "30"))  # 보존할 회전 세그먼트 수
+LOG_COMPRESSION = os.environ.get("LOG_COMPRESSION", "auto").lower()  # auto, zstd, gzip, none
+
+COMPRESSION_EXTENSIONS = {"zstd": ".zst", "gzip": ".gz", "none": ""}
+
+def resolve_compression(compression: str) -> str:
+    """
+    압축 방식 설정을 실제 사용할 방식으로 바꿉니다.
+
+    Args:
+        compression: auto, zstd, gzip, none 중 하나
+
+    Returns:
+        str: zstd, gzip, none 중 하나 (auto는 zstandard 설치 여부에 따라 결정)
+
+    Raises:
+        ValueError: 알 수 없는 압축 방식인 경우
+    """
+    if compression == "auto":
+        return "zstd" if zstandard is not None else "gzip"
+    if compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(f"알 수 없는 로그 압축 방식: {compression} (auto, zstd, gzip, none 중 하나)")
+    if compression == "zstd" and zstandard is None:
+        print("[log_rotation] 경고: zstandard가 설치되지 않아 gzip으로 압축합니다.")
+        return "gzip"
+    return compression
+
+class RotatingCompressedFileHandler(logging.FileHandler):
+    """
+    크기/시간 기준으로 회전하고 회전된 세그먼트를 백그라운드에서 압축하는 파일 핸들러
+
+    회전 시 현재 파일을 '<로그 파일>.<첫 기록 시각>' 이름으로 옮기고 즉시 새 파일을 열며,
+    압축과 보존 개수 정리는 별도 스레드 하나에서 순서대로 처리합니다.
+    단일 프로세스 전용이며, 여러 프로세스가 같은 파일에 기록하면 회전이 서로 충돌합니다.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = LOG_MAX_BYTES,
+                 interval: float = LOG_ROTATE_INTERVAL, retention: int = LOG_RETENTION,
+                 compression: str = LOG_COMPRESSION, encoding: str = "utf-8"):
+        """
+        Args:
+            filename: 로그 파일 경로
+            max_bytes: 세그먼트 최대 크기 (0이면 크기 기준 회전 안 함)
+            interval: 회전 주기(초), 0이면 시간 기준 회전 안 함
+            retention: 보존할 회전 세그먼트 수
+            compression: auto, zstd, gzip, none 중 하나
+            encoding: 파일 인코딩
+
+        Raises:
+            ValueError: 알 수 없는 압축 방식인 경우
+        """
+        super().__init__(filename, mode="a", encoding=encoding)
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.retention = retention
+        self.compression = resolve_compression(compression)
+        self.index_path = f"{self.baseFilename}.index.json"
+        self._directory = os.path.dirname(self.baseFilename)
+        self._index_lock = threading.Lock()
+        self._index = _read_index(self.index_path)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
+        self._size = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+        active = self._index.get("active") or {}
+        self._segment_start: Optional[float] = active.get("start") if self._size else None
+        self._segment_end: Optional[float] = active.get("end") if self._size else None
+        self._segment_records = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """레코드 하나를 기록 (필요하면 먼저 회전)"""
+        try:
+            self._write([(record, self.format(record))])
+        except Exception:
+            self.handleError(record)
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        """
+        레코드 묶음을 한 번의 쓰기와 flush로 기록합니다. BatchingQueueListener가 사용합니다.
+
+        Args:
+            records: 핸들러 레벨을 통과한 레코드 리스트
+        """
+        formatted = []
+        for record in records:
+            if not self.filter(record):
+                continue
+            try:
+                formatted.append((record, self.format(record)))
+            except Exception:
+                self.handleError(record)
+        if not formatted:
+            return
+        self.acquire()
+        try:
+            self._write(formatted)
+        except Exception:
+            self.handleError(formatted[-1][0])
+        finally:
+            self.release()
+
+    def _write(self, formatted: List[Tuple[logging.LogRecord, str]]) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        pending: List[str] = []
+        for record, text in formatted:
+            line = text + self.terminator
+            size = len(line.encode(self.encoding or "utf-8"))
+            if self._should_rollover(record.created, size):
+                self._flush_pending(pending)
+                self._rollover()
+            if self._segment_start is None:
+                self._start_segment(record.created)
+            pending.append(line)
+            self._size += size
+            self._segment_end = max(self._segment_end or record.created, record.created)
+            self._segment_records += 1
+        self._flush_pending(pending)
+
+    def _flush_pending(self, pending: List[str]) -> None:
+        if pending:
+            self.stream.write("".join(pending))
+            self.flush()
+            pending.clear()
+
+    def _should_rollover(self, created: float, incoming: int) -> bool:
+        if self._size == 0:
+            return False
+        if self.max_bytes and self._size + incoming > self.max_bytes:
+            return True
+        if self.interval and self._segment_start is not None:
+            # 앞선 시각의 레코드가 늦게 도착해도 다시 회전하지 않도록 다음 주기로 넘어갈 때만 회전
+            return int(created // self.interval) > int(self._segment_start // self.interval)
+        return False
+
+    def _start_segment(self, created: float) -> None:
+        self._segment_start = created
+        with self._index_lock:
+            self._index["active"] = {"file": os.path.basename(self.baseFilename), "start": created}
+            _write_index(self.index_path, self._index)
+
+    def _rollover(self) -> None:
+        """현재 파일을 세그먼트로 옮기고 새 파일을 연 뒤 압축을 예약"""
+        self.stream.close()
+        self.stream = None
+
+        start = self._segment_start if self._segment_start is not None else time.time()
+        target = self._segment_path(start)
+        os.rename(self.baseFilename, target)
+        segment = {
+            "file": os.path.basename(target),
+            "start": start,
+            "end": self._segment_end if self._segment_end is not None else start,
+            "records": self._segment_records,
+            "bytes": self._size
+        }
+        with self._index_lock:
+            self._index.setdefault("segments", []).append(segment)
+            self._index["active"] = None
+            _write_index(self.index_path, self._index)
+        self._executor.submit(self._compress, segment)
+
+        self.stream = self._open()
+        self._size = 0
+        self._segment_start = None
+        self._segment_end = None
+        self._segment_records = 0
+
+    def _segment_path(self, start: float) -> str:
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime(start))
+        path = f"{self.baseFilename}.{stamp}"
+        suffix = 1
+        while any(os.path.exists(path + ext) for ext in COMPRESSION_EXTENSIONS.values()):
+            path = f"{self.baseFilename}.{stamp}-{suffix}"
+            suffix += 1
+        return path
+
+    def _compress(self, segment: Dict[str, Any]) -> None:
+        """세그먼트를 압축하고 인덱스와 보존 개수를 갱신 (백그라운드 스레드)"""
+        try:
+            source = os.path.join(self._directory, segment["file"])
+            target = source + COMPRESSION_EXTENSIONS[self.compression]
+            if target != source:
+                with open(source, "rb") as src, open(target, "wb") as dst:
+                    if self.compression == "zstd":
+                        zstandard.ZstdCompressor().copy_stream(src, dst)
+                    else:
+                        with gzip.GzipFile(fileobj=dst, mode="wb") as gz:
+                            shutil.copyfileobj(src, gz)
+                os.remove(source)
+
+            with self._index_lock:
+                segment["file"] = os.path.basename(target)
+                segment["bytes"] = os.path.getsize(target)
+                self._apply_retention()
+                _write_index(self.index_path, self._index)
+        except Exception as e:
+            print(f"[log_rotation] 세그먼트 압축 오류: {str(e)}")
+
+    def _apply_retention(self) -> None:
+        segments = self._index.get("segments", [])
+        while len(segments) > self.retention:
+            expired = segments.pop(0)
+            path = os.path.join(self._directory, expired["file"])
+            if os.path.exists(path):
+                os.remove(path)
+
+    def wait_for_compression(self) -> None:
+        """예약된 압축 작업이 모두 끝날 때까지 대기"""
+        self._executor.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """파일을 닫고 남은 압축 작업을 마칩니다."""
+        super().close()
+        self._executor.shutdown(wait=True)
+
+def _read_index(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {"segments": [], "active": None}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[log_rotation] 인덱스 파일 읽기 오류, 새 인덱스로 시작: {str(e)}")
+        return {"segments": [], "active": None}
+
+def _write_index(path: str, index: Dict[str, Any]) -> None:
+    """인덱스 파일을 원자적으로 교체"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+def find_segments(log_file: str, start: float, end: float) -> List[str]:
+    """
+    인덱스 파일을 읽어 주어진 시간 범위와 겹치는 로그 파일 경로를 오래된 순서로 반환합니다.
+
+    Args:
+        log_file: 로그 파일 경로 (LOG_FILE)
+        start: 범위 시작 시각(epoch 초)
+        end: 범위 끝 시각(epoch 초)
+
+    Returns:
+        List[str]: 회전된 세그먼트와, 범위에 해당하면 현재 기록 중인 파일의 경로
+    """
+    log_file = os.path.abspath(log_file)
+    directory = os.path.dirname(log_file)
+    index = _read_index(f"{log_file}.index.json")
+    paths = [os.path.join(directory, segment["file"]) for segment in index.get("segments", [])
+             if segment["start"] <= end and segment["end"] >= start]
+    active = index.get("active")
+    if active and active["start"] <= end:
+        paths.append(os.path.join(directory, active["file"]))
+    return paths
+
+def open_segment(path: str) -> IO[str]:
+    """
+    압축 여부와 관계없이 세그먼트를 텍스트로 엽니다.
+
+    Args:
+        path: 세그먼트 파일 경로 (.gz, .zst 또는 일반 파일)
+
+    Returns:
+        IO[str]: 줄 단위로 읽을 수 있는 텍스트 파일 객체
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise ValueError("zstd 세그먼트를 읽으려면 zstandard가 필요합니다.")
+        reader = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
@@ -5,53 +5,343 @@ KeywordPulse 로깅 시스템
 """
 import os
 import json
+import time
+import queue
+import atexit
+import random
 import logging
+import logging.handlers
+import threading
 import traceback
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Union, List, Callable, Tuple
+
+from lib.log_rotation import RotatingCompressedFileHandler, LOG_MAX_BYTES, LOG_ROTATE_INTERVAL
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
 
 # 로그 레벨 설정
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 LOG_FILE = os.environ.get("LOG_FILE", "logs/keywordpulse.log")
 ENABLE_CONSOLE_LOGS = os.environ.get("ENABLE_CONSOLE_LOGS", "TRUE").upper() == "TRUE"
 
+# 비동기 로깅 설정 (큐에 넣고 백그라운드 스레드에서 일괄 기록)
+LOG_ASYNC = os.environ.get("LOG_ASYNC", "FALSE").upper() == "TRUE"
+LOG_QUEUE_SIZE = int(os.environ.get("LOG_QUEUE_SIZE", "10000"))
+LOG_OVERFLOW_POLICY = os.environ.get("LOG_OVERFLOW_POLICY", "drop").lower()  # drop, sample, block
+LOG_SAMPLE_RATE = float(os.environ.get("LOG_SAMPLE_RATE", "0.1"))  # sample 정책에서 큐가 절반 이상 찼을 때 통과시킬 WARNING 미만 레코드 비율
+LOG_BLOCK_TIMEOUT = float(os.environ.get("LOG_BLOCK_TIMEOUT", "1.0"))  # block 정책에서 최대 대기 시간(초)
+LOG_BATCH_SIZE = int(os.environ.get("LOG_BATCH_SIZE", "256"))
+
+OVERFLOW_POLICIES = ("drop", "sample", "block")
+
+# 로그 샘플링/속도 제한 설정 (ERROR 이상은 항상 기록)
+LOG_SAMPLING = os.environ.get("LOG_SAMPLING", "FALSE").upper() == "TRUE"
+LOG_SAMPLING_LEVEL_RATES = os.environ.get("LOG_SAMPLING_LEVEL_RATES", "")  # 예: "DEBUG=0.01,INFO=0.1"
+LOG_SAMPLING_RATE_LIMIT = int(os.environ.get("LOG_SAMPLING_RATE_LIMIT", "0"))  # 메시지 키별 초당 최대 기록 수 (0이면 사용 안 함)
+LOG_SAMPLING_FIRST_N = int(os.environ.get("LOG_SAMPLING_FIRST_N", "0"))  # 메시지 키별 처음 N개는 모두 기록 (0이면 사용 안 함)
+LOG_SAMPLING_EVERY_M = int(os.environ.get("LOG_SAMPLING_EVERY_M", "0"))  # 이후에는 M번째마다 기록 (0이면 모두 생략)
+LOG_SAMPLING_SUMMARY_INTERVAL = float(os.environ.get("LOG_SAMPLING_SUMMARY_INTERVAL", "60"))  # 생략 건수 요약 주기(초)
+
+# JSON 직렬화 백엔드 (auto: orjson이 설치되어 있으면 사용, json: 표준 라이브러리)
+LOG_JSON_BACKEND = os.environ.get("LOG_JSON_BACKEND", "auto").lower()
+
 # 로그 디렉토리 생성
 os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
 
+# json.dumps는 기본값이 아닌 옵션을 주면 호출마다 인코더를 새로 만들므로 하나를 재사용
+_stdlib_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+
+def _orjson_dumps(obj: Any) -> str:
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+def get_json_serializer(backend: str = LOG_JSON_BACKEND) -> Callable[[Any], str]:
+    """
+    로그 JSON 직렬화 함수를 반환합니다.
+    
+    Args:
+        backend: auto, orjson, json 중 하나
+    
+    Returns:
+        Callable[[Any], str]: 객체를 JSON 문자열로 바꾸는 함수
+    
+    Raises:
+        ValueError: 알 수 없는 백엔드인 경우
+    """
+    if backend not in ("auto", "orjson", "json"):
+        raise ValueError(f"알 수 없는 JSON 백엔드: {backend} (auto, orjson, json 중 하나)")
+    if backend != "json" and orjson is not None:
+        return _orjson_dumps
+    if backend == "orjson":
+        print("[logger] 경고: orjson이 설치되지 않아 표준 json으로 직렬화합니다.")
+    return _stdlib_dumps
+
 class JSONFormatter(logging.Formatter):
-    """JSON 형식의 로그 포맷터"""
+    """
+    JSON 형식의 로그 포맷터
+    
+    레코드의 created 시각을 그대로 사용하고(초 단위 문자열은 캐싱), 호출 위치별로 변하지 않는
+    level/module/function/line 필드는 미리 직렬화해 둡니다. 포맷터는 레벨 필터를 통과한
+    레코드에만 호출되므로 context도 그때 한 번만 직렬화되며, 같은 레코드를 여러 핸들러가
+    기록할 때는 첫 결과를 재사용합니다.
+    """
+    
+    STATIC_CACHE_SIZE = 4096
+    
+    def __init__(self, serializer: Optional[Callable[[Any], str]] = None):
+        """
+        Args:
+            serializer: (선택) JSON 직렬화 함수, 없으면 LOG_JSON_BACKEND 설정 사용
+        """
+        super().__init__()
+        self.dumps = serializer or get_json_serializer()
+        self._static: Dict[Tuple, str] = {}
+        self._second: Tuple[int, str] = (-1, "")
     
     def format(self, record: logging.LogRecord) -> str:
         """로그 레코드를 JSON 형식으로 변환"""
-        log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "level": record.levelname,
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
-            "message": record.getMessage(),
-        }
+        cached = record.__dict__.get("_json_line")
+        if cached is not None and cached[0] is self.dumps:
+            return cached[1]
+        
+        dumps = self.dumps
+        parts = ['{"timestamp":"', self._timestamp(record.created), '",',
+                 self._static_fields(record), ',"message":', dumps(record.getMessage())]
         
         # 예외 정보가 있는 경우 추가
         if record.exc_info:
-            log_data["exception"] = {
-                "type": record.exc_info[0].__name__,
-                "message": str(record.exc_info[1]),
-                "traceback": traceback.format_exception(*record.exc_info)
-            }
+            parts.append(',"exception":')
+            parts.append(dumps(self._exception(record)))
         
         # 추가 컨텍스트 정보가 있는 경우 추가
-        if hasattr(record, "context") and record.context:
-            log_data["context"] = record.context
+        context = record.__dict__.get("context")
+        if context:
+            parts.append(',"context":')
+            parts.append(dumps(context))
+        
+        parts.append("}")
+        line = "".join(parts)
+        record._json_line = (dumps, line)
+        return line
+    
+    def _timestamp(self, created: float) -> str:
+        """UTC ISO 8601 시각 문자열 (초 단위 부분은 같은 초 동안 재사용)"""
+        second = int(created)
+        cached = self._second
+        if cached[0] != second:
+            cached = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)))
+            self._second = cached
+        return f"{cached[1]}.{int((created - second) * 1_000_000):06d}"
+    
+    def _static_fields(self, record: logging.LogRecord) -> str:
+        """호출 위치별로 고정된 필드의 직렬화 결과"""
+        key = (record.name, record.levelno, record.pathname, record.funcName, record.lineno)
+        fields = self._static.get(key)
+        if fields is None:
+            fields = self.dumps({
+                "level": record.levelname,
+                "module": record.module,
+                "function": record.funcName,
+                "line": record.lineno,
+            })[1:-1]
+            if len(self._static) >= self.STATIC_CACHE_SIZE:
+                self._static.clear()
+            self._static[key] = fields
+        return fields
+    
+    @staticmethod
+    def _exception(record: logging.LogRecord) -> Dict[str, Any]:
+        """예외 정보 사전 (traceback 문자열은 레코드당 한 번만 생성)"""
+        exception = record.__dict__.get("_json_exception")
+        if exception is None:
+            exc_type, exc_value, exc_tb = record.exc_info
+            exception = {
+                "type": exc_type.__name__,
+                "message": str(exc_value),
+                "traceback": traceback.format_exception(exc_type, exc_value, exc_tb)
+            }
+            record._json_exception = exception
+        return exception
+
+def parse_level_rates(spec: str) -> Dict[int, float]:
+    """
+    "DEBUG=0.01,INFO=0.1" 형식의 레벨별 표본 비율 설정을 해석합니다.
+    
+    Args:
+        spec: 레벨=비율 쌍을 쉼표로 구분한 문자열
+    
+    Returns:
+        Dict[int, float]: 로그 레벨 번호별 표본 비율
+    
+    Raises:
+        ValueError: 형식이 잘못되었거나 알 수 없는 레벨인 경우
+    """
+    rates = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        level = logging.getLevelName(name.strip().upper())
+        if not isinstance(level, int) or not value:
+            raise ValueError(f"잘못된 레벨별 표본 비율 설정: {item}")
+        rates[level] = float(value)
+    return rates
+
+class LogSampler:
+    """
+    로그 샘플링/속도 제한기
+    
+    ERROR 미만 레코드에 대해 다음 정책을 순서대로 적용합니다.
+    - 레벨별 확률 표본 추출 (level_rates)
+    - 메시지 키별 처음 first_n개 기록 후 every_m번째마다 기록 (first_n이 0이면 처음부터 every_m번째마다)
+    - 메시지 키별 초당 rate_limit개까지 기록
+    생략된 레코드 수는 키별로 모아 두었다가 summary_interval마다 요약 레코드로 내보냅니다.
+    """
+    
+    MAX_KEYS = 10000
+    
+    def __init__(self, level_rates: Optional[Dict[int, float]] = None, rate_limit: int = 0,
+                 first_n: int = 0, every_m: int = 0, summary_interval: float = LOG_SAMPLING_SUMMARY_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic, rng: Callable[[], float] = random.random):
+        """
+        Args:
+            level_rates: 로그 레벨 번호별 표본 비율 (0~1)
+            rate_limit: 메시지 키별 초당 최대 기록 수, 0이면 사용 안 함
+            first_n: 메시지 키별로 모두 기록할 처음 레코드 수, 0이면 사용 안 함
+            every_m: first_n 이후 기록할 간격, 0이면 first_n 이후 모두 생략 (first_n도 0이면 사용 안 함)
+            summary_interval: 생략 건수 요약 주기(초)
+            clock: 단조 증가 시각 함수
+            rng: 0~1 난수 함수
+        """
+        self.level_rates = level_rates or {}
+        self.rate_limit = rate_limit
+        self.first_n = first_n
+        self.every_m = every_m
+        self.summary_interval = summary_interval
+        self.clock = clock
+        self.rng = rng
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._windows: Dict[str, Tuple[int, int]] = {}  # 키 -> (초 단위 창, 창 안의 기록 수)
+        self._suppressed: Dict[str, int] = {}
+        self._summary_at = clock() + summary_interval
+    
+    @classmethod
+    def from_env(cls) -> "LogSampler":
+        """환경변수 설정으로 샘플러 생성"""
+        return cls(level_rates=parse_level_rates(LOG_SAMPLING_LEVEL_RATES),
+                   rate_limit=LOG_SAMPLING_RATE_LIMIT, first_n=LOG_SAMPLING_FIRST_N,
+                   every_m=LOG_SAMPLING_EVERY_M)
+    
+    def should_log(self, level: int, key: str) -> bool:
+        """
+        레코드를 기록할지 결정합니다.
+        
+        Args:
+            level: 로그 레벨
+            key: 메시지 키 (기본적으로 로거 이름과 메시지)
+        
+        Returns:
+            bool: 기록하면 True, 생략하면 False (ERROR 이상은 항상 True)
+        """
+        if level >= logging.ERROR:
+            return True
+        
+        rate = self.level_rates.get(level)
+        if rate is not None and self.rng() >= rate:
+            self._suppress(key)
+            return False
+        
+        with self._lock:
+            if len(self._counts) > self.MAX_KEYS:
+                self._counts.clear()
+                self._windows.clear()
+            
+            if self.first_n or self.every_m:
+                count = self._counts.get(key, 0) + 1
+                self._counts[key] = count
+                if count > self.first_n and (not self.every_m or (count - self.first_n) % self.every_m):
+                    self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                    return False
+            
+            if self.rate_limit:
+                window = int(self.clock())
+                start, written = self._windows.get(key, (window, 0))
+                if start != window:
+                    start, written = window, 0
+                if written >= self.rate_limit:
+                    self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                    return False
+                self._windows[key] = (start, written + 1)
+        return True
+    
+    def _suppress(self, key: str) -> None:
+        with self._lock:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+    
+    def take_summary(self, force: bool = False) -> Optional[Dict[str, int]]:
+        """
+        요약 주기가 지났으면 키별 생략 건수를 반환하고 초기화합니다.
+        
+        Args:
+            force: True면 주기와 관계없이 반환
         
-        return json.dumps(log_data)
+        Returns:
+            Optional[Dict[str, int]]: 생략된 레코드가 있으면 키별 건수, 없거나 주기 전이면 None
+        """
+        now = self.clock()
+        if not force and now < self._summary_at:
+            return None
+        with self._lock:
+            self._summary_at = now + self.summary_interval
+            summary, self._suppressed = self._suppressed, {}
+        return summary or None
+
+# 컨텍스트 인자: 사전 또는 사전을 만드는 함수(레벨이 활성화된 경우에만 호출)
+ContextArg = Optional[Union[Dict[str, Any], Callable[[], Dict[str, Any]]]]
 
 class ContextLogger(logging.Logger):
-    """컨텍스트 정보를 포함한 로거"""
+    """
+    컨텍스트 정보를 포함한 로거
+    
+    context에는 사전 대신 사전을 반환하는 함수를 넘길 수 있습니다. 함수는 해당 레벨이
+    활성화되어 레코드가 실제로 만들어질 때만 호출되므로, 비용이 큰 디버그 컨텍스트를
+    `context=lambda: {...}` 형태로 넘기면 비활성 레벨에서는 비용이 들지 않습니다.
+    
+    sampler가 설정되어 있으면 레코드를 만들기 전에 샘플링/속도 제한을 적용합니다.
+    메시지 키는 기본적으로 메시지 문자열이며, sample_key 인자로 직접 지정할 수 있습니다.
+    """
     
-    def _log_with_context(self, level: int, msg: str, context: Optional[Dict[str, Any]] = None, 
-                          exc_info: Optional[Any] = None, stacklevel: int = 1, **kwargs) -> None:
+    # 전체 로거에 적용할 샘플러 (로거별로 인스턴스 속성으로 덮어쓸 수 있음)
+    sampler: Optional[LogSampler] = None
+    
+    def _log_with_context(self, level: int, msg: str, context: ContextArg = None, 
+                          exc_info: Optional[Any] = None, stacklevel: int = 1,
+                          sample_key: Optional[str] = None, **kwargs) -> None:
         """컨텍스트 정보를 포함하여 로깅"""
+        if not self.isEnabledFor(level):
+            return
+        
+        sampler = self.sampler
+        if sampler is not None:
+            # 요약은 INFO 레코드이므로 INFO가 비활성인 로거는 요약을 가져가지 않고 다른 로거에 맡김
+            summary = sampler.take_summary() if self.isEnabledFor(logging.INFO) else None
+            if summary:
+                self._log(logging.INFO, "로그 샘플링으로 생략된 레코드 요약", (),
+                          extra={"context": {"suppressed": summary,
+                                             "total": sum(summary.values())}})
+            if not sampler.should_log(level, f"{self.name}:{sample_key or msg}"):
+                return
+        
+        if callable(context):
+            try:
+                context = context()
+            except Exception as e:
+                # 컨텍스트 생성 실패로 호출한 코드가 중단되지 않도록 오류만 기록
+                context = {"context_error": f"{type(e).__name__}: {str(e)}"}
+        
         if context:
             extra = kwargs.get("extra", {})
             extra["context"] = context
@@ -59,36 +349,275 @@ class ContextLogger(logging.Logger):
         
         self.log(level, msg, exc_info=exc_info, stacklevel=stacklevel+1, **kwargs)
     
-    def debug(self, msg: str, context: Optional[Dict[str, Any]] = None, **kwargs) -> None:
+    def debug(self, msg: str, context: ContextArg = None, **kwargs) -> None:
         """DEBUG 레벨 로깅"""
         self._log_with_context(logging.DEBUG, msg, context, stacklevel=2, **kwargs)
     
-    def info(self, msg: str, context: Optional[Dict[str, Any]] = None, **kwargs) -> None:
+    def info(self, msg: str, context: ContextArg = None, **kwargs) -> None:
         """INFO 레벨 로깅"""
         self._log_with_context(logging.INFO, msg, context, stacklevel=2, **kwargs)
     
-    def warning(self, msg: str, context: Optional[Dict[str, Any]] = None, **kwargs) -> None:
+    def warning(self, msg: str, context: ContextArg = None, **kwargs) -> None:
         """WARNING 레벨 로깅"""
         self._log_with_context(logging.WARNING, msg, context, stacklevel=2, **kwargs)
     
-    def error(self, msg: str, context: Optional[Dict[str, Any]] = None, error: Optional[Exception] = None, **kwargs) -> None:
+    def error(self, msg: str, context: ContextArg = None, error: Optional[Exception] = None, **kwargs) -> None:
         """ERROR 레벨 로깅"""
         self._log_with_context(logging.ERROR, msg, context, exc_info=error, stacklevel=2, **kwargs)
     
-    def critical(self, msg: str, context: Optional[Dict[str, Any]] = None, error: Optional[Exception] = None, **kwargs) -> None:
+    def critical(self, msg: str, context: ContextArg = None, error: Optional[Exception] = None, **kwargs) -> None:
         """CRITICAL 레벨 로깅"""
         self._log_with_context(logging.CRITICAL, msg, context, exc_info=error, stacklevel=2, **kwargs)
     
-    def log_dict(self, level: int, data: Dict[str, Any], context: Optional[Dict[str, Any]] = None, **kwargs) -> None:
+    def log_dict(self, level: int, data: Dict[str, Any], context: ContextArg = None, **kwargs) -> None:
         """사전 형태의 데이터를 로깅"""
+        if not self.isEnabledFor(level):
+            return
         msg = json.dumps(data)
         self._log_with_context(level, msg, context, stacklevel=2, **kwargs)
 
+@dataclass
+class AsyncLogStats:
+    """
+    비동기 로깅 카운터
+    
+    로그를 남기는 여러 스레드와 리스너 스레드가 함께 갱신하므로 incr()로 락을 잡고 증가시킵니다.
+    """
+    enqueued: int = 0
+    dropped: int = 0  # 큐가 가득 차 버린 레코드 수
+    sampled_out: int = 0  # sample 정책으로 버린 레코드 수
+    blocked: int = 0  # block 정책으로 대기한 횟수
+    batches: int = 0  # 백그라운드 스레드의 일괄 기록 횟수
+    written: int = 0
+    
+    def __post_init__(self):
+        # 필드가 아니므로 asdict 대상에서 제외됨
+        self._lock = threading.Lock()
+    
+    def incr(self, name: str, amount: int = 1) -> None:
+        """카운터 하나를 원자적으로 증가"""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return asdict(self)
+
+class OverflowQueueHandler(logging.handlers.QueueHandler):
+    """
+    크기 제한 큐에 레코드를 넣는 핸들러
+    
+    큐가 가득 찼을 때의 동작은 overflow 정책으로 정합니다.
+    - drop: 새 레코드를 버림
+    - sample: 큐가 절반 이상 차면 WARNING 미만 레코드를 sample_rate 비율로만 통과시키고, 가득 차면 버림
+    - block: 자리가 날 때까지 최대 block_timeout초 대기한 뒤에도 가득 차 있으면 버림
+    """
+    
+    def __init__(self, log_queue: "queue.Queue", policy: str = LOG_OVERFLOW_POLICY,
+                 sample_rate: float = LOG_SAMPLE_RATE, block_timeout: float = LOG_BLOCK_TIMEOUT,
+                 stats: Optional[AsyncLogStats] = None, rng: Callable[[], float] = random.random):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"알 수 없는 로그 큐 overflow 정책: {policy} ({', '.join(OVERFLOW_POLICIES)} 중 하나)")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.sample_rate = sample_rate
+        self.block_timeout = block_timeout
+        self.stats = stats or AsyncLogStats()
+        self.rng = rng
+        self.listener: Optional["BatchingQueueListener"] = None
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        메시지 인자만 미리 합쳐 둡니다.
+        
+        기본 구현과 달리 exc_info를 지우지 않으므로 JSONFormatter가 예외 정보를 구조화할 수 있습니다.
+        """
+        msg = record.getMessage()
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = msg
+        record.args = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """overflow 정책에 따라 레코드를 큐에 넣습니다."""
+        q = self.queue
+        if (self.policy == "sample" and record.levelno < logging.WARNING
+                and q.qsize() * 2 >= q.maxsize > 0 and self.rng() >= self.sample_rate):
+            self.stats.incr("sampled_out")
+            return
+        try:
+            q.put_nowait(record)
+        except queue.Full:
+            if self.policy != "block":
+                self.stats.incr("dropped")
+                return
+            self.stats.incr("blocked")
+            try:
+                q.put(record, timeout=self.block_timeout)
+            except queue.Full:
+                self.stats.incr("dropped")
+                return
+        self.stats.incr("enqueued")
+
+class BatchingQueueListener(logging.handlers.QueueListener):
+    """
+    큐에 쌓인 레코드를 모아 일괄 기록하는 백그라운드 리스너
+    
+    스트림/파일 핸들러에는 배치마다 한 번만 쓰고 flush하며(emit_batch를 제공하는 핸들러는 그 메서드 사용),
+    그 외 핸들러는 레코드별로 처리합니다. 백그라운드 스레드는 직접 만들고 관리합니다.
+    """
+    
+    def __init__(self, log_queue: "queue.Queue", *handlers: logging.Handler,
+                 batch_size: int = LOG_BATCH_SIZE, stats: Optional[AsyncLogStats] = None,
+                 respect_handler_level: bool = True):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.batch_size = batch_size
+        self.stats = stats or AsyncLogStats()
+        self._worker: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """백그라운드 기록 스레드 시작"""
+        if self.is_running():
+            return
+        self._worker = threading.Thread(target=self._monitor, name="log-listener", daemon=True)
+        self._worker.start()
+    
+    def stop(self) -> None:
+        """종료 신호를 넣고 큐에 남은 레코드를 모두 기록할 때까지 대기"""
+        if self._worker is None:
+            return
+        self.enqueue_sentinel()
+        self._worker.join()
+        self._worker = None
+    
+    def is_running(self) -> bool:
+        """백그라운드 기록 스레드가 실행 중인지 여부"""
+        return self._worker is not None and self._worker.is_alive()
+    
+    def enqueue_sentinel(self) -> None:
+        # 큐가 가득 차 있어도 종료 신호는 반드시 전달
+        self.queue.put(self._sentinel)
+    
+    def _monitor(self) -> None:
+        q = self.queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            records = [record for record in batch if record is not self._sentinel]
+            if records:
+                self.handle_batch(records)
+            for _ in batch:
+                q.task_done()
+            if len(records) < len(batch):
+                break
+    
+    def handle_batch(self, records: List[logging.LogRecord]) -> None:
+        """레코드 묶음을 모든 핸들러에 기록"""
+        self.stats.incr("batches")
+        self.stats.incr("written", len(records))
+        for handler in self.handlers:
+            accepted = [r for r in records if not self.respect_handler_level or r.levelno >= handler.level]
+            if not accepted:
+                continue
+            emit_batch = getattr(handler, "emit_batch", None)
+            if emit_batch is not None:
+                emit_batch(accepted)
+            elif isinstance(handler, logging.StreamHandler) and handler.stream is not None:
+                self._write_stream(handler, accepted)
+            else:
+                for record in accepted:
+                    handler.handle(record)
+    
+    def _write_stream(self, handler: logging.StreamHandler, records: List[logging.LogRecord]) -> None:
+        lines = []
+        for record in records:
+            if not handler.filter(record):
+                continue
+            try:
+                lines.append(handler.format(record))
+            except Exception:
+                handler.handleError(record)
+        if not lines:
+            return
+        terminator = handler.terminator
+        handler.acquire()
+        try:
+            handler.stream.write(terminator.join(lines) + terminator)
+            handler.flush()
+        except Exception:
+            handler.handleError(records[-1])
+        finally:
+            handler.release()
+
+# 실행 중인 비동기 로깅 핸들러
+_async_handler: Optional[OverflowQueueHandler] = None
+
+def start_async_logging(handlers: List[logging.Handler], queue_size: int = LOG_QUEUE_SIZE,
+                        policy: str = LOG_OVERFLOW_POLICY, batch_size: int = LOG_BATCH_SIZE) -> OverflowQueueHandler:
+    """
+    주어진 핸들러들을 백그라운드 리스너 뒤로 옮기고, 로거에 붙일 큐 핸들러를 반환합니다.
+    
+    Args:
+        handlers: 실제 기록을 담당할 핸들러 리스트
+        queue_size: 큐 최대 크기
+        policy: 큐가 가득 찼을 때의 정책 (drop, sample, block)
+        batch_size: 한 번에 기록할 최대 레코드 수
+    
+    Returns:
+        OverflowQueueHandler: 로거에 추가할 큐 핸들러
+    
+    Raises:
+        ValueError: 알 수 없는 overflow 정책인 경우
+    """
+    global _async_handler
+    stop_async_logging()
+    
+    log_queue = queue.Queue(maxsize=queue_size)
+    stats = AsyncLogStats()
+    queue_handler = OverflowQueueHandler(log_queue, policy=policy, stats=stats)
+    queue_handler.listener = BatchingQueueListener(log_queue, *handlers, batch_size=batch_size, stats=stats)
+    queue_handler.listener.start()
+    _async_handler = queue_handler
+    return queue_handler
+
+def stop_async_logging() -> None:
+    """백그라운드 리스너를 멈추고 큐에 남은 레코드를 모두 기록합니다."""
+    global _async_handler
+    if _async_handler is None:
+        return
+    handler, _async_handler = _async_handler, None
+    if handler.listener is not None:
+        handler.listener.stop()
+    logging.getLogger().removeHandler(handler)
+
+def get_logging_stats() -> Dict[str, Any]:
+    """
+    비동기 로깅 카운터와 큐 깊이를 반환합니다.
+    
+    Returns:
+        Dict[str, Any]: 비동기 모드가 아니면 {"async": False}
+    """
+    if _async_handler is None:
+        return {"async": False}
+    return {"async": True, "policy": _async_handler.policy,
+            "queue_depth": _async_handler.queue.qsize(), **_async_handler.stats.to_dict()}
+
 # 로깅 설정
-def setup_logging() -> None:
-    """로깅 시스템 초기화"""
+def setup_logging(async_mode: Optional[bool] = None) -> None:
+    """
+    로깅 시스템 초기화
+    
+    Args:
+        async_mode: (선택) 비동기 로깅 사용 여부, 없으면 LOG_ASYNC 환경변수 사용
+    """
     # 커스텀 로거 등록
     logging.setLoggerClass(ContextLogger)
+    if LOG_SAMPLING:
+        ContextLogger.sampler = LogSampler.from_env()
     
     # 루트 로거 설정
     root_logger = logging.getLogger()
@@ -97,8 +626,11 @@ def setup_logging() -> None:
     # 핸들러 설정
     handlers = []
     
-    # 파일 핸들러
-    file_handler = logging.FileHandler(LOG_FILE)
+    # 파일 핸들러 (LOG_MAX_BYTES 또는 LOG_ROTATE_INTERVAL을 설정한 경우에만 회전·압축 핸들러 사용, 단일 프로세스 전용)
+    if LOG_MAX_BYTES or LOG_ROTATE_INTERVAL:
+        file_handler = RotatingCompressedFileHandler(LOG_FILE)
+    else:
+        file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
     file_handler.setFormatter(JSONFormatter())
     handlers.append(file_handler)
     
@@ -108,10 +640,17 @@ def setup_logging() -> None:
         console_handler.setFormatter(JSONFormatter())
         handlers.append(console_handler)
     
+    # 비동기 모드에서는 요청 경로에서 큐에 넣기만 하고 기록은 백그라운드 스레드가 담당
+    if LOG_ASYNC if async_mode is None else async_mode:
+        handlers = [start_async_logging(handlers)]
+    
     # 핸들러 적용
     for handler in handlers:
         root_logger.addHandler(handler)
 
+# 종료 시 큐에 남은 레코드 기록
+atexit.register(stop_async_logging)
+
 # 애플리케이션 시작 시 로깅 설정
 setup_logging()
 
@@ -124,8 +663,8 @@ async def log_api_request(request: Any, call_next: Any) -> Any:
     """API 요청 로깅 미들웨어"""
     logger = get_logger("api.middleware")
     
-    # 요청 시작 시간
-    start_time = datetime.utcnow()
+    # 요청 시작 시간 (단조 시계)
+    start_time = time.perf_counter()
     
     # 요청 정보 로깅
     logger.info(
@@ -145,7 +684,7 @@ async def log_api_request(request: Any, call_next: Any) -> Any:
         response = await call_next(request)
         
         # 요청 처리 시간
-        processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+        processing_time = (time.perf_counter() - start_time) * 1000
         
         # 응답 정보 로깅
         logger.info(
@@ -0,0 +1,414 @@
+"""
+지표(metrics) 모듈
+
+라우트별 지연 시간 히스토그램, 처리 중 요청 게이지, 오류 카운터와 캐시 히트율을 모아
+Prometheus 텍스트 형식(0.0.4)으로 내보냅니다. 요청당 기록은 미리 만들어 둔 라벨별 자식 지표에
+버킷 위치를 이분 탐색으로 찾아 카운트 하나를 올리는 정도로, 누적 합계는 수집 시점에 계산합니다.
+캐시 히트율처럼 이미 다른 곳에서 세고 있는 값은 수집기(collector)로 등록해 수집 시점에만 읽습니다.
+"""
+import os
+import time
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 지표 설정
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"  # false면 미들웨어를 등록하지 않음
+METRICS_PREFIX = os.getenv("METRICS_PREFIX", "keywordpulse")  # 지표 이름 접두사
+METRICS_LATENCY_BUCKETS = os.getenv(
+    "METRICS_LATENCY_BUCKETS", "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10"
+)  # 지연 시간 히스토그램 버킷 상한(초), 쉼표로 구분
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 수집기가 반환하는 형식: (이름, 유형, 설명, [(라벨 사전, 값), ...])
+MetricFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+def parse_buckets(spec: str) -> Tuple[float, ...]:
+    """
+    쉼표로 구분된 버킷 상한 문자열을 정렬된 튜플로 바꿉니다.
+
+    Args:
+        spec: "0.01,0.1,1" 형식의 문자열
+
+    Returns:
+        Tuple[float, ...]: 오름차순 버킷 상한 (+Inf는 자동으로 추가되므로 제외)
+
+    Raises:
+        ValueError: 숫자가 아니거나 버킷이 비어 있는 경우
+    """
+    buckets = sorted({float(part) for part in spec.split(",") if part.strip()})
+    buckets = [b for b in buckets if b != float("inf")]
+    if not buckets:
+        raise ValueError(f"히스토그램 버킷이 비어 있습니다: {spec!r}")
+    return tuple(buckets)
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items()) + "}"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+class _Metric(ABC):
+    """라벨 값 조합별 자식 지표를 관리하는 기반 클래스"""
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """라벨 값 조합 하나에 해당하는 자식 지표를 생성"""
+        ...
+
+    def labels(self, *values: str) -> Any:
+        """
+        라벨 값 조합에 해당하는 자식 지표를 반환합니다. (처음이면 생성)
+
+        Raises:
+            ValueError: 라벨 값 개수가 라벨 이름 개수와 다른 경우
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 라벨 {self.labelnames}에 값 {values}를 지정할 수 없습니다.")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _labeled_children(self) -> List[Tuple[Dict[str, str], Any]]:
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.labelnames, values)), child) for values, child in items]
+
+    @abstractmethod
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """노출할 (이름, 라벨, 값) 샘플 목록을 반환"""
+        ...
+
+    def clear(self) -> None:
+        """모든 자식 지표를 초기화 (주로 테스트용)"""
+        with self._lock:
+            self._children.clear()
+            if not self.labelnames:
+                self._children[()] = self._new_child()
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self, lock: threading.Lock):
+        self.value = 0.0
+        self._lock = lock
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    metric_type = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild(self._lock)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """라벨이 없는 카운터를 증가"""
+        self._children[()].inc(amount)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        return [(f"{self.name}_total", labels, child.value) for labels, child in self._labeled_children()]
+
+class _GaugeChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self, lock: threading.Lock):
+        self.value = 0.0
+        self._lock = lock
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+class Gauge(_Metric):
+    """증감 가능한 게이지"""
+    metric_type = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild(self._lock)
+
+    def set(self, value: float) -> None:
+        """라벨이 없는 게이지 값을 설정"""
+        self._children[()].set(value)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        return [(self.name, labels, child.value) for labels, child in self._labeled_children()]
+
+class _HistogramChild:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...], lock: threading.Lock):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = lock
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """누적 버킷 카운트, 합계, 개수를 일관된 시점으로 반환"""
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+        cumulative, running = [], 0
+        for c in counts:
+            running += c
+            cumulative.append(running)
+        return cumulative, total, count
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램 (버킷별 카운트는 누적하지 않고 저장하며 수집 시 누적)"""
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Optional[Sequence[float]] = None):
+        self.buckets = tuple(buckets) if buckets is not None else parse_buckets(METRICS_LATENCY_BUCKETS)
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets, self._lock)
+
+    def observe(self, value: float) -> None:
+        """라벨이 없는 히스토그램에 값을 기록"""
+        self._children[()].observe(value)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        result = []
+        bounds = list(self.buckets) + [float("inf")]
+        for labels, child in self._labeled_children():
+            cumulative, total, count = child.snapshot()
+            for bound, value in zip(bounds, cumulative):
+                result.append((f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, value))
+            result.append((f"{self.name}_sum", labels, total))
+            result.append((f"{self.name}_count", labels, count))
+        return result
+
+class MetricsRegistry:
+    """
+    지표와 수집기를 모아 Prometheus 텍스트 형식으로 출력하는 레지스트리
+    """
+
+    def __init__(self, prefix: str = METRICS_PREFIX):
+        self.prefix = prefix
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+    def _name(self, name: str) -> str:
+        return f"{self.prefix}_{name}" if self.prefix else name
+
+    def _register(self, metric: _Metric) -> Any:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                raise ValueError(f"이미 다른 형태로 등록된 지표입니다: {metric.name}")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """카운터를 등록하거나 같은 이름의 기존 카운터를 반환"""
+        return self._register(Counter(self._name(name), documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """게이지를 등록하거나 같은 이름의 기존 게이지를 반환"""
+        return self._register(Gauge(self._name(name), documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Optional[Sequence[float]] = None) -> Histogram:
+        """히스토그램을 등록하거나 같은 이름의 기존 히스토그램을 반환"""
+        return self._register(Histogram(self._name(name), documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        """
+        수집 시점에 호출되어 지표 묶음을 반환하는 함수를 등록합니다.
+
+        Args:
+            collector: (이름, 유형, 설명, [(라벨 사전, 값), ...]) 목록을 반환하는 함수.
+                이름에는 레지스트리 접두사가 붙습니다.
+        """
+        self._collectors.append(collector)
+
+    def register_cache(self, cache_name: str, stats_getter: Callable[[], Any]) -> None:
+        """
+        캐시 통계 객체(CacheStats 등 hits/misses 속성을 가진 객체)를 히트/미스 카운터와
+        히트율 게이지로 내보내도록 등록합니다.
+
+        Args:
+            cache_name: cache 라벨에 들어갈 캐시 이름
+            stats_getter: 수집 시점에 통계 객체를 반환하는 함수 (캐시 교체에 대응)
+        """
+        def collect() -> List[MetricFamily]:
+            stats = stats_getter()
+            labels = {"cache": cache_name}
+            hits = getattr(stats, "hits", 0)
+            misses = getattr(stats, "misses", 0)
+            total = hits + misses
+            return [
+                ("cache_hits", "counter", "캐시 히트 수", [(labels, hits)]),
+                ("cache_misses", "counter", "캐시 미스 수", [(labels, misses)]),
+                ("cache_hit_ratio", "gauge", "전체 조회 대비 캐시 히트 비율",
+                 [(labels, hits / total if total else 0.0)])
+            ]
+        self.register_collector(collect)
+
+    def render(self) -> str:
+        """
+        등록된 지표를 Prometheus 텍스트 형식으로 출력합니다.
+
+        Returns:
+            str: 텍스트 노출 형식(0.0.4) 문자열
+        """
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+
+        # 같은 이름의 지표 묶음은 수집기 여러 개에서 와도 HELP/TYPE을 한 번만 출력
+        families: Dict[str, Tuple[str, str, List[Tuple[Dict[str, str], float]]]] = {}
+        for collector in list(self._collectors):
+            try:
+                for name, metric_type, documentation, samples in collector():
+                    family = families.setdefault(self._name(name), (metric_type, documentation, []))
+                    family[2].extend(samples)
+            except Exception as e:
+                print(f"[metrics] 수집기 오류: {str(e)}")
+        for name, (metric_type, documentation, samples) in families.items():
+            sample_name = f"{name}_total" if metric_type == "counter" else name
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """모든 지표 값을 초기화 (주로 테스트용, 수집기는 유지)"""
+        for metric in self._metrics.values():
+            metric.clear()
+
+# 전역 지표 레지스트리
+metrics_registry = MetricsRegistry()
+
+http_request_duration = metrics_registry.histogram(
+    "http_request_duration_seconds", "라우트별 요청 처리 시간(초)", ("method", "route")
+)
+http_requests = metrics_registry.counter(
+    "http_requests", "라우트/상태 코드별 요청 수", ("method", "route", "status")
+)
+http_request_errors = metrics_registry.counter(
+    "http_request_errors", "5xx 응답 또는 처리되지 않은 예외로 끝난 요청 수", ("method", "route")
+)
+http_requests_in_flight = metrics_registry.gauge(
+    "http_requests_in_flight", "라우트별 처리 중인 요청 수", ("route",)
+)
+
+UNMATCHED_ROUTE = "unmatched"  # 라우트에 매칭되지 않은 요청 (경로별 라벨 폭증 방지)
+
+class MetricsMiddleware:
+    """
+    요청 지표를 기록하는 ASGI 미들웨어
+
+    BaseHTTPMiddleware를 거치지 않는 순수 ASGI 미들웨어라 요청/응답 객체를 새로 만들지 않습니다.
+    라벨에는 실제 경로 대신 라우트 경로 템플릿을 사용하며, 고정 경로는 사전 조회로,
+    경로 매개변수가 있는 라우트만 정규식으로 찾습니다.
+    """
+
+    def __init__(self, app: Any, clock: Callable[[], float] = time.perf_counter):
+        self.app = app
+        self.clock = clock
+        self._static_routes: Optional[Dict[str, str]] = None
+        self._param_routes: List[Tuple[Any, str]] = []
+
+    def _load_routes(self, scope: Dict[str, Any]) -> None:
+        self._static_routes = {}
+        for route in getattr(scope.get("app"), "routes", []):
+            path = getattr(route, "path", None)
+            regex = getattr(route, "path_regex", None)
+            if not path or regex is None:
+                continue
+            if "{" in path:
+                self._param_routes.append((regex, path))
+            else:
+                self._static_routes[path] = path
+
+    def resolve_route(self, scope: Dict[str, Any]) -> str:
+        """요청 경로에 해당하는 라우트 경로 템플릿 (없으면 unmatched)"""
+        if self._static_routes is None:
+            self._load_routes(scope)
+        path = scope.get("path", "")
+        route = self._static_routes.get(path)
+        if route is not None:
+            return route
+        for regex, template in self._param_routes:
+            if regex.match(path):
+                return template
+        return UNMATCHED_ROUTE
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        route = self.resolve_route(scope)
+        in_flight = http_requests_in_flight.labels(route)
+        status_code = 500
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight.inc()
+        start = self.clock()
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            status_code = 500
+            raise
+        finally:
+            elapsed = self.clock() - start
+            in_flight.dec()
+            http_request_duration.labels(method, route).observe(elapsed)
+            http_requests.labels(method, route, str(status_code)).inc()
+            if status_code >= 500:
+                http_request_errors.labels(method, route).inc()
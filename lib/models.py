@@ -4,11 +4,12 @@ API 모델 정의
 Pydantic 모델을 사용한 요청/응답 데이터 구조 정의
 """
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # 검색 API 모델
 class SearchRequest(BaseModel):
     keyword: str
+    profile: Optional[str] = None  # 점수화 프로필 이름 (없으면 기본 프로필)
 
 class KeywordInfo(BaseModel):
     keyword: str
@@ -20,6 +21,24 @@ class KeywordInfo(BaseModel):
 class SearchResponse(BaseModel):
     keywords: List[KeywordInfo]
     cached: bool
+    cacheAge: Optional[float] = None  # 캐시 항목의 나이(초)
+    stale: bool = False  # 백그라운드 갱신 중인 오래된 결과 여부
+
+# 일괄 검색 API 모델
+class BatchSearchRequest(BaseModel):
+    keywords: List[str]
+    profile: Optional[str] = None  # 점수화 프로필 이름 (없으면 기본 프로필)
+
+class BatchSearchItem(BaseModel):
+    keywords: List[KeywordInfo] = []
+    cached: bool = False
+    cacheAge: Optional[float] = None
+    stale: bool = False
+    error: Optional[str] = None  # 이 시드만 실패한 경우의 오류 메시지
+
+class BatchSearchResponse(BaseModel):
+    results: Dict[str, BatchSearchItem]  # 입력 시드별 결과
+    errorCount: int = 0
 
 # 분석 API 모델
 class AnalyzeRequest(BaseModel):
@@ -32,15 +51,29 @@ class AnalyzeResponse(BaseModel):
 class SyncRequest(BaseModel):
     keywords: List[KeywordInfo]
     timestamp: str  # ISO 8601
+    queued: bool = False  # True면 동기화 버퍼에 넣고 즉시 반환 (백그라운드 일괄 기록)
 
 class SyncResponse(BaseModel):
     success: bool
     spreadsheetUrl: Optional[str] = None
+    queued: bool = False
+    pendingRows: Optional[int] = None  # 버퍼에서 기록 대기 중인 행 수
 
 # 알림 API 모델
 class NotifyRequest(BaseModel):
     analysisText: str
+    queued: bool = False  # True면 발신 큐에 넣고 즉시 티켓 ID 반환
+    chatId: Optional[str] = None  # 대상 채팅 ID (없으면 TELEGRAM_CHAT_ID, 그 외에는 TELEGRAM_ALLOWED_CHAT_IDS에 있어야 함)
 
 class NotifyResponse(BaseModel):
     success: bool
-    messageId: Optional[str] = None 
\ No newline at end of file
+    messageId: Optional[str] = None  # 첫 번째 메시지 ID
+    messageIds: List[str] = []  # 길이 제한으로 나누어 전송한 경우 모든 메시지 ID (전송 순서)
+    ticketId: Optional[str] = None  # 발신 큐 티켓 ID (queued 요청일 때)
+
+class NotifyTicketResponse(BaseModel):
+    ticketId: str
+    status: str  # queued, sent, failed
+    attempts: int = 0
+    messageIds: List[str] = []
+    error: Optional[str] = None 
\ No newline at end of file
@@ -3,13 +3,22 @@ RAG (Retrieval-Augmented Generation) 엔진
 
 KeywordPulse의 키워드 분석 결과를 자연어 텍스트로 변환하는 RAG 시스템 핵심 모듈입니다.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+import os
 import time
 from lib.logger import get_logger
+from lib.tracing import traced
+from lib.categorizer import TaxonomyIndex
+from lib.cache import MemoryCache
+from lib.ranking import rank_top_k
 
 # 로거 인스턴스 생성
 logger = get_logger("rag_engine")
 
+# 분석 텍스트 생성 실패 시 반환하는 안내 문구
+ANALYSIS_ERROR_TEXT = "분석 중 오류가 발생했습니다. 다시 시도해 주세요."
+
+@traced("rag.generate_analysis")
 def generate_analysis_text(keywords: List[Dict[str, Any]]) -> str:
     """
     입력된 키워드 목록을 기반으로 분석 텍스트를 생성합니다.
@@ -21,6 +30,47 @@ def generate_analysis_text(keywords: List[Dict[str, Any]]) -> str:
     Returns:
         str: 마크다운 형식의 분석 텍스트
     """
+    try:
+        return "".join(iter_analysis_text(keywords))
+    except Exception as e:
+        _log_analysis_error(keywords, e)
+        return ANALYSIS_ERROR_TEXT
+
+def stream_analysis_text(keywords: List[Dict[str, Any]]) -> Iterator[str]:
+    """
+    분석 텍스트를 섹션 단위로 스트리밍합니다.
+    
+    iter_analysis_text와 같지만, 생성 도중 오류가 나면 이미 보낸 내용 뒤에
+    오류 안내 문구를 이어 보내고 끝냅니다. (응답 상태 코드를 바꿀 수 없는 스트리밍 응답용)
+    
+    Args:
+        keywords: 키워드 정보가 담긴 사전 리스트
+    
+    Yields:
+        str: 마크다운 텍스트 조각
+    """
+    try:
+        yield from iter_analysis_text(keywords)
+    except Exception as e:
+        _log_analysis_error(keywords, e)
+        yield f"\n\n{ANALYSIS_ERROR_TEXT}"
+
+def iter_analysis_text(keywords: List[Dict[str, Any]]) -> Iterator[str]:
+    """
+    분석 텍스트를 만들어지는 순서대로 섹션/줄 단위로 내보내는 제너레이터입니다.
+    
+    전체 보고서를 문자열 하나로 이어 붙이지 않으므로, 스트리밍 응답에서는 첫 섹션을 바로 보낼 수 있습니다.
+    이어 붙인 결과는 generate_analysis_text의 반환값과 같습니다.
+    
+    Args:
+        keywords: 키워드 정보가 담긴 사전 리스트
+    
+    Yields:
+        str: 마크다운 텍스트 조각
+    
+    Raises:
+        Exception: 키워드 데이터 처리 중 오류 발생 시
+    """
     # 시작 시간 기록
     start_time = time.time()
     
@@ -30,79 +80,76 @@ def generate_analysis_text(keywords: List[Dict[str, Any]]) -> str:
         context={"keyword_count": len(keywords)}
     )
     
-    try:
-        if not keywords:
-            logger.warning("분석할 키워드가 없음", context={"keywords": []})
-            return "분석할 키워드가 없습니다."
-        
-        # 점수 기준 상위 키워드 선별
-        top_keywords = sorted(keywords, key=lambda x: x.get('score', 0), reverse=True)[:5]
-        
-        # 로깅: 선별된 상위 키워드
-        logger.debug(
-            "상위 키워드 선별 완료", 
-            context={
-                "top_keywords": [kw.get('keyword') for kw in top_keywords],
-                "top_scores": [kw.get('score') for kw in top_keywords]
-            }
-        )
-        
-        # 분석 텍스트 생성
-        summary = ""
-        
-        # 서두
-        if top_keywords:
-            summary += f"이번 분석된 키워드 중 '{top_keywords[0]['keyword']}'는 가장 높은 추천 점수를 기록했습니다.\n\n"
-        
-        # 주요 키워드 목록
-        summary += "## 주요 키워드 분석\n\n"
-        for kw in top_keywords:
-            score = kw.get('score', 0)
-            recommendation = ""
-            
-            if score >= 80:
-                recommendation = "🟢 강력 추천"
-            elif score >= 50:
-                recommendation = "🟡 추천"
-            else:
-                recommendation = "⚪ 낮은 우선순위"
-            
-            summary += f"- **{kw['keyword']}**: 검색량 {kw.get('monthlySearches', 0):,}회, "
-            summary += f"경쟁률 {kw.get('competitionRate', 0):.2f}, "
-            summary += f"점수 {score}점 ({recommendation})\n"
-        
-        # 결론
-        high_score_keywords = [kw for kw in keywords if kw.get('score', 0) >= 80]
-        if high_score_keywords:
-            summary += "\n## 추천 전략\n\n"
-            summary += f"특히 점수가 80점 이상인 {len(high_score_keywords)}개 키워드는 "
-            summary += "콘텐츠 제작 우선순위로 고려하시길 권장합니다.\n"
-        
-        # 처리 시간 계산
-        elapsed_time = time.time() - start_time
+    if not keywords:
+        logger.warning("분석할 키워드가 없음", context={"keywords": []})
+        yield "분석할 키워드가 없습니다."
+        return
+    
+    # 점수 기준 상위 키워드 선별과 고득점 키워드 집계를 한 번에 처리
+    ranking = rank_top_k(keywords, k=5, thresholds=(80,))
+    top_keywords = ranking.top
+    
+    # 로깅: 선별된 상위 키워드 (DEBUG 레벨이 활성화된 경우에만 컨텍스트 생성)
+    logger.debug(
+        "상위 키워드 선별 완료", 
+        context=lambda: {
+            "top_keywords": [kw.get('keyword') for kw in top_keywords],
+            "top_scores": [kw.get('score') for kw in top_keywords]
+        }
+    )
+    
+    # 서두
+    if top_keywords:
+        yield f"이번 분석된 키워드 중 '{top_keywords[0]['keyword']}'는 가장 높은 추천 점수를 기록했습니다.\n\n"
+    
+    # 주요 키워드 목록
+    yield "## 주요 키워드 분석\n\n"
+    for kw in top_keywords:
+        score = kw.get('score', 0)
+        recommendation = ""
         
-        # 로깅: 분석 요청 완료
-        logger.info(
-            "키워드 분석 텍스트 생성 완료",
-            context={
-                "keyword_count": len(keywords),
-                "top_keyword": top_keywords[0]['keyword'] if top_keywords else None,
-                "high_score_count": len(high_score_keywords),
-                "processing_time_ms": round(elapsed_time * 1000, 2)
-            }
-        )
+        if score >= 80:
+            recommendation = "🟢 강력 추천"
+        elif score >= 50:
+            recommendation = "🟡 추천"
+        else:
+            recommendation = "⚪ 낮은 우선순위"
         
-        return summary
-    except Exception as e:
-        # 로깅: 분석 중 오류
-        logger.error(
-            "키워드 분석 텍스트 생성 중 오류 발생",
-            context={"keyword_count": len(keywords) if keywords else 0},
-            error=e
-        )
-        return "분석 중 오류가 발생했습니다. 다시 시도해 주세요."
+        yield (f"- **{kw['keyword']}**: 검색량 {kw.get('monthlySearches', 0):,}회, "
+               f"경쟁률 {kw.get('competitionRate', 0):.2f}, "
+               f"점수 {score}점 ({recommendation})\n")
+    
+    # 결론
+    high_score_count = ranking.count_at_least(80)
+    if high_score_count:
+        yield ("\n## 추천 전략\n\n"
+               f"특히 점수가 80점 이상인 {high_score_count}개 키워드는 "
+               "콘텐츠 제작 우선순위로 고려하시길 권장합니다.\n")
+    
+    # 처리 시간 계산
+    elapsed_time = time.time() - start_time
+    
+    # 로깅: 분석 요청 완료
+    logger.info(
+        "키워드 분석 텍스트 생성 완료",
+        context={
+            "keyword_count": len(keywords),
+            "top_keyword": top_keywords[0]['keyword'] if top_keywords else None,
+            "high_score_count": high_score_count,
+            "processing_time_ms": round(elapsed_time * 1000, 2)
+        }
+    )
+
+def _log_analysis_error(keywords: List[Dict[str, Any]], error: Exception) -> None:
+    # 로깅: 분석 중 오류
+    logger.error(
+        "키워드 분석 텍스트 생성 중 오류 발생",
+        context={"keyword_count": len(keywords) if keywords else 0},
+        error=error
+    )
 
 # LLM 기반 확장 가능성을 위한 인터페이스
+@traced("rag.generate_with_llm")
 def generate_with_llm(keywords: List[Dict[str, Any]], provider: str = "template") -> str:
     """
     LLM을 활용한 키워드 분석 텍스트 생성 (확장용)
@@ -159,8 +206,13 @@ def generate_with_llm(keywords: List[Dict[str, Any]], provider: str = "template"
         )
         return "LLM 분석 중 오류가 발생했습니다. 기본 템플릿을 사용해 주세요."
 
-# 키워드 카테고리 캐싱
-_keyword_category_cache = {}
+# 키워드 카테고리 캐싱 (LRU, 용량을 넘으면 가장 오래 사용되지 않은 키워드부터 퇴출)
+# 값은 (분류 표 버전, 카테고리)이며, 버전이 현재 분류 표와 다르면 캐시 미스로 처리
+CATEGORY_CACHE_MAX_ENTRIES = int(os.getenv("CATEGORY_CACHE_MAX_ENTRIES", "100000"))  # 카테고리 캐시 최대 항목 수
+category_cache = MemoryCache(max_entries=CATEGORY_CACHE_MAX_ENTRIES)
+
+# 분류 표 파일에서 만든 분류 엔진 (Aho-Corasick, 파일이 바뀌면 백그라운드에서 교체)
+category_taxonomy = TaxonomyIndex()
 
 def categorize_keyword(keyword: str) -> str:
     """
@@ -172,46 +224,70 @@ def categorize_keyword(keyword: str) -> str:
     Returns:
         str: 카테고리 이름 ('디지털 마케팅', 'AI 기술', '앱 개발' 등)
     """
-    # 캐시 확인
-    if keyword in _keyword_category_cache:
+    # 분류 표 파일 변경 확인 (주기마다 파일 정보만 확인, 교체는 백그라운드)
+    category_taxonomy.maybe_reload()
+    
+    # 캐시 확인 (분류 표 버전과 분류 엔진을 함께 읽어, 이전 분류 표의 결과는 사용하지 않음)
+    version, matcher = category_taxonomy.snapshot()
+    cached = category_cache.get(keyword)
+    if cached is not None and cached[0] == version:
         logger.debug(
             "키워드 카테고리 캐시 사용",
-            context={
+            context=lambda: {
                 "keyword": keyword,
-                "category": _keyword_category_cache[keyword]
+                "category": cached[1]
             }
         )
-        return _keyword_category_cache[keyword]
-    
-    # 소문자 변환 및 공백 제거
-    k = keyword.lower().strip()
-    
-    # 기본 카테고리
-    category = "일반"
+        return cached[1]
     
-    # 카테고리 분류 패턴
-    patterns = {
-        '디지털 마케팅': ['마케팅', 'seo', '광고', '콘텐츠', '퍼포먼스', '인플루언서', '바이럴', '브랜딩'],
-        'AI 기술': ['ai', '인공지능', '머신러닝', 'gpt', '딥러닝', '자연어', '신경망', '강화학습'],
-        '앱 개발': ['개발', '프로그래밍', '앱', 'app', '코딩', '소프트웨어', '웹', '모바일'],
-        '3D 모델링/AI': ['3d', '모델링', '블렌더', 'blender', '렌더링', '애니메이션', 'cg', '그래픽']
-    }
+    # 컴파일된 분류 엔진으로 매칭 (카테고리 표 순서상 처음 맞는 카테고리, 없으면 기본 카테고리)
+    category = matcher.categorize(keyword)
     
-    # 패턴 매칭
-    for cat, keywords in patterns.items():
-        if any(kw in k for kw in keywords):
-            category = cat
-            break
-    
-    # 캐시 저장
-    _keyword_category_cache[keyword] = category
+    # 캐시 저장 (그 사이 분류 표가 교체되어도 버전이 달라 다음 조회에서 미스로 처리됨)
+    category_cache.set(keyword, (version, category))
     
     logger.debug(
         "키워드 카테고리 분류 완료",
-        context={
+        context=lambda: {
             "keyword": keyword,
             "category": category
         }
     )
     
-    return category 
\ No newline at end of file
+    return category 
+
+def invalidate_category_cache() -> None:
+    """
+    카테고리 캐시를 비웁니다. 카테고리 표가 바뀌어 기존 분류 결과를 더 이상 쓸 수 없을 때 호출합니다.
+    """
+    category_cache.clear()
+    logger.info("키워드 카테고리 캐시 초기화", context={"max_entries": category_cache.max_entries})
+
+# 분류 표가 교체되면 이전 분류 결과를 버림
+category_taxonomy.add_listener(invalidate_category_cache)
+
+def get_category_cache_stats() -> Dict[str, Any]:
+    """
+    카테고리 캐시 지표를 반환합니다.
+    
+    Returns:
+        Dict: 항목 수, 최대 항목 수와 히트/미스/퇴출 카운터
+    """
+    return {"size": len(category_cache), "max_entries": category_cache.max_entries,
+            **category_cache.stats.to_dict()}
+
+def categorize_many(keywords: List[str]) -> List[str]:
+    """
+    여러 키워드를 한 번에 분류합니다.
+    
+    카탈로그 전체 분류처럼 대량 호출에 사용하며, 카테고리 캐시를 거치지 않아
+    요청 처리용 캐시를 밀어내지 않습니다.
+    
+    Args:
+        keywords: 분류할 키워드 문자열 리스트
+        
+    Returns:
+        List[str]: 입력 순서대로의 카테고리 이름
+    """
+    category_taxonomy.maybe_reload()
+    return category_taxonomy.matcher.categorize_many(keywords)
@@ -0,0 +1,81 @@
+"""
+키워드 순위 유틸리티
+
+점수 기준 상위 k개 선별과 점수 구간별 개수 집계를 키워드 목록을 한 번만 훑으며 처리합니다.
+크기 k의 최소 힙으로 O(n log k)에 상위 항목을 고르며, 점수가 같으면 입력 순서가 앞선 항목이
+먼저 오도록 하여 sorted(..., reverse=True)[:k]와 같은 결과를 냅니다.
+"""
+import heapq
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+@dataclass
+class RankingResult:
+    """상위 k개 키워드와 점수 구간별 개수"""
+    top: List[Dict[str, Any]]
+    total: int
+    thresholds: Tuple[float, ...]
+    # buckets[0]: 점수 < thresholds[0], buckets[i]: thresholds[i-1] <= 점수 < thresholds[i],
+    # buckets[-1]: 점수 >= thresholds[-1]
+    buckets: List[int]
+
+    def count_at_least(self, threshold: float) -> int:
+        """
+        점수가 threshold 이상인 키워드 수를 반환합니다.
+
+        Raises:
+            ValueError: 집계하지 않은 기준 점수인 경우
+        """
+        if threshold not in self.thresholds:
+            raise ValueError(f"집계하지 않은 기준 점수입니다: {threshold} (집계: {self.thresholds})")
+        return sum(self.buckets[self.thresholds.index(threshold) + 1:])
+
+def rank_top_k(keywords: Iterable[Dict[str, Any]], k: int = 5,
+               thresholds: Sequence[float] = (), key: str = "score") -> RankingResult:
+    """
+    점수 기준 상위 k개 키워드를 고르고, 기준 점수별 구간 개수를 함께 집계합니다.
+
+    Args:
+        keywords: 키워드 정보 사전들 (점수가 없으면 0으로 간주)
+        k: 고를 상위 키워드 수
+        thresholds: 구간을 나눌 기준 점수들 (예: (50, 80))
+        key: 점수 필드 이름
+
+    Returns:
+        RankingResult: 점수 내림차순 상위 k개(동점이면 입력 순서)와 구간별 개수
+    """
+    bounds = tuple(sorted(set(thresholds)))
+    buckets = [0] * (len(bounds) + 1)
+    heap: List[Tuple[Any, int, Dict[str, Any]]] = []
+    total = 0
+
+    items = iter(keywords)
+    if k > 0:
+        # 처음 k개로 힙을 채움
+        for kw in items:
+            score = kw.get(key, 0)
+            buckets[bisect_right(bounds, score)] += 1
+            heap.append((score, -total, kw))
+            total += 1
+            if total == k:
+                break
+        heapq.heapify(heap)
+
+    if heap:
+        # 힙의 최솟값(동점이면 가장 늦게 들어온 항목)보다 점수가 높을 때만 교체
+        floor = heap[0][0]
+        for kw in items:
+            score = kw.get(key, 0)
+            buckets[bisect_right(bounds, score)] += 1
+            if score > floor:
+                heapq.heapreplace(heap, (score, -total, kw))
+                floor = heap[0][0]
+            total += 1
+    else:
+        for kw in items:
+            buckets[bisect_right(bounds, kw.get(key, 0))] += 1
+            total += 1
+
+    heap.sort(reverse=True)
+    return RankingResult(top=[entry[2] for entry in heap], total=total, thresholds=bounds, buckets=buckets)
@@ -0,0 +1,313 @@
+"""
+키워드 점수화 엔진
+
+검색량과 경쟁률로 키워드 점수(0-100)와 추천 레이블을 계산합니다.
+단건 계산 함수와 함께, 전체 키워드 카탈로그를 재점수화할 때 사용하는
+열(column) 단위 일괄 계산 API를 제공합니다.
+
+점수 공식의 상수와 레이블 기준은 이름 있는 프로필(ScoringProfile)로 정의되며,
+시작 시 SCORING_PROFILES_PATH에서 한 번 읽어 검증/컴파일한 뒤 이름으로 조회합니다.
+
+NumPy가 설치되어 있으면 일괄 계산을 벡터 연산 한 번으로 처리하고,
+없으면 array 모듈 기반의 순수 파이썬 루프로 동일한 결과를 계산합니다.
+"""
+import json
+import os
+from array import array
+from dataclasses import dataclass, asdict, fields
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy는 선택 의존성
+    np = None
+
+# 점수화 프로필 설정 파일 경로 (JSON, 선택)
+SCORING_PROFILES_PATH = os.getenv("SCORING_PROFILES_PATH")
+
+LABEL_HIGH = "Highly Recommended"
+LABEL_MID = "Recommended"
+LABEL_LOW = "Low Priority"
+
+NumericColumn = Union[Sequence[float], "np.ndarray"]
+
+@dataclass(frozen=True)
+class ScoringProfile:
+    """
+    점수화 프로필
+
+    기본값은 기존 점수 공식과 같습니다:
+    검색량 10,000회 = 50점, 경쟁률 점수 50×(1−경쟁률), 레이블 기준 80/50점.
+    """
+    name: str = "default"
+    volume_baseline: float = 10000  # 검색량 점수가 만점이 되는 월간 검색량
+    volume_max_points: float = 50  # 검색량 점수 배점
+    competition_max_points: float = 50  # 경쟁률 점수 배점 (경쟁률이 낮을수록 유리)
+    high_threshold: int = 80  # "Highly Recommended" 기준 점수
+    mid_threshold: int = 50  # "Recommended" 기준 점수
+
+    def validate(self) -> None:
+        """
+        프로필 값을 검증합니다.
+
+        Raises:
+            ValueError: 값이 유효하지 않은 경우
+        """
+        if not self.name:
+            raise ValueError("프로필 이름이 비어 있습니다.")
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if field.name != "name" and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise ValueError(f"[{self.name}] {field.name}은 숫자여야 합니다: {value!r}")
+        if self.volume_baseline <= 0:
+            raise ValueError(f"[{self.name}] volume_baseline은 0보다 커야 합니다.")
+        if self.volume_max_points < 0 or self.competition_max_points < 0:
+            raise ValueError(f"[{self.name}] 배점은 0 이상이어야 합니다.")
+        if not 0 <= self.mid_threshold <= self.high_threshold <= 100:
+            raise ValueError(f"[{self.name}] 레이블 기준은 0 <= mid_threshold <= high_threshold <= 100 이어야 합니다.")
+
+class CompiledProfile:
+    """
+    검증을 마치고 컴파일된 점수화 프로필
+
+    프로필 상수는 점수 함수의 클로저 변수로 고정되고, 레이블은 0-100점 조회 테이블로
+    미리 계산되므로 반복문 안에서 설정을 다시 해석하거나 사전을 조회하지 않습니다.
+    """
+
+    def __init__(self, profile: ScoringProfile):
+        profile.validate()
+        self.profile = profile
+        self.name = profile.name
+        self.score: Callable[[int, float], int] = _compile_scorer(profile)
+        self.labels: Tuple[str, ...] = tuple(
+            _label_by_threshold(score, profile.high_threshold, profile.mid_threshold)
+            for score in range(101)
+        )
+
+    def label(self, score: int) -> str:
+        """점수(정수)의 추천 레이블을 조회 테이블에서 반환"""
+        return self.labels[max(0, min(100, score))]
+
+    def score_many(self, monthly_searches: NumericColumn, competition_rates: NumericColumn) -> Any:
+        """
+        여러 키워드의 점수를 한 번에 계산합니다.
+
+        결과는 같은 입력에 대한 score와 항상 동일합니다
+        (반올림은 파이썬 round와 같은 은행원 반올림을 사용).
+
+        Args:
+            monthly_searches: 월간 검색량 열 (NumPy 배열, array 또는 시퀀스)
+            competition_rates: 경쟁률 열 (monthly_searches와 같은 길이)
+
+        Returns:
+            NumPy 사용 시 int64 배열, 아니면 array('q')
+        """
+        if len(monthly_searches) != len(competition_rates):
+            raise ValueError("monthly_searches와 competition_rates의 길이가 다릅니다.")
+
+        if np is not None:
+            p = self.profile
+            volume = np.asarray(monthly_searches, dtype=np.float64)
+            competition = np.asarray(competition_rates, dtype=np.float64)
+            volume_score = np.minimum(p.volume_max_points, (volume / p.volume_baseline) * p.volume_max_points)
+            competition_score = p.competition_max_points * (1 - competition)
+            return np.clip(np.rint(volume_score + competition_score), 0, 100).astype(np.int64)
+
+        return array("q", map(self.score, monthly_searches, competition_rates))
+
+    def label_many(self, scores: NumericColumn) -> Union[List[str], "np.ndarray"]:
+        """
+        여러 점수(0-100 정수)의 추천 레이블을 한 번에 계산합니다.
+
+        Args:
+            scores: 점수 열
+
+        Returns:
+            NumPy 사용 시 문자열 배열, 아니면 문자열 리스트
+        """
+        if np is not None:
+            table = np.array(self.labels)
+            return table[np.clip(np.asarray(scores, dtype=np.int64), 0, 100)]
+
+        labels = self.labels
+        return [labels[score if 0 <= score <= 100 else (0 if score < 0 else 100)] for score in scores]
+
+    def score_and_label_many(self, monthly_searches: NumericColumn,
+                             competition_rates: NumericColumn) -> Tuple[Any, Any]:
+        """
+        점수와 추천 레이블을 한 번에 계산합니다.
+
+        Args:
+            monthly_searches: 월간 검색량 열
+            competition_rates: 경쟁률 열
+
+        Returns:
+            Tuple: (점수 열, 레이블 열)
+        """
+        scores = self.score_many(monthly_searches, competition_rates)
+        return scores, self.label_many(scores)
+
+def _compile_scorer(profile: ScoringProfile) -> Callable[[int, float], int]:
+    baseline = profile.volume_baseline
+    volume_max = profile.volume_max_points
+    competition_max = profile.competition_max_points
+
+    def score(monthly_searches: int, competition_rate: float) -> int:
+        volume_score = min(volume_max, (monthly_searches / baseline) * volume_max)
+        competition_score = competition_max * (1 - competition_rate)
+        return max(0, min(100, round(volume_score + competition_score)))
+
+    return score
+
+def _label_by_threshold(score: float, high_threshold: int, mid_threshold: int) -> str:
+    if score >= high_threshold:
+        return LABEL_HIGH
+    elif score >= mid_threshold:
+        return LABEL_MID
+    return LABEL_LOW
+
+# 기본 프로필 (기존 점수 공식)
+DEFAULT_PROFILE = CompiledProfile(ScoringProfile())
+
+# 이름별 컴파일된 프로필 레지스트리
+_profiles: Dict[str, CompiledProfile] = {DEFAULT_PROFILE.name: DEFAULT_PROFILE}
+
+def register_profile(profile: ScoringProfile) -> CompiledProfile:
+    """
+    프로필을 검증/컴파일하여 레지스트리에 등록합니다.
+
+    Args:
+        profile: 등록할 프로필
+
+    Returns:
+        CompiledProfile: 컴파일된 프로필
+
+    Raises:
+        ValueError: 프로필 값이 유효하지 않은 경우
+    """
+    compiled = CompiledProfile(profile)
+    _profiles[profile.name] = compiled
+    return compiled
+
+def load_profiles(path: str) -> List[CompiledProfile]:
+    """
+    JSON 파일에서 프로필들을 읽어 등록합니다.
+
+    파일 형식: {"프로필 이름": {"volume_baseline": 5000, "high_threshold": 75, ...}, ...}
+    지정하지 않은 필드는 기본 프로필 값을 사용합니다.
+
+    Args:
+        path: 프로필 JSON 파일 경로
+
+    Returns:
+        List[CompiledProfile]: 등록된 프로필 목록
+
+    Raises:
+        ValueError: 파일 형식이나 프로필 값이 유효하지 않은 경우
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("프로필 파일은 이름을 키로 하는 JSON 객체여야 합니다.")
+
+    field_types = {field.name: field.type for field in fields(ScoringProfile) if field.name != "name"}
+    profiles = []
+    for name, values in data.items():
+        if name == DEFAULT_PROFILE.name:
+            raise ValueError(f"기본 프로필({name})은 재정의할 수 없습니다.")
+        if not isinstance(values, dict):
+            raise ValueError(f"[{name}] 프로필 값은 JSON 객체여야 합니다.")
+        unknown = set(values) - set(field_types)
+        if unknown:
+            raise ValueError(f"[{name}] 알 수 없는 프로필 필드: {', '.join(sorted(unknown))}")
+        profiles.append(ScoringProfile(name=name, **{
+            key: _coerce_number(name, key, value, field_types[key]) for key, value in values.items()
+        }))
+
+    # 모두 검증한 뒤에 등록 (일부만 등록되는 것 방지)
+    compiled = [CompiledProfile(profile) for profile in profiles]
+    for profile in compiled:
+        _profiles[profile.name] = profile
+    return compiled
+
+def _coerce_number(profile: str, field: str, value: Any, field_type: type) -> Union[int, float]:
+    """
+    JSON 값을 프로필 필드 타입(float 또는 int)으로 변환합니다.
+
+    Raises:
+        ValueError: 숫자가 아니거나, 정수 필드에 소수 값이 온 경우
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"[{profile}] {field}은 숫자여야 합니다: {value!r}")
+    if field_type is int:
+        if not float(value).is_integer():
+            raise ValueError(f"[{profile}] {field}은 정수여야 합니다: {value!r}")
+        return int(value)
+    return float(value)
+
+def get_profile(name: Optional[str] = None) -> CompiledProfile:
+    """
+    이름으로 컴파일된 프로필을 반환합니다.
+
+    Args:
+        name: 프로필 이름 (None이면 기본 프로필)
+
+    Returns:
+        CompiledProfile: 컴파일된 프로필
+
+    Raises:
+        ValueError: 등록되지 않은 프로필인 경우
+    """
+    if name is None:
+        return DEFAULT_PROFILE
+    try:
+        return _profiles[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 점수화 프로필: {name}")
+
+def list_profiles() -> Dict[str, Dict[str, Any]]:
+    """등록된 프로필 설정을 반환"""
+    return {name: asdict(compiled.profile) for name, compiled in _profiles.items()}
+
+def score_one(monthly_searches: int, competition_rate: float) -> int:
+    """
+    기본 프로필로 키워드 하나의 점수를 계산합니다.
+
+    Args:
+        monthly_searches: 월간 검색량
+        competition_rate: 경쟁률 (0~1 사이 값)
+
+    Returns:
+        int: 0-100 사이의 점수
+    """
+    return DEFAULT_PROFILE.score(monthly_searches, competition_rate)
+
+def label_one(score: int) -> str:
+    """
+    기본 프로필로 점수 하나의 추천 레이블을 반환합니다.
+
+    Args:
+        score: 키워드 점수 (0-100)
+
+    Returns:
+        str: 추천 레이블
+    """
+    profile = DEFAULT_PROFILE.profile
+    return _label_by_threshold(score, profile.high_threshold, profile.mid_threshold)
+
+def score_many(monthly_searches: NumericColumn, competition_rates: NumericColumn) -> Any:
+    """기본 프로필로 여러 키워드의 점수를 한 번에 계산 (CompiledProfile.score_many 참고)"""
+    return DEFAULT_PROFILE.score_many(monthly_searches, competition_rates)
+
+def label_many(scores: NumericColumn) -> Union[List[str], "np.ndarray"]:
+    """기본 프로필로 여러 점수의 추천 레이블을 한 번에 계산 (CompiledProfile.label_many 참고)"""
+    return DEFAULT_PROFILE.label_many(scores)
+
+def score_and_label_many(monthly_searches: NumericColumn,
+                         competition_rates: NumericColumn) -> Tuple[Any, Any]:
+    """기본 프로필로 점수와 추천 레이블을 한 번에 계산 (CompiledProfile.score_and_label_many 참고)"""
+    return DEFAULT_PROFILE.score_and_label_many(monthly_searches, competition_rates)
+
+# 애플리케이션 시작 시 프로필 로드
+if SCORING_PROFILES_PATH:
+    load_profiles(SCORING_PROFILES_PATH)
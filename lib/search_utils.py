@@ -3,9 +3,67 @@
 
 키워드 검색, 점수화, 정규화 기능을 제공하는 모듈입니다.
 """
+import os
 import random
-from typing import List, Dict, Any, Optional
+import asyncio
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Set, Union
 
+from lib.cache import CacheBackend, create_cache, normalize_key
+from lib.singleflight import SingleFlight
+from lib.scoring import CompiledProfile, score_one, label_one
+from lib.tracing import traced, span, bind_context
+
+# 검색 결과 캐시 설정
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "3600"))  # 하드 TTL: 이후에는 새 검색을 기다림
+SEARCH_CACHE_SOFT_TTL = float(os.getenv("SEARCH_CACHE_SOFT_TTL", "600"))  # 소프트 TTL: 이후에는 캐시를 반환하며 백그라운드 갱신
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1024"))
+SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+SEARCH_CACHE_PATH = os.getenv("SEARCH_CACHE_PATH")  # 설정 시 SQLite 공유 캐시 사용
+
+# 일괄 검색 설정
+SEARCH_BATCH_CONCURRENCY = int(os.getenv("SEARCH_BATCH_CONCURRENCY", "8"))
+SEARCH_BATCH_MAX_SEEDS = int(os.getenv("SEARCH_BATCH_MAX_SEEDS", "1000"))
+
+search_cache: CacheBackend = create_cache(
+    max_entries=SEARCH_CACHE_MAX_ENTRIES,
+    max_bytes=SEARCH_CACHE_MAX_BYTES,
+    default_ttl=SEARCH_CACHE_TTL,
+    shared_path=SEARCH_CACHE_PATH
+)
+
+# 동일 키워드 동시 검색 병합기
+search_flight = SingleFlight()
+
+# stale-while-revalidate 백그라운드 갱신 태스크 (GC 방지용 참조 보관)
+_refresh_tasks: Set["asyncio.Task[None]"] = set()
+
+@dataclass
+class SWRStats:
+    """stale-while-revalidate 카운터"""
+    stale_served: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """카운터를 사전 형태로 반환"""
+        return {
+            "stale_served": self.stale_served,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors
+        }
+
+swr_stats = SWRStats()
+
+@dataclass
+class SearchResult:
+    """캐시 정보가 포함된 검색 결과"""
+    keywords: List[Dict[str, Any]]
+    cached: bool
+    age: Optional[float] = None  # 캐시 항목의 나이(초), 신규 검색이면 None
+    stale: bool = False  # 소프트 TTL이 지나 백그라운드 갱신 중인 결과인지 여부
+
+@traced("search.fetch")
 def search_keywords(keyword: str) -> List[Dict[str, Any]]:
     """
     입력된 키워드에 대한 연관 키워드를 검색합니다.
@@ -53,6 +111,8 @@ def calculate_score(monthly_searches: int, competition_rate: float) -> int:
     """
     검색량과 경쟁률을 기반으로 키워드 점수를 계산합니다.
     
+    여러 키워드를 한 번에 계산할 때는 lib.scoring.score_many를 사용하세요.
+    
     Args:
         monthly_searches: 월간 검색량
         competition_rate: 경쟁률 (0~1 사이 값)
@@ -60,55 +120,230 @@ def calculate_score(monthly_searches: int, competition_rate: float) -> int:
     Returns:
         int: 0-100 사이의 점수
     """
-    # 검색량 정규화 (10,000회를 50점 기준으로)
-    volume_score = min(50, (monthly_searches / 10000) * 50)
-    
-    # 경쟁률 점수 (낮을수록 유리)
-    competition_score = 50 * (1 - competition_rate)
-    
-    # 최종 점수 계산 및 반올림
-    final_score = round(volume_score + competition_score)
-    
-    # 0-100 범위 제한
-    return max(0, min(100, final_score))
+    return score_one(monthly_searches, competition_rate)
 
 def get_recommendation_label(score: int) -> str:
     """
     점수에 따른 추천 레이블을 반환합니다.
     
+    여러 점수를 한 번에 계산할 때는 lib.scoring.label_many를 사용하세요.
+    
     Args:
         score: 키워드 점수 (0-100)
     
     Returns:
         str: 추천 레이블
     """
-    if score >= 80:
-        return "Highly Recommended"
-    elif score >= 50:
-        return "Recommended"
-    else:
-        return "Low Priority"
+    return label_one(score)
+
+@traced("search.score")
+def apply_scoring_profile(keywords: List[Dict[str, Any]],
+                          profile: CompiledProfile) -> List[Dict[str, Any]]:
+    """
+    검색 결과를 지정한 점수화 프로필로 다시 점수화합니다.
+    
+    검색량과 경쟁률은 프로필과 무관하므로 캐시된 결과를 그대로 재사용하고
+    점수와 추천 레이블만 새로 계산합니다. 원본 리스트는 수정하지 않습니다.
+    
+    Args:
+        keywords: 검색 결과 (기본 프로필 기준)
+        profile: 적용할 컴파일된 프로필
+    
+    Returns:
+        List[Dict]: 점수와 추천 레이블이 바뀐 새 결과 리스트
+    """
+    score = profile.score
+    label = profile.label
+    rescored = []
+    for kw in keywords:
+        new_score = score(kw["monthlySearches"], kw["competitionRate"])
+        rescored.append({**kw, "score": new_score, "recommendation": label(new_score)})
+    return rescored
 
 def get_cached_results(keyword: str) -> Optional[List[Dict[str, Any]]]:
     """
     캐시된 검색 결과가 있는지 확인합니다.
     
+    키워드는 normalize_key로 정규화되므로 대소문자와 공백 차이는 같은 항목으로 취급됩니다.
+    
     Args:
         keyword: 검색 키워드
     
     Returns:
         Optional[List[Dict]]: 캐시된 결과 또는 None
     """
-    # TODO: 캐시 시스템 구현 (Redis, DB, 파일 등)
-    return None  # 현재는 캐싱 없음
+    return search_cache.get(normalize_key(keyword))
 
-def save_to_cache(keyword: str, results: List[Dict[str, Any]]) -> None:
+def save_to_cache(keyword: str, results: List[Dict[str, Any]], ttl: Optional[float] = None) -> None:
     """
     검색 결과를 캐시에 저장합니다.
     
     Args:
         keyword: 검색 키워드
         results: 검색 결과
+        ttl: (선택) 이 키워드에만 적용할 TTL(초), 없으면 SEARCH_CACHE_TTL 사용
+    """
+    search_cache.set(normalize_key(keyword), results, ttl=ttl)
+
+async def search_keywords_coalesced(keyword: str) -> List[Dict[str, Any]]:
+    """
+    동일 키워드에 대한 동시 검색을 하나의 search_keywords 호출로 병합합니다.
+    
+    정규화된 키워드가 같은 호출자들은 진행 중인 검색 하나를 함께 기다리며,
+    검색은 이벤트 루프를 막지 않도록 스레드 풀에서 실행된 뒤 캐시에 저장됩니다.
+    
+    Args:
+        keyword: 검색 키워드
+    
+    Returns:
+        List[Dict]: 관련 키워드 정보를 담은 사전 리스트
+    """
+    async def compute() -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        # 실행기 스레드에서도 현재 추적 구간에 이어지도록 컨텍스트를 넘김
+        results = await loop.run_in_executor(None, bind_context(search_keywords, keyword))
+        save_to_cache(keyword, results)
+        return results
+    
+    return await search_flight.do(normalize_key(keyword), compute)
+
+@traced("search.get_results")
+async def get_search_results(keyword: str) -> SearchResult:
+    """
+    stale-while-revalidate 정책으로 검색 결과를 반환합니다.
+    
+    - 소프트 TTL 이내의 캐시: 그대로 반환
+    - 소프트 TTL 이후, 하드 TTL 이내의 캐시: 즉시 반환하고 백그라운드에서 갱신
+    - 캐시 없음(하드 TTL 경과 포함): 병합된 신규 검색 결과를 기다려 반환
+    
+    Args:
+        keyword: 검색 키워드
+    
+    Returns:
+        SearchResult: 검색 결과와 캐시 여부, 나이, stale 여부
+    """
+    with span("search.cache_lookup"):
+        result = lookup_cached_results(keyword)
+    if result is not None:
+        return result
+    
+    results = await search_keywords_coalesced(keyword)
+    return SearchResult(keywords=results, cached=False)
+
+def lookup_cached_results(keyword: str) -> Optional[SearchResult]:
+    """
+    캐시에서 검색 결과를 조회합니다 (stale-while-revalidate 적용).
+    
+    소프트 TTL이 지난 항목이면 백그라운드 갱신을 예약하며,
+    이 경우 실행 중인 이벤트 루프 안에서 호출해야 합니다.
+    
+    Args:
+        keyword: 검색 키워드
+    
+    Returns:
+        Optional[SearchResult]: 캐시된 결과 또는 None
+    """
+    entry = search_cache.get_entry(normalize_key(keyword))
+    if entry is None:
+        return None
+    
+    age = entry.age(search_cache.clock())
+    stale = age >= SEARCH_CACHE_SOFT_TTL
+    if stale:
+        swr_stats.stale_served += 1
+        schedule_refresh(keyword)
+    return SearchResult(keywords=entry.value, cached=True, age=age, stale=stale)
+
+@traced("search.batch")
+async def search_many(keywords: List[str],
+                      max_concurrency: Optional[int] = None) -> Dict[str, Union[SearchResult, Exception]]:
+    """
+    여러 시드 키워드를 한 번에 검색합니다.
+    
+    정규화 기준으로 중복을 제거한 뒤 캐시 히트는 즉시 응답하고,
+    미스는 최대 max_concurrency개씩 동시에 검색합니다.
+    개별 시드의 오류는 해당 시드의 결과(Exception)로만 반환되며 전체 일괄 처리를 실패시키지 않습니다.
+    
+    Args:
+        keywords: 시드 키워드 목록
+        max_concurrency: (선택) 동시 검색 수, 없으면 SEARCH_BATCH_CONCURRENCY 사용
+    
+    Returns:
+        Dict[str, Union[SearchResult, Exception]]: 입력 시드별 결과 또는 예외
+    """
+    seeds_by_key: Dict[str, List[str]] = {}
+    for seed in keywords:
+        seeds_by_key.setdefault(normalize_key(seed), []).append(seed)
+    
+    results_by_key: Dict[str, Union[SearchResult, Exception]] = {}
+    misses: List[str] = []
+    for key, seeds in seeds_by_key.items():
+        if not key:
+            results_by_key[key] = ValueError("빈 키워드는 검색할 수 없습니다.")
+            continue
+        cached = lookup_cached_results(seeds[0])
+        if cached is not None:
+            results_by_key[key] = cached
+        else:
+            misses.append(key)
+    
+    semaphore = asyncio.Semaphore(max_concurrency or SEARCH_BATCH_CONCURRENCY)
+    
+    async def search_one(key: str) -> None:
+        try:
+            async with semaphore:
+                keywords_data = await search_keywords_coalesced(seeds_by_key[key][0])
+            results_by_key[key] = SearchResult(keywords=keywords_data, cached=False)
+        except Exception as e:
+            print(f"[search_utils] 일괄 검색 오류: {seeds_by_key[key][0]} - {str(e)}")
+            results_by_key[key] = e
+    
+    await asyncio.gather(*[search_one(key) for key in misses])
+    
+    return {
+        seed: results_by_key[key]
+        for key, seeds in seeds_by_key.items()
+        for seed in seeds
+    }
+
+def schedule_refresh(keyword: str) -> bool:
+    """
+    키워드 검색 결과를 백그라운드에서 갱신하도록 예약합니다.
+    
+    같은 키워드의 검색이 이미 진행 중이면 예약하지 않습니다.
+    실행 중인 이벤트 루프 안에서 호출해야 합니다.
+    
+    Args:
+        keyword: 검색 키워드
+    
+    Returns:
+        bool: 갱신 예약 여부
+    """
+    if search_flight.is_running(normalize_key(keyword)):
+        return False
+    
+    async def refresh() -> None:
+        try:
+            await search_keywords_coalesced(keyword)
+        except Exception as e:
+            swr_stats.refresh_errors += 1
+            print(f"[search_utils] 백그라운드 갱신 오류: {keyword} - {str(e)}")
+    
+    swr_stats.refreshes += 1
+    task = asyncio.ensure_future(refresh())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+    return True
+
+def get_search_metrics() -> Dict[str, Any]:
+    """
+    검색 캐시와 요청 병합 지표를 반환합니다.
+    
+    Returns:
+        Dict: 캐시 카운터와 병합 카운터 (coalesced: 병합되어 검색을 생략한 호출 수)
     """
-    # TODO: 캐시 저장 구현
-    pass 
\ No newline at end of file
+    return {
+        "cache": search_cache.stats.to_dict(),
+        "singleflight": {**search_flight.stats.to_dict(), "in_flight": search_flight.in_flight()},
+        "swr": swr_stats.to_dict()
+    }
@@ -0,0 +1,233 @@
+"""
+Google Sheets 동기화 버퍼
+
+/api/sync 요청의 키워드 행을 메모리에 모아 두었다가 행 수 또는 시간 기준에 도달하면
+백그라운드 워커가 최대 SHEETS_SYNC_MAX_ROWS개씩의 append 호출로 Sheets에 기록합니다.
+기록에 실패한 행은 로컬 파일(JSON Lines)에 내려 두고, 다음 플러시에서 새 행보다 먼저 다시 기록합니다.
+보관 파일은 조각 기록이 성공할 때마다 남은 행만 남도록 줄여, 긴 장애 뒤에도 요청 크기 제한을 넘지 않습니다.
+프로세스 시작 시 보관 파일에 행이 남아 있으면 start()로 워커를 띄워 다시 기록합니다.
+"""
+import os
+import json
+import time
+import asyncio
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from lib.google_client import keywords_to_rows, save_rows_to_sheet
+
+# 동기화 버퍼 설정
+SHEETS_SYNC_MAX_ROWS = int(os.getenv("SHEETS_SYNC_MAX_ROWS", "500"))  # 이 행 수가 쌓이면 즉시 플러시 (append 1회 최대 행 수)
+SHEETS_SYNC_FLUSH_INTERVAL = float(os.getenv("SHEETS_SYNC_FLUSH_INTERVAL", "5"))  # 첫 행 이후 최대 대기 시간(초)
+SHEETS_SYNC_SPILL_PATH = os.getenv("SHEETS_SYNC_SPILL_PATH", os.path.join("data", "sheets_sync_spill.jsonl"))
+SHEETS_SYNC_SPREADSHEET_ID = os.getenv("SHEETS_SYNC_SPREADSHEET_ID")
+
+WriteFunc = Callable[[List[List[Any]]], str]
+
+@dataclass
+class SyncBufferStats:
+    """동기화 버퍼 카운터"""
+    accepted: int = 0  # 접수한 동기화 요청 수
+    buffered_rows: int = 0  # 접수한 전체 행 수
+    written_rows: int = 0
+    flushes: int = 0  # 성공한 Sheets 기록 횟수
+    failed_flushes: int = 0
+    spilled_rows: int = 0  # 현재 디스크에 내려 둔 행 수
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+class SheetSyncBuffer:
+    """
+    배치 기록용 Google Sheets 동기화 버퍼
+
+    add()는 행을 버퍼에 넣고 즉시 반환하며, 워커 태스크가 max_rows 또는 flush_interval 기준으로
+    누적된 행을 max_rows개 이하의 조각으로 나누어 기록합니다. 블로킹 gspread 호출은 실행기 스레드에서 수행합니다.
+    하나의 이벤트 루프 안에서 사용해야 합니다.
+    """
+
+    def __init__(self, write: Optional[WriteFunc] = None,
+                 max_rows: int = SHEETS_SYNC_MAX_ROWS,
+                 flush_interval: float = SHEETS_SYNC_FLUSH_INTERVAL,
+                 spill_path: str = SHEETS_SYNC_SPILL_PATH,
+                 clock: Callable[[], float] = time.monotonic):
+        self.write = write or _write_to_sheet
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.spill_path = spill_path
+        self.clock = clock
+        self.stats = SyncBufferStats(spilled_rows=len(self._read_spill()))
+        self.last_url: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self._rows: List[List[Any]] = []
+        self._first_at: Optional[float] = None
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._worker: Optional["asyncio.Task[None]"] = None
+        self._closing = False
+
+    def add(self, keywords: List[Dict[str, Any]], timestamp: str) -> int:
+        """
+        키워드 분석 결과를 버퍼에 넣고 즉시 반환합니다.
+
+        실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+        Args:
+            keywords: 키워드 정보 리스트
+            timestamp: 분석 시간 (ISO 8601 형식)
+
+        Returns:
+            int: 기록 대기 중인 전체 행 수
+        """
+        rows = keywords_to_rows(keywords, timestamp)
+        self._rows.extend(rows)
+        self.stats.accepted += 1
+        self.stats.buffered_rows += len(rows)
+        if self._first_at is None:
+            self._first_at = self.clock()
+
+        self._ensure_worker()
+        if len(self._rows) >= self.max_rows:
+            self._wakeup.set()
+        return self.pending()
+
+    def start(self) -> None:
+        """
+        디스크에 내려 둔 행이 있으면 워커를 시작해 flush_interval 뒤에 다시 기록합니다.
+
+        애플리케이션 시작 시 실행 중인 이벤트 루프 안에서 호출합니다.
+        """
+        if self.stats.spilled_rows:
+            print(f"[sheets_sync] 보관된 {self.stats.spilled_rows}개 행 재기록 예약")
+            self._ensure_worker()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._wakeup = asyncio.Event()
+            self._worker = asyncio.ensure_future(self._run())
+
+    def pending(self) -> int:
+        """기록 대기 중인 행 수 (디스크에 내려 둔 행 포함)"""
+        return len(self._rows) + self.stats.spilled_rows
+
+    def get_stats(self) -> Dict[str, Any]:
+        """버퍼 상태와 기록 지표 반환"""
+        return {**self.stats.to_dict(), "pending": self.pending(),
+                "lastUrl": self.last_url, "lastError": self.last_error}
+
+    async def flush(self) -> bool:
+        """
+        디스크에 내려 둔 행과 버퍼의 행을 순서대로 max_rows개 이하의 조각으로 나누어 기록합니다.
+
+        조각 기록이 성공할 때마다 보관 파일에서 기록한 행을 덜어 내므로, 도중에 실패하면
+        아직 기록하지 않은 행만 디스크에 남습니다.
+
+        Returns:
+            bool: 기록 성공 여부 (실패한 조각부터의 행은 디스크에 보관)
+
+        Raises:
+            asyncio.CancelledError: 기록 도중 취소된 경우 (행은 디스크에 보관한 뒤 다시 발생)
+        """
+        async with self._flush_lock:
+            loop = asyncio.get_running_loop()
+            # 보관 파일 입출력은 이벤트 루프를 막지 않도록 실행기 스레드에서 수행
+            spilled = await loop.run_in_executor(None, self._read_spill) if self.stats.spilled_rows else []
+            rows = spilled + self._rows
+            self._rows = []
+            self._first_at = None
+            if not rows:
+                return True
+
+            chunk_size = max(1, self.max_rows)
+            written = 0
+            while written < len(rows):
+                chunk = rows[written:written + chunk_size]
+                try:
+                    url = await loop.run_in_executor(None, self.write, chunk)
+                except asyncio.CancelledError:
+                    # 기록 결과를 알 수 없으므로 행을 보관해 두고 다음 실행에서 다시 기록 (중복 가능)
+                    self._write_spill(rows[written:])
+                    print(f"[sheets_sync] 기록 중 취소, {len(rows) - written}개 행을 디스크에 보관")
+                    raise
+                except Exception as e:
+                    await loop.run_in_executor(None, self._write_spill, rows[written:])
+                    self.stats.failed_flushes += 1
+                    self.last_error = str(e)
+                    # 다음 재시도까지 flush_interval만큼 대기
+                    if self._first_at is None:
+                        self._first_at = self.clock()
+                    print(f"[sheets_sync] 시트 기록 실패, {len(rows) - written}개 행을 디스크에 보관: {str(e)}")
+                    return False
+
+                written += len(chunk)
+                if self.stats.spilled_rows:
+                    # 기록한 조각만큼 보관 파일을 줄임 (보관된 행을 다 기록했으면 삭제)
+                    await loop.run_in_executor(None, self._write_spill, spilled[written:])
+                self.stats.flushes += 1
+                self.stats.written_rows += len(chunk)
+                self.last_url = url
+
+            self.last_error = None
+            return True
+
+    async def stop(self) -> None:
+        """
+        워커에 종료를 알리고 진행 중인 기록이 끝나기를 기다린 뒤,
+        남은 행과 보관된 행을 마지막으로 기록 (실패 시 디스크에 보관)
+        """
+        self._closing = True
+        try:
+            if self._worker is not None:
+                self._wakeup.set()
+                await asyncio.gather(self._worker, return_exceptions=True)
+                self._worker = None
+            if self._rows or self.stats.spilled_rows:
+                await self.flush()
+        finally:
+            self._closing = False
+
+    async def _run(self) -> None:
+        while not self._closing and (self._rows or self.stats.spilled_rows):
+            first_at = self._first_at if self._first_at is not None else self.clock()
+            delay = first_at + self.flush_interval - self.clock()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+            if self._closing:
+                # 마지막 기록은 stop()이 수행
+                break
+            self._wakeup.clear()
+            await self.flush()
+
+    def _read_spill(self) -> List[List[Any]]:
+        if not os.path.exists(self.spill_path):
+            return []
+        with open(self.spill_path, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _write_spill(self, rows: List[List[Any]]) -> None:
+        """보관 파일을 원자적으로 교체 (빈 리스트면 삭제)"""
+        if not rows:
+            if os.path.exists(self.spill_path):
+                os.remove(self.spill_path)
+            self.stats.spilled_rows = 0
+            return
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.spill_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.spill_path)
+        self.stats.spilled_rows = len(rows)
+
+def _write_to_sheet(rows: List[List[Any]]) -> str:
+    return save_rows_to_sheet(rows, SHEETS_SYNC_SPREADSHEET_ID)
+
+# 애플리케이션 공용 동기화 버퍼
+sheet_sync_buffer = SheetSyncBuffer()
@@ -0,0 +1,70 @@
+"""
+요청 병합(single-flight) 모듈
+
+같은 키에 대한 동시 비동기 호출을 하나의 실행으로 합쳐,
+먼저 도착한 호출의 결과를 나머지 호출자들이 함께 기다리도록 합니다.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+@dataclass
+class SingleFlightStats:
+    """실행/병합 카운터"""
+    executions: int = 0
+    coalesced: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """카운터를 사전 형태로 반환"""
+        return {"executions": self.executions, "coalesced": self.coalesced}
+
+class SingleFlight:
+    """
+    키 단위 요청 병합기
+
+    실행은 별도 태스크로 진행되므로 먼저 도착한 호출자가 취소되더라도
+    다른 호출자들은 결과를 정상적으로 받습니다. 실행이 끝나면 키가 해제되어
+    다음 호출은 새로 실행됩니다. 하나의 이벤트 루프 안에서 사용해야 합니다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, "asyncio.Future[Any]"] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        key에 대한 실행이 진행 중이면 그 결과를 기다리고, 아니면 fn을 실행합니다.
+
+        Args:
+            key: 병합 기준 키
+            fn: 실행할 코루틴 함수 (인자 없음)
+
+        Returns:
+            fn의 실행 결과 (예외도 모든 호출자에게 전달됨)
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done, key=key: self._release(key, done))
+            self.stats.executions += 1
+        else:
+            self.stats.coalesced += 1
+        return await asyncio.shield(task)
+
+    def is_running(self, key: str) -> bool:
+        """key에 대한 실행이 진행 중인지 확인"""
+        return key in self._calls
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 실행 수"""
+        return len(self._calls)
+
+    def _release(self, key: str, task: "asyncio.Future[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 모든 호출자가 취소된 경우에도 예외 미확인 경고가 나지 않도록 조회
+        if not task.cancelled():
+            task.exception()
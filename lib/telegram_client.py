@@ -2,15 +2,292 @@
 Telegram 알림 클라이언트
 
 텔레그램 봇을 통한 메시지 전송 기능을 제공합니다.
+비동기 클라이언트는 연결 풀(keep-alive)을 가진 HTTP 세션을 호출 간에 재사용하며,
+기존 동기 호출자를 위한 래퍼는 백그라운드 이벤트 루프에서 같은 클라이언트를 실행합니다.
 """
 import os
-import requests
-from typing import Dict, Any, Optional
+import asyncio
+import bisect
+import threading
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
+
+import aiohttp
+
+from lib.tracing import traced
+from lib.ranking import rank_top_k
+
+# 텔레그램 API 설정
+TELEGRAM_API_BASE = os.getenv("TELEGRAM_API_BASE", "https://api.telegram.org")
+TELEGRAM_CONNECT_TIMEOUT = float(os.getenv("TELEGRAM_CONNECT_TIMEOUT", "3"))
+TELEGRAM_READ_TIMEOUT = float(os.getenv("TELEGRAM_READ_TIMEOUT", "10"))
+TELEGRAM_POOL_SIZE = int(os.getenv("TELEGRAM_POOL_SIZE", "10"))
+TELEGRAM_KEEPALIVE_TIMEOUT = float(os.getenv("TELEGRAM_KEEPALIVE_TIMEOUT", "30"))
+TELEGRAM_MESSAGE_LIMIT = 4096  # 텔레그램 메시지 최대 길이
+
+# 메시지 분할 시 짝이 맞아야 하는 Markdown 기호 (링크 [텍스트](URL)는 조각 사이에서 나누지 않음)
+_MARKDOWN_MARKERS = ("*", "_", "`")
+# 분할 지점에서 열린 기호를 닫고 다음 조각에서 다시 열 여유 공간
+_MARKER_RESERVE = 2 * len(_MARKDOWN_MARKERS)
+
+class TelegramAPIError(Exception):
+    """
+    텔레그램 API 오류
+
+    Attributes:
+        status: HTTP 상태 코드 또는 텔레그램 error_code (네트워크 오류면 None)
+        retry_after: 429 응답의 재시도 대기 시간(초)
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None,
+                 retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+class AsyncTelegramClient:
+    """
+    연결 풀을 사용하는 비동기 텔레그램 봇 클라이언트
+
+    aiohttp 세션은 첫 호출 시 생성되어 이후 호출에서 재사용됩니다.
+    세션은 생성된 이벤트 루프에 묶이므로 이벤트 루프마다 하나씩 유지합니다.
+    """
+
+    def __init__(self, bot_token: str, chat_id: str, api_base: str = TELEGRAM_API_BASE,
+                 connect_timeout: float = TELEGRAM_CONNECT_TIMEOUT,
+                 read_timeout: float = TELEGRAM_READ_TIMEOUT,
+                 pool_size: int = TELEGRAM_POOL_SIZE):
+        self.bot_token = bot_token
+        self.chat_id = chat_id
+        self.api_base = api_base.rstrip("/")
+        self.timeout = aiohttp.ClientTimeout(total=None, connect=connect_timeout,
+                                             sock_read=read_timeout)
+        self.pool_size = pool_size
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = \
+            weakref.WeakKeyDictionary()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size,
+                                             keepalive_timeout=TELEGRAM_KEEPALIVE_TIMEOUT)
+            session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._sessions[loop] = session
+        return session
+
+    async def call(self, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        텔레그램 봇 API 메서드를 호출합니다.
+
+        Args:
+            method: API 메서드 이름 (예: 'sendMessage')
+            payload: 요청 JSON 데이터
+
+        Returns:
+            Dict: 텔레그램 API 응답
+
+        Raises:
+            TelegramAPIError: API 오류, 네트워크 오류 또는 타임아웃 발생 시
+        """
+        session = await self._get_session()
+        url = f"{self.api_base}/bot{self.bot_token}/{method}"
+        try:
+            async with session.post(url, json=payload) as response:
+                try:
+                    data = await response.json(content_type=None)
+                except ValueError:
+                    data = {"ok": False, "description": await response.text()}
+                if response.status >= 400 or not data.get("ok", False):
+                    retry_after = (data.get("parameters") or {}).get("retry_after")
+                    print(f"[telegram_client] 응답 데이터: {data}")
+                    raise TelegramAPIError(
+                        f"텔레그램 메시지 전송 실패: {response.status} {data.get('description', '')}",
+                        status=data.get("error_code", response.status),
+                        retry_after=retry_after
+                    )
+                return data
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"[telegram_client] 메시지 전송 오류: {repr(e)}")
+            raise TelegramAPIError(f"텔레그램 메시지 전송 실패: {repr(e)}")
+
+    async def send_message(self, message: str, chat_id: Optional[str] = None,
+                           parse_mode: Optional[str] = "Markdown") -> Dict[str, Any]:
+        """
+        메시지를 전송합니다.
+
+        Args:
+            message: 전송할 메시지 내용
+            chat_id: (선택) 대상 채팅 ID, 없으면 클라이언트 기본값 사용
+            parse_mode: 메시지 파싱 모드
+
+        Returns:
+            Dict: 텔레그램 API 응답
+        """
+        payload = {"chat_id": chat_id or self.chat_id, "text": message}
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
+        return await self.call("sendMessage", payload)
+
+    async def send_long_message(self, message: str, chat_id: Optional[str] = None,
+                                parse_mode: Optional[str] = "Markdown") -> List[Dict[str, Any]]:
+        """
+        메시지 길이 제한을 넘는 메시지를 나누어 순서대로 전송합니다.
+
+        조각들은 같은 keep-alive 연결에서 차례로 전송되므로 채팅에 표시되는 순서가 유지됩니다.
+
+        Args:
+            message: 전송할 메시지 내용
+            chat_id: (선택) 대상 채팅 ID
+            parse_mode: 메시지 파싱 모드
+
+        Returns:
+            List[Dict]: 조각별 텔레그램 API 응답 (전송 순서)
+        """
+        responses = []
+        for chunk in split_message(message):
+            responses.append(await self.send_message(chunk, chat_id=chat_id, parse_mode=parse_mode))
+        return responses
+
+    async def close(self) -> None:
+        """
+        모든 이벤트 루프에서 만든 HTTP 세션 종료
+
+        세션은 자신이 만들어진 루프에서 닫아야 하므로, 다른 스레드에서 실행 중인 루프
+        (동기 래퍼의 백그라운드 루프 등)의 세션은 해당 루프에 종료를 맡기고 기다립니다.
+        이미 멈춘 루프의 세션은 닫을 수 없으므로 목록에서 제거하고 경고만 남깁니다.
+        """
+        current = asyncio.get_running_loop()
+        sessions = list(self._sessions.items())
+        self._sessions.clear()
+        for loop, session in sessions:
+            if session.closed:
+                continue
+            if loop is current:
+                await session.close()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                print(f"[telegram_client] 경고: 멈춘 이벤트 루프의 세션은 종료할 수 없습니다: {loop!r}")
+
+# (api_base, bot_token, chat_id) 별 공유 클라이언트
+_clients: Dict[Tuple[str, str, str], AsyncTelegramClient] = {}
+_clients_lock = threading.Lock()
+
+# 동기 래퍼용 백그라운드 이벤트 루프
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+def get_telegram_client() -> Optional[AsyncTelegramClient]:
+    """
+    환경변수 설정으로 공유 텔레그램 클라이언트를 반환합니다.
+
+    Returns:
+        Optional[AsyncTelegramClient]: 클라이언트 또는 None (환경변수 없음, 테스트 모드)
+    """
+    bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
+    chat_id = os.getenv('TELEGRAM_CHAT_ID')
+    if not bot_token or not chat_id:
+        return None
+
+    key = (TELEGRAM_API_BASE, bot_token, chat_id)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = AsyncTelegramClient(bot_token, chat_id, api_base=TELEGRAM_API_BASE)
+            _clients[key] = client
+        return client
+
+def is_chat_allowed(chat_id: Optional[str]) -> bool:
+    """
+    요청에서 지정한 채팅 ID로 전송해도 되는지 확인합니다.
+
+    지정하지 않았거나 TELEGRAM_CHAT_ID와 같으면 허용하고, 그 외에는
+    TELEGRAM_ALLOWED_CHAT_IDS 환경변수(쉼표 구분 목록)에 있는 채팅만 허용합니다.
+
+    Args:
+        chat_id: 요청한 대상 채팅 ID
+
+    Returns:
+        bool: 전송 허용 여부
+    """
+    if not chat_id or chat_id == os.getenv('TELEGRAM_CHAT_ID'):
+        return True
+    allowed = os.getenv('TELEGRAM_ALLOWED_CHAT_IDS', '')
+    return chat_id in {item.strip() for item in allowed.split(',') if item.strip()}
+
+def _test_mode_response() -> Dict[str, Any]:
+    print("[telegram_client] 경고: TELEGRAM_BOT_TOKEN 또는 TELEGRAM_CHAT_ID 환경변수가 설정되지 않았습니다. 테스트 모드로 전환합니다.")
+    # 테스트 모드: 가상 응답 반환
+    return {
+        "ok": True,
+        "result": {
+            "message_id": 12345,
+            "from": {"id": 0, "is_bot": True, "first_name": "TestBot"},
+            "chat": {"id": -1, "type": "group"},
+            "date": 1622548800,
+            "text": "테스트 메시지가 전송되었습니다."
+        }
+    }
+
+@traced("telegram.send")
+async def send_telegram_message_async(message: str, chat_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    텔레그램 봇을 통해 메시지를 비동기로 전송합니다.
+    
+    Args:
+        message: 전송할 메시지 내용
+        chat_id: (선택) 대상 채팅 ID, 없으면 TELEGRAM_CHAT_ID 환경변수 사용
+    
+    Returns:
+        Dict: 텔레그램 API 응답
+    
+    Raises:
+        TelegramAPIError: 텔레그램 API 오류 발생 시
+    """
+    client = get_telegram_client()
+    if client is None:
+        return _test_mode_response()
+    return await client.send_message(message, chat_id=chat_id)
+
+@traced("telegram.send_long")
+async def send_long_telegram_message_async(message: str,
+                                           chat_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    길이 제한을 넘는 메시지를 Markdown이 깨지지 않게 나누어 순서대로 전송합니다.
+    
+    Args:
+        message: 전송할 메시지 내용
+        chat_id: (선택) 대상 채팅 ID, 없으면 TELEGRAM_CHAT_ID 환경변수 사용
+    
+    Returns:
+        List[Dict]: 조각별 텔레그램 API 응답 (전송 순서)
+    
+    Raises:
+        TelegramAPIError: 텔레그램 API 오류 발생 시
+    """
+    client = get_telegram_client()
+    if client is None:
+        return [_test_mode_response() for _ in split_message(message)]
+    return await client.send_long_message(message, chat_id=chat_id)
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None or _sync_loop.is_closed():
+            _sync_loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=_sync_loop.run_forever,
+                                      name="telegram-client-loop", daemon=True)
+            thread.start()
+        return _sync_loop
 
 def send_telegram_message(message: str) -> Dict[str, Any]:
     """
     텔레그램 봇을 통해 메시지를 전송합니다.
     
+    기존 동기 호출자를 위한 래퍼로, 백그라운드 이벤트 루프에서 공유 비동기 클라이언트를
+    실행하므로 호출 간 연결이 재사용됩니다. 비동기 코드에서는 send_telegram_message_async를 사용하세요.
+    
     Args:
         message: 전송할 메시지 내용
     
@@ -18,50 +295,139 @@ def send_telegram_message(message: str) -> Dict[str, Any]:
         Dict: 텔레그램 API 응답
     
     Raises:
-        ValueError: 환경변수가 설정되지 않은 경우
-        Exception: 텔레그램 API 오류 발생 시
+        TelegramAPIError: 텔레그램 API 오류 발생 시
     """
-    # 환경변수에서 봇 토큰 및 채팅 ID 가져오기
-    bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-    chat_id = os.getenv('TELEGRAM_CHAT_ID')
+    if get_telegram_client() is None:
+        return _test_mode_response()
+    future = asyncio.run_coroutine_threadsafe(send_telegram_message_async(message), _get_sync_loop())
+    return future.result()
+
+async def close_telegram_clients() -> None:
+    """
+    공유 클라이언트 세션을 모두 종료합니다.
+
+    현재 이벤트 루프뿐 아니라 동기 래퍼의 백그라운드 루프 등 다른 루프에서 만든 세션도 닫습니다.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+    for client in clients:
+        await client.close()
+        
+def split_message(message: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> List[str]:
+    """
+    메시지를 텔레그램 길이 제한 이하의 조각으로 나눕니다.
     
-    if not bot_token or not chat_id:
-        print("[telegram_client] 경고: TELEGRAM_BOT_TOKEN 또는 TELEGRAM_CHAT_ID 환경변수가 설정되지 않았습니다. 테스트 모드로 전환합니다.")
-        # 테스트 모드: 가상 응답 반환
-        return {
-            "ok": True,
-            "result": {
-                "message_id": 12345,
-                "from": {"id": 0, "is_bot": True, "first_name": "TestBot"},
-                "chat": {"id": -1, "type": "group"},
-                "date": 1622548800,
-                "text": "테스트 메시지가 전송되었습니다."
-            }
-        }
+    줄 단위로 나누므로 목록 항목은 한 조각 안에 유지되며, 한 줄이 제한보다 긴 경우에만
+    *굵게*, _기울임_, `코드` 구간과 [링크](URL) 바깥의 공백에서 줄을 나눕니다. 그래도 구간을
+    끊어야 하면 조각 끝에서 기호를 닫고 다음 조각 앞에서 다시 엽니다. (링크는 앞에서 나눔)
     
-    # 텔레그램 API URL
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    Args:
+        message: 원본 메시지
+        limit: 조각당 최대 길이
     
-    # 메시지 데이터
-    payload = {
-        'chat_id': chat_id,
-        'text': message,
-        'parse_mode': 'Markdown'
-    }
+    Returns:
+        List[str]: 메시지 조각 목록 (원본이 제한 이하면 원본 하나)
+    """
+    if len(message) <= limit:
+        return [message]
     
-    try:
-        # API 요청 전송
-        response = requests.post(url, json=payload)
-        response.raise_for_status()  # 4xx, 5xx 오류 시 예외 발생
-        
-        return response.json()
+    budget = limit - _MARKER_RESERVE
+    chunks: List[str] = []
+    current = ""
+    for line in message.split("\n"):
+        for piece in (_split_line(line, budget) if len(line) > budget else [line]):
+            candidate = piece if not current else f"{current}\n{piece}"
+            if len(candidate) <= budget:
+                current = candidate
+            else:
+                chunks.append(current)
+                current = piece
+    chunks.append(current)
     
-    except requests.exceptions.RequestException as e:
-        print(f"[telegram_client] 메시지 전송 오류: {str(e)}")
-        if response := getattr(e, 'response', None):
-            print(f"[telegram_client] 응답 데이터: {response.text}")
-        raise Exception(f"텔레그램 메시지 전송 실패: {str(e)}")
-        
+    chunks = [chunk.strip("\n") for chunk in chunks]
+    return _rebalance_markers([chunk for chunk in chunks if chunk.strip()])
+
+def _scan_markers(text: str, on_space: Optional[List[int]] = None,
+                  links: Optional[List[Tuple[int, int]]] = None) -> List[str]:
+    """
+    text의 Markdown 기호 짝을 추적하여 끝에서 닫히지 않은 기호 목록을 반환합니다.
+    
+    on_space가 주어지면 모든 기호가 닫혀 있고 링크 바깥인 공백 위치를 기록하고,
+    links가 주어지면 [텍스트](URL) 링크의 (시작, 끝) 위치를 기록합니다.
+    """
+    open_markers: List[str] = []
+    escaped = False
+    link_start: Optional[int] = None
+    in_url = False
+    for index, char in enumerate(text):
+        if escaped:
+            escaped = False
+        elif in_url:
+            # URL 안의 기호는 일반 문자
+            if char == ")":
+                in_url = False
+                if links is not None:
+                    links.append((link_start, index + 1))
+                link_start = None
+        elif char == "\\":
+            escaped = True
+        elif char == "[" and link_start is None and "`" not in open_markers:
+            link_start = index
+        elif char == "]" and link_start is not None:
+            if text[index + 1:index + 2] == "(":
+                in_url = True
+            else:
+                link_start = None
+        elif char in _MARKDOWN_MARKERS:
+            if open_markers and open_markers[-1] == char:
+                open_markers.pop()
+            elif "`" in open_markers:
+                # 코드 구간 안의 다른 기호는 일반 문자
+                continue
+            elif char not in open_markers:
+                open_markers.append(char)
+        elif char == " " and on_space is not None and not open_markers and link_start is None:
+            on_space.append(index)
+    return open_markers
+
+def _split_line(line: str, budget: int) -> List[str]:
+    """긴 한 줄을 Markdown 구간 바깥의 공백 위치에서 우선 분할"""
+    safe_spaces: List[int] = []
+    links: List[Tuple[int, int]] = []
+    _scan_markers(line, on_space=safe_spaces, links=links)
+    
+    pieces = []
+    start = 0
+    while len(line) - start > budget:
+        end = start + budget
+        position = bisect.bisect_right(safe_spaces, end) - 1
+        cut = safe_spaces[position] if position >= 0 and safe_spaces[position] > start else None
+        if cut is None:
+            # 안전한 분할 지점이 없으면 제한 안의 마지막 공백(없으면 길이 기준)에서 자름
+            cut = line.rfind(" ", start + 1, end + 1)
+            if cut <= start:
+                cut = end
+            # 링크는 다시 열 수 없으므로 링크 안이면 링크 앞에서 자름 (링크가 제한보다 길면 그대로)
+            for link_start, link_end in links:
+                if link_start < cut < link_end and link_start > start:
+                    cut = link_start
+                    break
+        pieces.append(line[start:cut])
+        start = cut + 1 if line[cut:cut + 1] == " " else cut
+    pieces.append(line[start:])
+    return pieces
+
+def _rebalance_markers(chunks: List[str]) -> List[str]:
+    """조각 경계에서 끊긴 Markdown 기호를 닫고 다음 조각에서 다시 엽니다."""
+    balanced = []
+    carry: List[str] = []
+    for chunk in chunks:
+        chunk = "".join(carry) + chunk
+        carry = _scan_markers(chunk)
+        balanced.append(chunk + "".join(reversed(carry)))
+    return balanced
+
+@traced("telegram.format")
 def format_keywords_message(keywords: list, analysis_text: Optional[str] = None) -> str:
     """
     키워드 목록을 텔레그램 메시지 형식으로 포맷팅합니다.
@@ -80,7 +446,7 @@ def format_keywords_message(keywords: list, analysis_text: Optional[str] = None)
     message = "*KeywordPulse 키워드 분석 결과*\n\n"
     
     # 상위 5개 키워드만 추출
-    top_keywords = sorted(keywords, key=lambda x: x.get('score', 0), reverse=True)[:5]
+    top_keywords = rank_top_k(keywords, k=5).top
     
     for kw in top_keywords:
         message += f"• *{kw.get('keyword', '')}*: "
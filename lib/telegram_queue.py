@@ -0,0 +1,371 @@
+"""
+텔레그램 발신 큐
+
+텔레그램의 채팅별/전체 전송 속도 제한을 지키며 메시지를 순서대로 전송하는 발신 큐입니다.
+채팅 ID별 토큰 버킷으로 전송 시점을 조절하고, 429 응답의 retry_after(봇 전체에 적용)와 지수 백오프로 재시도하며,
+짧은 간격으로 쌓인 작은 메시지들은 하나의 메시지로 합쳐 전송합니다.
+길이 제한을 넘는 메시지는 split_message로 나누어 조각마다 토큰을 얻어 순서대로 전송합니다.
+"""
+import os
+import time
+import uuid
+import asyncio
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from lib.telegram_client import (
+    TelegramAPIError, send_telegram_message_async, split_message, TELEGRAM_MESSAGE_LIMIT
+)
+
+# 발신 큐 설정
+TELEGRAM_CHAT_RATE = float(os.getenv("TELEGRAM_CHAT_RATE", "1"))  # 채팅별 초당 전송 수
+TELEGRAM_CHAT_BURST = int(os.getenv("TELEGRAM_CHAT_BURST", "3"))
+TELEGRAM_GLOBAL_RATE = float(os.getenv("TELEGRAM_GLOBAL_RATE", "30"))  # 봇 전체 초당 전송 수
+TELEGRAM_GLOBAL_BURST = int(os.getenv("TELEGRAM_GLOBAL_BURST", "30"))
+TELEGRAM_MAX_RETRIES = int(os.getenv("TELEGRAM_MAX_RETRIES", "5"))
+TELEGRAM_BACKOFF_BASE = float(os.getenv("TELEGRAM_BACKOFF_BASE", "0.5"))
+TELEGRAM_BACKOFF_MAX = float(os.getenv("TELEGRAM_BACKOFF_MAX", "30"))
+TELEGRAM_COALESCE_MAX_CHARS = int(os.getenv("TELEGRAM_COALESCE_MAX_CHARS", "1000"))  # 합칠 수 있는 메시지 최대 길이
+TELEGRAM_TICKET_HISTORY = int(os.getenv("TELEGRAM_TICKET_HISTORY", "10000"))
+
+COALESCE_SEPARATOR = "\n\n"
+
+SendFunc = Callable[[str, str], Awaitable[Dict[str, Any]]]
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한기
+
+    초당 rate개씩 토큰이 채워지며 최대 capacity개까지 쌓입니다.
+    """
+
+    def __init__(self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.clock = clock
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def wait_time(self) -> float:
+        """토큰 하나를 쓸 수 있을 때까지 남은 시간(초), 지금 가능하면 0"""
+        now = self.clock()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self) -> None:
+        """토큰 하나 사용 (wait_time이 0일 때 호출)"""
+        self._refill(self.clock())
+        self.tokens -= 1
+
+    def is_idle(self) -> bool:
+        """차단되지 않았고 토큰이 가득 차서 새 버킷과 같은 상태인지 여부"""
+        now = self.clock()
+        if now < self.blocked_until:
+            return False
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+    def block(self, seconds: float) -> None:
+        """서버가 지정한 시간 동안 전송을 막고 토큰을 비움"""
+        now = self.clock()
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens = 0.0
+        self.updated = self.blocked_until
+
+@dataclass
+class NotificationTicket:
+    """발신 큐에 넣은 메시지의 처리 상태"""
+    ticket_id: str
+    chat_id: str
+    text: str
+    enqueued_at: float
+    status: str = "queued"  # queued, sent, failed, cancelled
+    attempts: int = 0
+    message_ids: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    sent_at: Optional[float] = None
+    done: Optional["asyncio.Future[NotificationTicket]"] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 사전 반환"""
+        return {
+            "ticketId": self.ticket_id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "messageIds": self.message_ids,
+            "error": self.error
+        }
+
+@dataclass
+class OutboxStats:
+    """발신 큐 카운터"""
+    enqueued: int = 0
+    sent: int = 0
+    failed: int = 0
+    cancelled: int = 0  # 큐 중지로 전송하지 못한 메시지 수
+    sends: int = 0  # 실제 API 전송 횟수
+    coalesced: int = 0  # 다른 메시지에 합쳐져 전송된 메시지 수
+    retries: int = 0
+    rate_limited: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    def record_latency(self, seconds: float) -> None:
+        self.latency_total += seconds
+        self.latency_max = max(self.latency_max, seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        done = self.sent + self.failed + self.cancelled
+        return {
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "sends": self.sends,
+            "coalesced": self.coalesced,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "latency_avg_ms": round(self.latency_total / done * 1000, 2) if done else 0.0,
+            "latency_max_ms": round(self.latency_max * 1000, 2)
+        }
+
+class TelegramOutbox:
+    """
+    속도 제한을 지키는 텔레그램 발신 큐
+
+    채팅 ID마다 워커 태스크 하나가 큐를 순서대로 비우며, 채팅별 버킷과 전체 버킷에서
+    토큰을 얻은 뒤 전송합니다. 토큰을 기다리는 동안 쌓인 작은 메시지들은 한 번에 합쳐 보냅니다.
+    큐를 다 비운 채팅의 큐와 워커는 바로 정리하고, 버킷은 토큰이 다시 가득 찬 뒤에 정리합니다.
+    처리 중인 티켓은 큐에 있는 동안만 따로 보관하고, 끝난 티켓은 최근 TELEGRAM_TICKET_HISTORY개만 남깁니다.
+    하나의 이벤트 루프 안에서 사용해야 합니다.
+    """
+
+    def __init__(self, send: Optional[SendFunc] = None,
+                 chat_rate: float = TELEGRAM_CHAT_RATE, chat_burst: int = TELEGRAM_CHAT_BURST,
+                 global_rate: float = TELEGRAM_GLOBAL_RATE, global_burst: int = TELEGRAM_GLOBAL_BURST,
+                 max_retries: int = TELEGRAM_MAX_RETRIES, backoff_base: float = TELEGRAM_BACKOFF_BASE,
+                 backoff_max: float = TELEGRAM_BACKOFF_MAX,
+                 coalesce_max_chars: int = TELEGRAM_COALESCE_MAX_CHARS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.send = send or _send_via_client
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.global_bucket = TokenBucket(global_rate, global_burst, clock=clock)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.coalesce_max_chars = coalesce_max_chars
+        self.clock = clock
+        self.stats = OutboxStats()
+        self._queues: Dict[str, Deque[NotificationTicket]] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._workers: Dict[str, "asyncio.Task[None]"] = {}
+        self._pending: Dict[str, NotificationTicket] = {}
+        self._tickets: "OrderedDict[str, NotificationTicket]" = OrderedDict()
+
+    def enqueue(self, text: str, chat_id: Optional[str] = None) -> NotificationTicket:
+        """
+        메시지를 발신 큐에 넣고 즉시 티켓을 반환합니다.
+
+        실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+        Args:
+            text: 전송할 메시지
+            chat_id: (선택) 대상 채팅 ID, 없으면 TELEGRAM_CHAT_ID 환경변수 사용
+
+        Returns:
+            NotificationTicket: 처리 상태를 추적할 티켓
+        """
+        chat_id = chat_id or os.getenv("TELEGRAM_CHAT_ID") or "default"
+        ticket = NotificationTicket(
+            ticket_id=uuid.uuid4().hex,
+            chat_id=chat_id,
+            text=text,
+            enqueued_at=self.clock(),
+            done=asyncio.get_running_loop().create_future()
+        )
+        self._pending[ticket.ticket_id] = ticket
+        self._queues.setdefault(chat_id, deque()).append(ticket)
+        self.stats.enqueued += 1
+
+        worker = self._workers.get(chat_id)
+        if worker is None or worker.done():
+            self._workers[chat_id] = asyncio.ensure_future(self._run_chat(chat_id))
+        return ticket
+
+    def get_ticket(self, ticket_id: str) -> Optional[NotificationTicket]:
+        """티켓 ID로 처리 상태 조회"""
+        return self._pending.get(ticket_id) or self._tickets.get(ticket_id)
+
+    async def wait(self, ticket: NotificationTicket) -> NotificationTicket:
+        """티켓 처리가 끝날 때까지 대기"""
+        return await asyncio.shield(ticket.done)
+
+    def depth(self) -> int:
+        """전송 대기 중인 메시지 수"""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """큐 깊이와 전송 지표 반환"""
+        return {**self.stats.to_dict(), "depth": self.depth(), "chats": len(self._queues)}
+
+    async def stop(self) -> None:
+        """
+        워커 태스크를 모두 중지합니다.
+
+        대기 중인 메시지는 전송하지 않고 티켓을 cancelled 상태로 끝내며, 버린 메시지 수를 기록합니다.
+        """
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+
+        dropped = 0
+        for queue in self._queues.values():
+            while queue:
+                ticket = queue.popleft()
+                self._finish(ticket, "cancelled", message_ids=ticket.message_ids,
+                             error="발신 큐가 중지되어 전송하지 않았습니다.")
+                dropped += 1
+        self._queues.clear()
+        if dropped:
+            print(f"[telegram_queue] 발신 큐 중지: 전송하지 못한 메시지 {dropped}건")
+
+    def _remember(self, ticket: NotificationTicket) -> None:
+        """끝난 티켓을 기록에 추가하고 가장 오래된 기록부터 버려 크기를 제한"""
+        self._tickets[ticket.ticket_id] = ticket
+        while len(self._tickets) > TELEGRAM_TICKET_HISTORY:
+            self._tickets.popitem(last=False)
+
+    def _bucket(self, chat_id: str) -> TokenBucket:
+        bucket = self._buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self.chat_rate, self.chat_burst, clock=self.clock)
+            self._buckets[chat_id] = bucket
+        return bucket
+
+    async def _acquire(self, bucket: TokenBucket) -> None:
+        while True:
+            delay = max(bucket.wait_time(), self.global_bucket.wait_time())
+            if delay <= 0:
+                bucket.consume()
+                self.global_bucket.consume()
+                return
+            await asyncio.sleep(delay)
+
+    def _take_batch(self, queue: Deque[NotificationTicket]) -> List[NotificationTicket]:
+        batch = [queue.popleft()]
+        if len(batch[0].text) > self.coalesce_max_chars:
+            return batch
+        length = len(batch[0].text)
+        while queue and len(queue[0].text) <= self.coalesce_max_chars:
+            length += len(COALESCE_SEPARATOR) + len(queue[0].text)
+            if length > TELEGRAM_MESSAGE_LIMIT:
+                break
+            batch.append(queue.popleft())
+        return batch
+
+    async def _run_chat(self, chat_id: str) -> None:
+        queue = self._queues[chat_id]
+        bucket = self._bucket(chat_id)
+        while queue:
+            await self._acquire(bucket)
+            batch = self._take_batch(queue)
+            await self._deliver(chat_id, bucket, queue, batch)
+        # 큐가 비었으므로 이 채팅의 상태를 정리 (await 없이 처리하므로 그 사이 enqueue가 끼어들지 않음)
+        self._queues.pop(chat_id, None)
+        self._workers.pop(chat_id, None)
+        self._prune_buckets()
+
+    def _prune_buckets(self) -> None:
+        """대기 중인 메시지가 없고 속도 제한 상태가 초기화된 채팅의 버킷 삭제"""
+        for chat_id in [c for c, b in self._buckets.items() if c not in self._queues and b.is_idle()]:
+            del self._buckets[chat_id]
+
+    async def _deliver(self, chat_id: str, bucket: TokenBucket,
+                       queue: Deque[NotificationTicket], batch: List[NotificationTicket]) -> None:
+        text = COALESCE_SEPARATOR.join(t.text for t in batch)
+        # 긴 메시지는 항상 단독 배치이므로, 재시도 시 이미 전송한 조각 다음부터 재개
+        chunks = split_message(text)
+        sent_ids = list(batch[0].message_ids) if len(chunks) > 1 else []
+        start = len(sent_ids)
+        for ticket in batch:
+            ticket.attempts += 1
+        try:
+            for index in range(start, len(chunks)):
+                # 첫 조각의 토큰은 _run_chat에서 이미 얻음
+                if index > start:
+                    await self._acquire(bucket)
+                self.stats.sends += 1
+                response = await self.send(chat_id, chunks[index])
+                sent_ids.append(str(response.get("result", {}).get("message_id", "")))
+                if len(chunks) > 1:
+                    batch[0].message_ids = list(sent_ids)
+        except asyncio.CancelledError:
+            # 전송 도중 중지되면 stop()이 티켓을 정리할 수 있도록 큐에 되돌림
+            queue.extendleft(reversed(batch))
+            raise
+        except Exception as e:
+            attempts = batch[0].attempts
+            retry_after = getattr(e, "retry_after", None)
+            if retry_after:
+                # 429는 봇 전체에 대한 제한이므로 다른 채팅으로의 전송도 같은 시간 동안 멈춤
+                self.stats.rate_limited += 1
+                bucket.block(retry_after)
+                self.global_bucket.block(retry_after)
+            if not _is_retryable(e) or attempts > self.max_retries:
+                print(f"[telegram_queue] 메시지 전송 실패 ({attempts}회 시도): {str(e)}")
+                for ticket in batch:
+                    self._finish(ticket, "failed", message_ids=ticket.message_ids, error=str(e))
+                return
+            # 순서를 유지하도록 큐 앞쪽에 되돌린 뒤 백오프
+            self.stats.retries += 1
+            queue.extendleft(reversed(batch))
+            if not retry_after:
+                await asyncio.sleep(min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1)))
+            return
+
+        self.stats.coalesced += len(batch) - 1
+        for ticket in batch:
+            self._finish(ticket, "sent", message_ids=sent_ids)
+
+    def _finish(self, ticket: NotificationTicket, status: str,
+                message_ids: Optional[List[str]] = None, error: Optional[str] = None) -> None:
+        ticket.status = status
+        ticket.message_ids = message_ids or []
+        ticket.error = error
+        ticket.sent_at = self.clock()
+        if status == "sent":
+            self.stats.sent += 1
+        elif status == "cancelled":
+            self.stats.cancelled += 1
+        else:
+            self.stats.failed += 1
+        self.stats.record_latency(ticket.sent_at - ticket.enqueued_at)
+        self._pending.pop(ticket.ticket_id, None)
+        self._remember(ticket)
+        if ticket.done is not None and not ticket.done.done():
+            ticket.done.set_result(ticket)
+
+def _is_retryable(error: Exception) -> bool:
+    if not isinstance(error, TelegramAPIError):
+        return False
+    return error.status is None or error.status == 429 or error.status >= 500
+
+async def _send_via_client(chat_id: str, text: str) -> Dict[str, Any]:
+    return await send_telegram_message_async(text, chat_id=chat_id)
+
+# 애플리케이션 공용 발신 큐
+notification_outbox = TelegramOutbox()
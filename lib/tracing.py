@@ -0,0 +1,470 @@
+"""
+요청 추적(tracing) 모듈
+
+컨텍스트 관리자 형태의 구간(span)으로 요청 처리 단계별 시간을 단조 시계로 측정합니다.
+추적 ID와 현재 구간은 contextvars로 전파되어 같은 요청의 코루틴/태스크(그리고 copy_context로
+넘긴 실행기 스레드)에서 만든 구간이 하나의 트리로 묶입니다. 추적 중이 아닐 때 span()은
+공유된 빈 컨텍스트 관리자를 돌려주므로 계측 비용이 거의 없습니다.
+
+요청 단위 추적은 TracingMiddleware가 시작하며, 완료된 구간 트리는
+- TRACE_EXPORT_PATH 파일에 Chrome Trace Event 형식(chrome://tracing, Perfetto에서 열람)으로 덧붙이고
+  (파일 기록은 이벤트 루프를 막지 않도록 백그라운드 스레드에서 수행)
+- 요청 헤더(TRACE_REQUEST_HEADER)가 있으면 Server-Timing 응답 헤더로 반환합니다.
+"""
+import os
+import re
+import json
+import time
+import queue
+import uuid
+import atexit
+import asyncio
+import functools
+import threading
+import contextvars
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+# 추적 설정
+TRACE_ENABLED = os.getenv("TRACE_ENABLED", "true").lower() == "true"  # false면 미들웨어를 등록하지 않음
+TRACE_EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH")  # 설정 시 모든 요청의 구간을 Chrome 추적 형식으로 기록
+TRACE_EXPORT_QUEUE_SIZE = int(os.getenv("TRACE_EXPORT_QUEUE_SIZE", "1000"))  # 기록 대기 중인 추적 최대 수 (넘으면 버림)
+TRACE_EXPORT_BATCH_SIZE = 100  # 백그라운드 스레드가 한 번에 기록할 최대 추적 수
+TRACE_REQUEST_HEADER = os.getenv("TRACE_REQUEST_HEADER", "x-server-timing").lower()  # 이 요청 헤더가 있으면 Server-Timing 반환
+TRACE_ID_HEADER = os.getenv("TRACE_ID_HEADER", "x-trace-id").lower()  # 들어온 추적 ID를 이어받고 응답에 돌려주는 헤더
+
+F = TypeVar("F", bound=Callable[..., Any])
+T = TypeVar("T")
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("current_span", default=None)
+
+_NOOP_SPAN = nullcontext()
+
+class Span:
+    """
+    추적 구간 하나
+
+    start/end는 time.perf_counter() 값이며, 벽시계 시각은 추적 시작 시각을 기준으로 환산합니다.
+    """
+    __slots__ = ("name", "trace", "span_id", "parent", "children", "attributes",
+                 "start", "end", "thread_id", "_token")
+
+    def __init__(self, name: str, trace: "Trace", parent: Optional["Span"] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.trace = trace
+        self.span_id = trace.next_span_id()
+        self.parent = parent
+        self.children: List["Span"] = []
+        self.attributes = attributes or {}
+        self.start = 0.0
+        self.end: Optional[float] = None
+        self.thread_id = threading.get_ident()
+        self._token: Optional[contextvars.Token] = None
+        if parent is not None:
+            parent.children.append(self)
+
+    @property
+    def duration(self) -> float:
+        """구간 길이(초), 끝나지 않았으면 현재까지"""
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """구간 속성을 추가 (Chrome 추적의 args로 내보냄)"""
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.end = time.perf_counter()
+        if exc is not None:
+            self.attributes["error"] = f"{exc_type.__name__}: {exc}"
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # 다른 컨텍스트에서 닫힌 경우 (예: 제너레이터가 다른 태스크에서 종료)
+                _current_span.set(self.parent)
+            self._token = None
+
+    def walk(self):
+        """자신과 모든 하위 구간을 시작 순서대로 순회"""
+        yield self
+        for child in list(self.children):
+            yield from child.walk()
+
+class Trace:
+    """
+    요청 하나의 구간 트리
+
+    Args:
+        name: 루트 구간 이름
+        trace_id: 이어받을 추적 ID (없으면 새로 생성)
+    """
+
+    def __init__(self, name: str, trace_id: Optional[str] = None,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self._span_counter = 0
+        self._counter_lock = threading.Lock()
+        # 단조 시계 값을 벽시계 시각으로 바꾸기 위한 기준점
+        self.wall_origin = time.time()
+        self.perf_origin = time.perf_counter()
+        self.root = Span(name, self, attributes=attributes)
+
+    def next_span_id(self) -> int:
+        with self._counter_lock:
+            self._span_counter += 1
+            return self._span_counter
+
+    def add_span(self, name: str, start: float, end: float, parent: Optional[Span] = None,
+                 attributes: Optional[Dict[str, Any]] = None) -> Span:
+        """
+        이미 측정된 시각으로 구간을 추가합니다. (미들웨어가 계산하는 파생 구간용)
+
+        Args:
+            name: 구간 이름
+            start: 시작 시각 (perf_counter 값)
+            end: 끝 시각 (perf_counter 값)
+            parent: 상위 구간 (기본: 루트)
+            attributes: 구간 속성
+        """
+        span = Span(name, self, parent or self.root, attributes)
+        span.start = start
+        span.end = end
+        return span
+
+    def spans(self) -> List[Span]:
+        """루트를 포함한 모든 구간"""
+        return list(self.root.walk())
+
+    def server_timing(self) -> str:
+        """
+        루트를 제외한 구간을 이름별로 합산한 Server-Timing 헤더 값을 반환합니다.
+
+        Returns:
+            str: 'search.fetch;dur=12.3, total;dur=15.0' 형식 (같은 이름이 여러 번이면 합계)
+        """
+        totals: Dict[str, float] = {}
+        for span in self.spans()[1:]:
+            if span.end is None:
+                continue
+            key = _timing_token(span.name)
+            totals[key] = totals.get(key, 0.0) + span.duration
+        totals["total"] = self.root.duration
+        return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in totals.items())
+
+    def to_chrome_events(self, pid: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Chrome Trace Event 형식의 완료 이벤트("ph": "X") 목록으로 변환합니다.
+
+        Returns:
+            List[Dict]: ts/dur가 마이크로초인 이벤트 목록
+        """
+        pid = pid if pid is not None else os.getpid()
+        events = []
+        for span in self.spans():
+            end = span.end if span.end is not None else time.perf_counter()
+            events.append({
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round((self.wall_origin + span.start - self.perf_origin) * 1e6, 3),
+                "dur": round((end - span.start) * 1e6, 3),
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {
+                    "trace_id": self.trace_id,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent.span_id if span.parent is not None else None,
+                    **span.attributes
+                }
+            })
+        return events
+
+_TIMING_TOKEN = re.compile(r"[^A-Za-z0-9!#$%&'*+\-.^_`|~]")
+
+def _timing_token(name: str) -> str:
+    return _TIMING_TOKEN.sub("_", name)
+
+def span(name: str, **attributes: Any):
+    """
+    현재 구간의 하위 구간을 여는 컨텍스트 관리자를 반환합니다.
+
+    추적 중이 아니면 아무것도 기록하지 않는 공유 컨텍스트 관리자를 반환합니다.
+
+    Args:
+        name: 구간 이름 ('모듈.단계' 형식 권장, 예: 'search.fetch')
+        **attributes: 구간 속성
+
+    Returns:
+        Span 또는 빈 컨텍스트 관리자 (with 문의 as 값은 Span 또는 None)
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return _NOOP_SPAN
+    return Span(name, parent.trace, parent, attributes)
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    함수 호출 전체를 구간으로 감싸는 데코레이터 (동기/비동기 함수 모두 지원)
+
+    Args:
+        name: 구간 이름 (기본: '모듈 마지막 이름.함수 이름')
+    """
+    def decorator(func: F) -> F:
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+def traced_iter(name: str, iterable: Iterable[T], **attributes: Any) -> Iterator[T]:
+    """
+    이터러블을 모두 소비하는 동안을 구간 하나로 기록합니다. (스트리밍 응답 본문용)
+
+    만든 시점의 현재 구간 아래에, 첫 조각을 요청한 시각부터 소진되거나 중단될 때까지를
+    조각 수와 함께 기록합니다. 조각마다 다른 스레드/컨텍스트에서 소비되어도 되도록
+    contextvars를 바꾸지 않고 측정한 시각으로 구간을 추가합니다.
+
+    Args:
+        name: 구간 이름
+        iterable: 감쌀 이터러블
+        **attributes: 구간 속성
+
+    Returns:
+        Iterator: 같은 조각을 내보내는 이터레이터 (추적 중이 아니면 원래 이터레이터)
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return iter(iterable)
+    return _traced_iter(name, iterable, parent, attributes)
+
+def _traced_iter(name: str, iterable: Iterable[T], parent: Span, attributes: Dict[str, Any]) -> Iterator[T]:
+    start = time.perf_counter()
+    chunks = 0
+    error = None
+    try:
+        for item in iterable:
+            chunks += 1
+            yield item
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        attrs = {**attributes, "chunks": chunks}
+        if error is not None:
+            attrs["error"] = error
+        parent.trace.add_span(name, start, time.perf_counter(), parent, attrs)
+
+def current_span() -> Optional[Span]:
+    """현재 구간 (추적 중이 아니면 None)"""
+    return _current_span.get()
+
+def get_trace_id() -> Optional[str]:
+    """현재 추적 ID (추적 중이 아니면 None)"""
+    current = _current_span.get()
+    return current.trace.trace_id if current is not None else None
+
+def start_trace(name: str, trace_id: Optional[str] = None, **attributes: Any) -> Trace:
+    """
+    새 추적을 만듭니다. 루트 구간은 `with trace.root:`로 열고 닫습니다.
+
+    Args:
+        name: 루트 구간 이름
+        trace_id: 이어받을 추적 ID
+        **attributes: 루트 구간 속성
+
+    Returns:
+        Trace: 추적 객체
+    """
+    return Trace(name, trace_id, attributes)
+
+def bind_context(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Callable[[], Any]:
+    """
+    현재 contextvars(추적 구간 포함)를 유지한 채 실행기 스레드에서 func를 호출하는 함수를 만듭니다.
+    loop.run_in_executor는 컨텍스트를 복사하지 않으므로 스레드 안의 구간이 트리에 연결되도록 사용합니다.
+    """
+    ctx = contextvars.copy_context()
+    return functools.partial(ctx.run, func, *args, **kwargs)
+
+class ChromeTraceExporter:
+    """
+    완료된 추적을 Chrome Trace Event의 JSON 배열 형식으로 파일에 덧붙이는 내보내기
+
+    배열 형식은 닫는 대괄호가 없어도 열람기가 읽을 수 있으므로 '[' 뒤에 이벤트를 한 줄씩
+    쉼표와 함께 덧붙이기만 하고, 파일을 다시 쓰지 않습니다.
+
+    요청 경로에서는 submit()으로 크기 제한 큐에 넣기만 하고, 백그라운드 스레드 하나가
+    쌓인 추적들을 모아 한 번에 기록합니다. (큐가 가득 차면 추적을 버리고 dropped를 셉니다.)
+    """
+
+    def __init__(self, path: str, queue_size: int = TRACE_EXPORT_QUEUE_SIZE):
+        self.path = path
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Trace]" = queue.Queue(maxsize=queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def submit(self, trace: Trace) -> bool:
+        """
+        추적을 기록 큐에 넣고 즉시 반환합니다.
+
+        Returns:
+            bool: 큐에 넣었으면 True, 큐가 가득 차 버렸으면 False
+        """
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            with self._worker_lock:
+                self.dropped += 1
+            return False
+        return True
+
+    def flush(self) -> None:
+        """큐에 넣은 추적이 모두 기록될 때까지 대기"""
+        self._queue.join()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self._worker.start()
+                # 종료 시 남은 추적을 기록
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        q = self._queue
+        while True:
+            batch = [q.get()]
+            while len(batch) < TRACE_EXPORT_BATCH_SIZE:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    q.task_done()
+
+    def export(self, trace: Trace) -> None:
+        """추적 하나의 모든 구간을 호출한 스레드에서 바로 파일에 덧붙임"""
+        self._write([trace])
+
+    def _write(self, traces: List[Trace]) -> None:
+        lines = "".join(json.dumps(event, ensure_ascii=False, default=str) + ",\n"
+                        for trace in traces for event in trace.to_chrome_events())
+        try:
+            with self._lock:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+                with open(self.path, "a", encoding="utf-8") as f:
+                    if new_file:
+                        f.write("[\n")
+                    f.write(lines)
+        except OSError as e:
+            print(f"[tracing] 추적 파일 기록 오류: {str(e)}")
+
+def load_chrome_trace(path: str) -> List[Dict[str, Any]]:
+    """
+    ChromeTraceExporter가 기록한 파일을 이벤트 목록으로 읽습니다.
+
+    Args:
+        path: 추적 파일 경로
+
+    Returns:
+        List[Dict]: 이벤트 목록
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read().strip()
+    if not text:
+        return []
+    if not text.endswith("]"):
+        text = text.rstrip(",") + "]"
+    return json.loads(text)
+
+class TracingMiddleware:
+    """
+    요청마다 추적을 시작하는 ASGI 미들웨어
+
+    TRACE_EXPORT_PATH가 설정되었거나 요청에 TRACE_REQUEST_HEADER 헤더가 있을 때만 추적하며,
+    그 외 요청에서는 구간이 모두 빈 컨텍스트 관리자가 됩니다. 핸들러 구간(가장 먼저 열린 루트의
+    하위 구간)을 기준으로 그 이전을 request.parse(라우팅, 본문 읽기, 검증), 마지막 하위 구간이
+    끝난 뒤부터 응답 시작까지를 response.serialize 구간으로 추가합니다.
+    완료된 추적은 exporter의 백그라운드 스레드로 넘겨 기록합니다.
+    """
+
+    def __init__(self, app: Any, export_path: Optional[str] = TRACE_EXPORT_PATH,
+                 request_header: str = TRACE_REQUEST_HEADER, id_header: str = TRACE_ID_HEADER,
+                 exporter: Optional[ChromeTraceExporter] = None):
+        self.app = app
+        self.exporter = exporter or (ChromeTraceExporter(export_path) if export_path else None)
+        self.request_header = request_header.encode("latin-1")
+        self.id_header = id_header.encode("latin-1")
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        wants_timing = False
+        incoming_id = None
+        for key, value in scope.get("headers", []):
+            if key == self.request_header:
+                wants_timing = True
+            elif key == self.id_header:
+                incoming_id = value.decode("latin-1")[:64]
+        if not wants_timing and self.exporter is None:
+            await self.app(scope, receive, send)
+            return
+
+        trace = start_trace("request", incoming_id, method=scope.get("method"), path=scope.get("path"))
+        root = trace.root
+
+        async def send_with_timing(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                root.set_attribute("status", message["status"])
+                self._add_derived_spans(trace, time.perf_counter())
+                headers = list(message.get("headers", []))
+                headers.append((self.id_header, trace.trace_id.encode("latin-1")))
+                if wants_timing:
+                    headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            with root:
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            if self.exporter is not None:
+                self.exporter.submit(trace)
+
+    @staticmethod
+    def _add_derived_spans(trace: Trace, response_start: float) -> None:
+        children = [child for child in trace.root.children if child.end is not None]
+        if not children:
+            return
+        trace.add_span("request.parse", trace.root.start, children[0].start)
+        last_end = max(child.end for child in children)
+        trace.add_span("response.serialize", last_end, response_start)
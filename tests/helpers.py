@@ -0,0 +1,48 @@
+"""
+테스트 공용 도우미
+
+테스트 환경의 starlette TestClient를 쓰지 않고 ASGI 앱을 직접 호출하는 함수를 제공합니다.
+"""
+import asyncio
+
+def call_app(app, method: str, path: str, headers=None, body: bytes = b"", with_headers: bool = False,
+             messages=None):
+    """
+    ASGI 앱을 직접 호출하여 (상태 코드, 본문)을 반환 (with_headers면 응답 헤더 사전도 반환,
+    messages 리스트를 넘기면 보낸 ASGI 메시지를 순서대로 담음)
+    """
+    messages = messages if messages is not None else []
+    request_headers = [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in (headers or {}).items()]
+    if body:
+        request_headers.append((b"content-type", b"application/json"))
+        request_headers.append((b"content-length", str(len(body)).encode()))
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+             "method": method, "scheme": "http", "path": path, "raw_path": path.encode(),
+             "root_path": "", "query_string": b"", "headers": request_headers,
+             "client": ("127.0.0.1", 1234), "server": ("testserver", 80)}
+
+    async def run():
+        incoming = [{"type": "http.request", "body": body, "more_body": False}]
+        done = asyncio.Event()
+
+        async def receive():
+            # 요청 본문을 넘긴 뒤에는 응답이 끝날 때까지 기다렸다가 연결 종료를 알림
+            if incoming:
+                return incoming.pop()
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            messages.append(message)
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                done.set()
+
+        await app(scope, receive, send)
+
+    asyncio.run(run())
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    content = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+    if with_headers:
+        response_headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in start.get("headers", [])}
+        return start["status"], content.decode("utf-8"), response_headers
+    return start["status"], content.decode("utf-8")
@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+import tempfile
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.cache import CacheBackend, MemoryCache, SQLiteCache, TieredCache, normalize_key
+from lib import search_utils
+
+class FakeClock:
+    """테스트용 수동 시계"""
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestCache(unittest.TestCase):
+    """캐시 서브시스템 테스트 케이스"""
+
+    def setUp(self):
+        """테스트 시계 설정"""
+        self.clock = FakeClock()
+
+    def test_normalize_key(self):
+        """대소문자와 공백 차이가 같은 키로 정규화되는지 테스트"""
+        self.assertEqual(normalize_key("AI 마케팅"), normalize_key(" ai  마케팅 "))
+
+    def test_ttl_expiration(self):
+        """TTL이 지난 항목은 미스로 처리되는지 테스트"""
+        cache = MemoryCache(default_ttl=10, clock=self.clock)
+        cache.set("a", [1])
+        cache.set("b", [2], ttl=100)
+        self.clock.now += 11
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), [2])
+        self.assertEqual(cache.stats.expirations, 1)
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(cache.stats.misses, 1)
+
+    def test_lru_eviction_by_entries(self):
+        """최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목이 퇴출되는지 테스트"""
+        cache = MemoryCache(max_entries=2, clock=self.clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_eviction_by_bytes(self):
+        """최대 바이트 수를 넘으면 항목이 퇴출되는지 테스트"""
+        cache = MemoryCache(max_entries=None, max_bytes=20, clock=self.clock)
+        cache.set("a", "x" * 10)
+        cache.set("b", "y" * 10)
+
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.total_bytes, 20)
+        self.assertEqual(cache.get("b"), "y" * 10)
+
+    def test_sqlite_shared_tier(self):
+        """SQLite 공유 계층에 저장된 값을 다른 프로세스 캐시가 읽을 수 있는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.db")
+            writer = TieredCache(MemoryCache(clock=self.clock), SQLiteCache(path, clock=self.clock))
+            reader = TieredCache(MemoryCache(clock=self.clock), SQLiteCache(path, clock=self.clock))
+
+            writer.set("ai 마케팅", [{"keyword": "AI 마케팅"}], ttl=60)
+            self.assertEqual(reader.get("ai 마케팅"), [{"keyword": "AI 마케팅"}])
+            # 로컬 계층으로 승격됨
+            self.assertEqual(len(reader.local), 1)
+
+            self.clock.now += 61
+            self.assertIsNone(reader.get("ai 마케팅"))
+            writer.shared.close()
+            reader.shared.close()
+
+    def test_search_cache_shares_normalized_entry(self):
+        """검색 캐시가 정규화된 키워드로 결과를 공유하는지 테스트"""
+        search_utils.search_cache.clear()
+        results = search_utils.search_keywords("AI 마케팅")
+        search_utils.save_to_cache("AI 마케팅", results)
+
+        self.assertEqual(search_utils.get_cached_results(" ai 마케팅 "), results)
+        self.assertIsNone(search_utils.get_cached_results("다른 키워드"))
+        search_utils.search_cache.clear()
+
+    def test_incomplete_backend_rejected(self):
+        """추상 메서드를 구현하지 않은 백엔드는 생성 시점에 실패하는지 테스트"""
+        class PartialCache(CacheBackend):
+            def get_entry(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            PartialCache()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,273 @@
+import unittest
+import random
+import threading
+import tempfile
+import json
+import time
+import sys
+import os
+from unittest import mock
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.categorizer import (
+    CategoryMatcher, TaxonomyIndex, load_taxonomy, DEFAULT_CATEGORY_TERMS, DEFAULT_CATEGORY
+)
+from lib.cache import MemoryCache
+from lib import rag_engine
+from lib.rag_engine import (
+    categorize_keyword, categorize_many, invalidate_category_cache, get_category_cache_stats
+)
+
+def reference_categorize(keyword, category_terms, default=DEFAULT_CATEGORY):
+    """비교 기준: 카테고리 순서대로 용어 포함 여부를 검사하는 기존 방식"""
+    k = keyword.lower().strip()
+    for category, terms in category_terms.items():
+        if any(term in k for term in terms):
+            return category
+    return default
+
+class TestCategoryMatcher(unittest.TestCase):
+    """카테고리 분류 엔진 테스트 케이스"""
+
+    def test_matches_reference_on_random_keywords(self):
+        """무작위 키워드에서 기존 방식과 같은 결과를 내는지 테스트"""
+        matcher = CategoryMatcher(DEFAULT_CATEGORY_TERMS)
+        vocab = [t for terms in DEFAULT_CATEGORY_TERMS.values() for t in terms]
+        vocab += ["여행", "맛집", "AI", "SEO", "Blender", "모바", "블렌", "  ", "gp"]
+        rng = random.Random(7)
+        keywords = ["".join(rng.choice(vocab) for _ in range(rng.randint(1, 4))) for _ in range(3000)]
+        expected = [reference_categorize(k, DEFAULT_CATEGORY_TERMS) for k in keywords]
+        self.assertEqual([matcher.categorize(k) for k in keywords], expected)
+        self.assertEqual(matcher.categorize_many(keywords), expected)
+
+    def test_first_category_wins_regardless_of_position(self):
+        """문자열에서 먼저 나타난 용어가 아니라 표에서 앞선 카테고리가 선택되는지 테스트"""
+        matcher = CategoryMatcher(DEFAULT_CATEGORY_TERMS)
+        self.assertEqual(matcher.categorize("블렌더 앱 AI 마케팅"), "디지털 마케팅")
+        self.assertEqual(matcher.categorize("모바일 GPT"), "AI 기술")
+        self.assertEqual(matcher.categorize("여행 추천"), "일반")
+        self.assertEqual(matcher.categorize(""), "일반")
+
+    def test_overlapping_terms(self):
+        """다른 용어의 접미사/내부에 포함된 용어도 찾는지 테스트"""
+        table = {"짧은": ["bc"], "긴": ["abcd"], "겹침": ["cda"]}
+        matcher = CategoryMatcher(table, default="없음")
+        for keyword in ("abcd", "xabcdx", "abce", "cdab", "abcda", "ab", "xcdax"):
+            self.assertEqual(matcher.categorize(keyword), reference_categorize(keyword, table, "없음"))
+
+    def test_empty_term_rejected(self):
+        """빈 용어가 있으면 ValueError가 발생하는지 테스트"""
+        with self.assertRaises(ValueError):
+            CategoryMatcher({"잘못됨": ["ok", " "]})
+
+class FakeClock:
+    """테스트용 수동 시계"""
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+def write_taxonomy(path, categories, default="일반", mtime=None):
+    """분류 표 파일을 쓰고 변경이 감지되도록 수정 시각을 지정"""
+    data = {"locale": "ko", "default": default,
+            "categories": [{"name": name, "terms": terms} for name, terms in categories]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+class TestTaxonomyIndex(unittest.TestCase):
+    """분류 표 파일 적재/재적재 테스트 케이스"""
+
+    def setUp(self):
+        """임시 분류 표 파일 설정"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.path = os.path.join(tmp.name, "ko.json")
+
+    def test_load_and_reload(self):
+        """파일에서 적재하고, 파일이 바뀌면 교체 후 알림을 호출하며, 잘못된 파일은 무시하는지 테스트"""
+        write_taxonomy(self.path, [("여행", ["캠핑", "호텔"]), ("음식", ["맛집", "캠핑"])], mtime=1000)
+        index = TaxonomyIndex(self.path, reload_interval=0)
+        notified = []
+        index.add_listener(lambda: notified.append(index.version))
+        self.assertEqual(index.matcher.categorize("캠핑 맛집"), "여행")
+        self.assertEqual(index.matcher.categorize("주식"), "일반")
+        self.assertFalse(index.reload())
+
+        write_taxonomy(self.path, [("음식", ["맛집", "캠핑"])], default="기타", mtime=2000)
+        self.assertTrue(index.reload())
+        self.assertEqual(index.matcher.categorize("캠핑 맛집"), "음식")
+        self.assertEqual(index.matcher.categorize("주식"), "기타")
+        self.assertEqual(notified, [2])
+
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{잘못된 JSON")
+        os.utime(self.path, (3000, 3000))
+        self.assertFalse(index.reload())
+        self.assertEqual(index.matcher.categorize("캠핑"), "음식")
+        self.assertEqual(index.get_stats()["errors"], 1)
+
+    def test_missing_file_uses_builtin(self):
+        """파일이 없으면 기본 분류 표를 사용하는지 테스트"""
+        index = TaxonomyIndex(os.path.join(self.dir, "없음.json"), reload_interval=0)
+        self.assertEqual(index.get_stats()["source"], "builtin")
+        self.assertEqual(index.matcher.categorize("AI 마케팅"), "디지털 마케팅")
+
+    def test_invalid_structure(self):
+        """구조가 잘못된 분류 표는 ValueError가 발생하는지 테스트"""
+        for data in ({"categories": {"여행": ["캠핑"]}}, {"categories": [{"name": "여행", "terms": [1]}]},
+                     {"default": ["일반"], "categories": [{"name": "여행", "terms": ["캠핑"]}]}):
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            with self.assertRaises(ValueError):
+                load_taxonomy(self.path)
+
+    def test_maybe_reload_in_background(self):
+        """확인 주기가 지나야 파일을 확인하고, 재적재는 백그라운드에서 이루어지는지 테스트"""
+        write_taxonomy(self.path, [("여행", ["캠핑"])], mtime=1000)
+        clock = FakeClock()
+        index = TaxonomyIndex(self.path, reload_interval=10, clock=clock)
+        index.maybe_reload()  # 첫 확인: 변경 없음
+        write_taxonomy(self.path, [("캠핑 용품", ["캠핑"])], mtime=2000)
+
+        clock.now += 5
+        index.maybe_reload()
+        time.sleep(0.05)
+        self.assertEqual(index.version, 1)
+
+        clock.now += 10
+        index.maybe_reload()
+        deadline = time.time() + 5
+        while index.version < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(index.matcher.categorize("캠핑"), "캠핑 용품")
+
+    def test_readers_see_whole_index_during_reload(self):
+        """재적재 중에도 읽는 쪽은 락 없이 이전 또는 새 분류 표의 결과만 보는지 테스트"""
+        write_taxonomy(self.path, [("A", ["x"])], mtime=1000)
+        index = TaxonomyIndex(self.path, reload_interval=0)
+        seen = set()
+        stop = threading.Event()
+
+        def reader():
+            while not stop.is_set():
+                seen.add(index.matcher.categorize("xy"))
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for i in range(20):
+            name = "A" if i % 2 else "B"
+            write_taxonomy(self.path, [(name, ["x"] + [f"term{n}" for n in range(200)])], mtime=2000 + i)
+            index.reload()
+        stop.set()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(seen, {"A", "B"})
+
+    def test_large_taxonomy_startup_budget(self):
+        """카테고리 500개 × 용어 40개 분류 표를 시작 시간 예산 안에 적재하는지 테스트"""
+        rng = random.Random(3)
+        syllables = [chr(0xAC00 + i) for i in range(0, 11172, 3)]
+        categories = [(f"카테고리 {c}", ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 5)))
+                                      for _ in range(40)]) for c in range(500)]
+        write_taxonomy(self.path, categories)
+
+        budget = float(os.getenv("CATEGORY_TAXONOMY_LOAD_BUDGET", "1.5"))  # 초
+        start = time.perf_counter()
+        index = TaxonomyIndex(self.path, reload_interval=0)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(index.get_stats()["terms"], 20000)
+        self.assertLess(elapsed, budget, f"분류 표 적재 {elapsed:.3f}s가 예산 {budget}s를 넘었습니다.")
+        term = categories[321][1][7]
+        self.assertEqual(index.matcher.categorize(f"추천 {term} 모음"),
+                         next(name for name, terms in categories if any(t in f"추천 {term} 모음" for t in terms)))
+
+class TestRagEngineCategorize(unittest.TestCase):
+    """rag_engine 분류 함수 테스트 케이스"""
+
+    def test_categorize_keyword_and_many(self):
+        """단건/일괄 분류 결과가 일치하는지 테스트"""
+        keywords = ["AI 마케팅", "딥러닝 입문", "웹 코딩", "3D 렌더링", "캠핑 용품"]
+        expected = ["디지털 마케팅", "AI 기술", "앱 개발", "3D 모델링/AI", "일반"]
+        self.assertEqual([categorize_keyword(k) for k in keywords], expected)
+        self.assertEqual(categorize_many(keywords), expected)
+
+    def test_taxonomy_swap_invalidates_cache(self):
+        """분류 표가 교체되면 카테고리 캐시가 비워지는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(rag_engine, "category_cache", MemoryCache(max_entries=10)):
+            path = os.path.join(tmp, "ko.json")
+            write_taxonomy(path, [("여행", ["캠핑"])], mtime=1000)
+            index = TaxonomyIndex(path, reload_interval=0)
+            index.add_listener(rag_engine.invalidate_category_cache)
+            with mock.patch.object(rag_engine, "category_taxonomy", index):
+                self.assertEqual(categorize_keyword("캠핑장"), "여행")
+                write_taxonomy(path, [("아웃도어", ["캠핑"])], mtime=2000)
+                index.reload()
+                self.assertEqual(categorize_keyword("캠핑장"), "아웃도어")
+
+    def test_result_from_previous_taxonomy_is_not_served(self):
+        """분류 표 교체와 겹쳐 이전 분류 표의 결과가 캐시에 들어가도 다음 조회에서 쓰이지 않는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp, \
+                mock.patch.object(rag_engine, "category_cache", MemoryCache(max_entries=10)):
+            path = os.path.join(tmp, "ko.json")
+            write_taxonomy(path, [("여행", ["캠핑"])], mtime=1000)
+            index = TaxonomyIndex(path, reload_interval=0)
+            index.add_listener(rag_engine.invalidate_category_cache)
+            with mock.patch.object(rag_engine, "category_taxonomy", index):
+                old_version, old_matcher = index.snapshot()
+                write_taxonomy(path, [("아웃도어", ["캠핑"])], mtime=2000)
+                index.reload()
+                # 교체 전에 분류를 시작한 요청이 캐시 초기화 뒤에 이전 결과를 저장한 상황
+                rag_engine.category_cache.set("캠핑장", (old_version, old_matcher.categorize("캠핑장")))
+                self.assertEqual(categorize_keyword("캠핑장"), "아웃도어")
+                self.assertEqual(rag_engine.category_cache.get("캠핑장"), (index.version, "아웃도어"))
+
+    def test_category_cache_bounded(self):
+        """카테고리 캐시가 용량을 넘으면 오래된 키워드부터 퇴출하고 카운터를 남기는지 테스트"""
+        with mock.patch.object(rag_engine, "category_cache", MemoryCache(max_entries=3)):
+            for keyword in ["AI 1", "AI 2", "AI 3", "AI 1", "AI 4", "AI 5"]:
+                categorize_keyword(keyword)
+            stats = get_category_cache_stats()
+            self.assertEqual(stats["size"], 3)
+            self.assertEqual(stats["max_entries"], 3)
+            self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 5, 2))
+            # 최근 사용된 'AI 1'은 남고 'AI 2'는 퇴출됨
+            self.assertIsNotNone(rag_engine.category_cache.get("AI 1"))
+            self.assertIsNone(rag_engine.category_cache.get("AI 2"))
+
+            invalidate_category_cache()
+            self.assertEqual(get_category_cache_stats()["size"], 0)
+
+    def test_category_cache_concurrent_access(self):
+        """여러 스레드가 동시에 분류해도 용량을 넘지 않고 결과가 일관되는지 테스트"""
+        keywords = [f"{term} {i}" for i in range(200) for term in ("마케팅", "GPT", "코딩", "여행")]
+        expected = categorize_many(keywords)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(len(keywords)):
+                    index = (i + offset) % len(keywords)
+                    if categorize_keyword(keywords[index]) != expected[index]:
+                        errors.append(keywords[index])
+            except Exception as e:
+                errors.append(e)
+
+        with mock.patch.object(rag_engine, "category_cache", MemoryCache(max_entries=100)):
+            threads = [threading.Thread(target=worker, args=(n * 97,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(errors, [])
+            self.assertLessEqual(len(rag_engine.category_cache), 100)
+
+if __name__ == "__main__":
+    unittest.main()
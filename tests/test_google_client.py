@@ -0,0 +1,356 @@
+import unittest
+import tempfile
+import threading
+import sys
+import os
+from datetime import datetime, timedelta
+from unittest import mock
+
+import gspread
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib import google_client
+from lib.google_client import SheetClientManager, SpreadsheetRegistry
+
+class FakeClock:
+    """테스트용 수동 시계"""
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+class FakeCredentials:
+    """토큰 만료 시각과 갱신 횟수를 기록하는 가짜 인증 정보"""
+    def __init__(self, clock, lifetime=3600):
+        self.clock = clock
+        self.lifetime = lifetime
+        self.refreshed = 0
+        self._issue()
+
+    def _issue(self):
+        self.token_expiry = datetime.utcfromtimestamp(self.clock()) + timedelta(seconds=self.lifetime)
+
+    def refresh(self, http):
+        self.refreshed += 1
+        self._issue()
+
+class FakeWorksheet:
+    """gspread.Worksheet 대역"""
+    def __init__(self, title):
+        self.title = title
+        self.rows = []
+        self.updates = []
+        self.appends = []
+
+    def update(self, cell_range, values):
+        self.updates.append((cell_range, values))
+        self.rows[:len(values)] = values
+
+    def row_values(self, row):
+        return self.rows[row - 1] if len(self.rows) >= row else []
+
+    def append_rows(self, values, **kwargs):
+        self.appends.append(len(values))
+        self.rows.extend(values)
+
+    def get_all_values(self):
+        raise AssertionError("시트 전체를 내려받으면 안 됨")
+
+class FakeSpreadsheet:
+    """gspread.Spreadsheet 대역"""
+    def __init__(self, spreadsheet_id, calls):
+        self.id = spreadsheet_id
+        self.url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
+        self.calls = calls
+        self.worksheets = {}
+
+    def worksheet(self, title):
+        self.calls.append(("worksheet", self.id, title))
+        if title not in self.worksheets:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return self.worksheets[title]
+
+    def add_worksheet(self, title, rows, cols):
+        self.calls.append(("add_worksheet", self.id, title))
+        self.worksheets[title] = FakeWorksheet(title)
+        return self.worksheets[title]
+
+    def share(self, *args, **kwargs):
+        self.calls.append(("share", self.id))
+
+class FakeClient:
+    """gspread.Client 대역"""
+    def __init__(self, calls, spreadsheets):
+        self.calls = calls
+        self.spreadsheets = spreadsheets
+
+    def open_by_key(self, spreadsheet_id):
+        self.calls.append(("open_by_key", spreadsheet_id))
+        if spreadsheet_id not in self.spreadsheets:
+            raise gspread.exceptions.SpreadsheetNotFound(spreadsheet_id)
+        return self.spreadsheets[spreadsheet_id]
+
+    def create(self, title):
+        created = sum(1 for call in self.calls if call[0] == "create")
+        spreadsheet = FakeSpreadsheet(f"new-{created + 1}", self.calls)
+        self.spreadsheets[spreadsheet.id] = spreadsheet
+        self.calls.append(("create", spreadsheet.id))
+        return spreadsheet
+
+class TestSheetClientManager(unittest.TestCase):
+    """Google Sheets 클라이언트 관리자 테스트 케이스"""
+
+    def setUp(self):
+        """가짜 gspread 환경과 관리자 설정"""
+        self.clock = FakeClock()
+        self.calls = []
+        self.spreadsheets = {"sheet-1": FakeSpreadsheet("sheet-1", self.calls)}
+        self.decoded = []
+        self.authorized = []
+
+        def credentials_factory(raw):
+            if not raw:
+                return None
+            self.decoded.append(raw)
+            return FakeCredentials(self.clock)
+
+        def authorize(credentials):
+            self.authorized.append(credentials)
+            return FakeClient(self.calls, self.spreadsheets)
+
+        self.manager = SheetClientManager(handle_ttl=60, refresh_margin=300,
+                                          credentials_factory=credentials_factory,
+                                          authorize=authorize, clock=self.clock)
+        env = mock.patch.dict(os.environ, {"GOOGLE_SERVICE_ACCOUNT": "ZmFrZQ=="})
+        env.start()
+        self.addCleanup(env.stop)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.registry_path = os.path.join(tmp.name, "registry.json")
+        self.registry = SpreadsheetRegistry(self.registry_path, partition="month", clock=self.clock)
+        for name, value in [("sheet_manager", self.manager), ("sheet_registry", self.registry)]:
+            patcher = mock.patch.object(google_client, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_credentials_decoded_once(self):
+        """여러 번 클라이언트를 요청해도 인증 정보 디코딩과 인증은 한 번만 하는지 테스트"""
+        clients = [self.manager.get_client() for _ in range(5)]
+        self.assertTrue(all(c is clients[0] for c in clients))
+        self.assertEqual(len(self.decoded), 1)
+        self.assertEqual(len(self.authorized), 1)
+
+    def test_token_refreshed_only_near_expiry(self):
+        """토큰은 만료 여유 시간 안에 들어왔을 때만 갱신되는지 테스트"""
+        self.manager.get_client()
+        credentials = self.authorized[0]
+
+        self.clock.now += 3000
+        self.manager.get_client()
+        self.assertEqual(credentials.refreshed, 0)
+
+        self.clock.now += 400
+        self.manager.get_client()
+        self.assertEqual(credentials.refreshed, 1)
+        self.assertEqual(self.manager.stats["refreshes"], 1)
+        self.assertEqual(len(self.decoded), 1)
+
+    def test_handles_cached_with_ttl(self):
+        """스프레드시트/워크시트 핸들이 TTL 동안 재사용되는지 테스트"""
+        for _ in range(3):
+            spreadsheet = self.manager.open_spreadsheet("sheet-1")
+            self.manager.get_worksheet(spreadsheet, "Keywords")
+        self.assertEqual(self.calls.count(("open_by_key", "sheet-1")), 1)
+        self.assertEqual(self.calls.count(("add_worksheet", "sheet-1", "Keywords")), 1)
+
+        self.clock.now += 61
+        self.manager.open_spreadsheet("sheet-1")
+        self.assertEqual(self.calls.count(("open_by_key", "sheet-1")), 2)
+
+    def test_invalidate_and_env_change(self):
+        """무효화 후 다시 조회하고, 인증 정보가 바뀌면 다시 인증하는지 테스트"""
+        self.manager.open_spreadsheet("sheet-1")
+        self.manager.invalidate("sheet-1")
+        self.manager.open_spreadsheet("sheet-1")
+        self.assertEqual(self.calls.count(("open_by_key", "sheet-1")), 2)
+
+        with mock.patch.dict(os.environ, {"GOOGLE_SERVICE_ACCOUNT": "b3RoZXI="}):
+            self.manager.get_client()
+        self.assertEqual(len(self.authorized), 2)
+
+    def test_slow_lookup_does_not_block_others(self):
+        """느린 조회가 다른 스프레드시트 조회를 막지 않고, 같은 스프레드시트 동시 조회는 한 번만 호출하는지 테스트"""
+        self.spreadsheets["sheet-2"] = FakeSpreadsheet("sheet-2", self.calls)
+        client = self.manager.get_client()
+        original = client.open_by_key
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_open(spreadsheet_id):
+            if spreadsheet_id == "sheet-1":
+                started.set()
+                release.wait(5)
+            return original(spreadsheet_id)
+
+        client.open_by_key = slow_open
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.manager.open_spreadsheet("sheet-1")))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(started.wait(5))
+
+        # sheet-1 조회가 끝나지 않았어도 다른 조회는 바로 진행
+        self.assertEqual(self.manager.open_spreadsheet("sheet-2").id, "sheet-2")
+        self.manager.get_worksheet(self.spreadsheets["sheet-2"], "Keywords")
+        self.assertFalse(results)
+
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(r is self.spreadsheets["sheet-1"] for r in results))
+        self.assertEqual(self.calls.count(("open_by_key", "sheet-1")), 1)
+
+    def test_save_keywords_reuses_manager(self):
+        """반복 동기화 시 인증과 메타데이터 조회를 생략하는지 테스트"""
+        keywords = [{"keyword": "AI", "monthlySearches": 1000, "competitionRate": 0.3,
+                     "score": 60, "recommendation": "Recommended"}]
+        for _ in range(3):
+            url = google_client.save_keywords_to_sheet(keywords, "2023-01-01T00:00:00", "sheet-1")
+
+        self.assertEqual(url, "https://docs.google.com/spreadsheets/d/sheet-1")
+        self.assertEqual(len(self.authorized), 1)
+        self.assertEqual(self.calls.count(("open_by_key", "sheet-1")), 1)
+        self.assertEqual(self.calls.count(("worksheet", "sheet-1", "Keywords")), 1)
+
+    def test_append_writes_header_once(self):
+        """헤더는 한 번만 기록하고 행은 append API로 추가하는지 테스트"""
+        keywords = [{"keyword": f"키워드{i}", "score": i} for i in range(3)]
+        for _ in range(4):
+            google_client.save_keywords_to_sheet(keywords, "2023-01-01T00:00:00", "sheet-1")
+        worksheet = self.spreadsheets["sheet-1"].worksheets["Keywords"]
+        self.assertEqual(len(worksheet.updates), 1)
+        self.assertEqual(worksheet.appends, [3, 3, 3, 3])
+        self.assertEqual(worksheet.rows[0], google_client.SHEET_HEADERS)
+        self.assertEqual(len(worksheet.rows), 13)
+
+        # 캐시가 만료되어도 헤더가 이미 있으면 다시 쓰지 않음
+        self.clock.now += 61
+        google_client.save_keywords_to_sheet(keywords, "2023-01-01T00:00:00", "sheet-1")
+        self.assertEqual(len(worksheet.updates), 1)
+
+    def test_registry_reuses_partition_spreadsheet(self):
+        """ID 없이 저장하면 파티션마다 스프레드시트를 한 번만 만들고 공유하는지 테스트"""
+        for _ in range(3):
+            url = google_client.save_keywords_to_sheet([{"keyword": "AI"}], "2023-11-14T00:00:00")
+        self.assertEqual([c for c in self.calls if c[0] in ("create", "share")],
+                         [("create", "new-1"), ("share", "new-1")])
+        self.assertEqual(url, "https://docs.google.com/spreadsheets/d/new-1")
+
+        # 재시작 후에도 레지스트리 파일로 같은 스프레드시트를 사용
+        self.manager.reset()
+        restarted = SpreadsheetRegistry(self.registry_path, partition="month", clock=self.clock)
+        with mock.patch.object(google_client, "sheet_registry", restarted):
+            google_client.save_keywords_to_sheet([{"keyword": "AI"}], "2023-11-14T00:00:00")
+        self.assertEqual(self.calls.count(("create", "new-1")), 1)
+        self.assertEqual(self.calls.count(("share", "new-1")), 1)
+
+        # 다음 달로 넘어가면 새 스프레드시트 생성
+        self.clock.now += 31 * 24 * 3600
+        google_client.save_keywords_to_sheet([{"keyword": "AI"}], "2023-12-15T00:00:00")
+        self.assertIn(("create", "new-2"), self.calls)
+        self.assertEqual(self.registry.get("default:2023-12")["id"], "new-2")
+
+    def test_registry_recreates_deleted_spreadsheet(self):
+        """등록된 스프레드시트가 삭제되었으면 새로 만들어 다시 등록하는지 테스트"""
+        google_client.save_keywords_to_sheet([], "2023-11-14T00:00:00", tenant="acme")
+        first_id = self.registry.get("acme:2023-11")["id"]
+        del self.spreadsheets[first_id]
+        self.manager.invalidate()
+
+        google_client.save_keywords_to_sheet([], "2023-11-14T00:00:00", tenant="acme")
+        self.assertNotEqual(self.registry.get("acme:2023-11")["id"], first_id)
+
+    def test_registry_creation_does_not_block_other_partitions(self):
+        """파티션 생성이 느려도 다른 파티션 조회는 진행되고, 같은 파티션은 한 번만 생성하는지 테스트"""
+        google_client.save_keywords_to_sheet([], "2023-11-14T00:00:00", tenant="beta")
+        client = self.manager.get_client()
+        original = client.create
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_create(title):
+            started.set()
+            release.wait(5)
+            return original(title)
+
+        client.create = slow_create
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.registry.resolve(self.manager, "acme")))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(started.wait(5))
+
+        # acme 생성이 끝나지 않았어도 등록된 beta 파티션은 바로 조회
+        self.assertEqual(self.registry.resolve(self.manager, "beta").id, "new-1")
+        self.assertFalse(results)
+
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(sum(1 for call in self.calls if call[0] == "create"), 2)
+        self.assertEqual(self.registry.get("acme:2023-11")["id"], results[0].id)
+
+    def test_failed_registry_sheet_is_rechecked(self):
+        """레지스트리로 찾은 시트의 권한이 사라지면 캐시된 핸들을 버리고 다음 동기화에서 새로 만드는지 테스트"""
+        google_client.save_keywords_to_sheet([{"keyword": "AI"}], "2023-11-14T00:00:00")
+        first = self.spreadsheets["new-1"]
+        denied = gspread.exceptions.APIError(mock.Mock(json=lambda: {
+            "error": {"code": 403, "message": "denied", "status": "PERMISSION_DENIED"}}))
+
+        def append_rows(values, **kwargs):
+            raise denied
+
+        first.worksheets["Keywords"].append_rows = append_rows
+        with self.assertRaises(gspread.exceptions.APIError):
+            google_client.save_keywords_to_sheet([{"keyword": "AI"}], "2023-11-14T00:00:00")
+
+        def open_by_key(spreadsheet_id):
+            self.calls.append(("open_by_key", spreadsheet_id))
+            raise denied
+
+        self.manager.get_client().open_by_key = open_by_key
+        url = google_client.save_keywords_to_sheet([{"keyword": "AI"}], "2023-11-14T00:00:00")
+        self.assertIn(("open_by_key", "new-1"), self.calls)
+        self.assertEqual(url, "https://docs.google.com/spreadsheets/d/new-2")
+        self.assertEqual(self.registry.get("default:2023-11")["id"], "new-2")
+
+    def test_registry_rejects_unknown_partition(self):
+        """알 수 없는 파티션 단위는 ValueError가 발생하는지 테스트"""
+        with self.assertRaises(ValueError):
+            SpreadsheetRegistry(self.registry_path, partition="week")
+
+    def test_column_letter(self):
+        """열 번호를 A1 표기 열 문자로 변환하는지 테스트"""
+        self.assertEqual(google_client._column_letter(6), "F")
+        self.assertEqual(google_client._column_letter(27), "AA")
+
+    def test_test_mode_without_env(self):
+        """환경변수가 없으면 테스트 모드로 None을 반환하는지 테스트"""
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(self.manager.get_client())
+            self.assertEqual(
+                google_client.save_keywords_to_sheet([], "2023-01-01T00:00:00"),
+                "https://docs.google.com/spreadsheets/d/test-sheet-id/edit#gid=0"
+            )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import json
+import queue
+import logging
+import tempfile
+import sys
+import os
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.log_rotation import (
+    RotatingCompressedFileHandler, find_segments, open_segment, resolve_compression
+)
+from lib.logger import JSONFormatter, OverflowQueueHandler, BatchingQueueListener
+
+def make_record(message: str, created: float) -> logging.LogRecord:
+    record = logging.LogRecord("test.rotation", logging.INFO, __file__, 1, message, None, None)
+    record.created = created
+    return record
+
+class TestRotatingCompressedFileHandler(unittest.TestCase):
+    """로그 파일 회전/압축 테스트 케이스"""
+
+    def setUp(self):
+        """임시 로그 디렉토리 설정"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.log_file = os.path.join(tmp.name, "app.log")
+
+    def make_handler(self, **kwargs):
+        handler = RotatingCompressedFileHandler(self.log_file, compression="gzip", **kwargs)
+        handler.setFormatter(JSONFormatter())
+        self.addCleanup(handler.close)
+        return handler
+
+    def read_lines(self, paths):
+        lines = []
+        for path in paths:
+            with open_segment(path) as f:
+                lines.extend(json.loads(line)["message"] for line in f)
+        return lines
+
+    def test_size_rotation_compresses_and_indexes(self):
+        """크기 기준으로 회전하고, 세그먼트가 압축되어 인덱스에 시간 범위와 함께 기록되는지 테스트"""
+        handler = self.make_handler(max_bytes=1000, interval=0, retention=100)
+        messages = [f"메시지 {i:03d}" for i in range(50)]
+        for i, message in enumerate(messages):
+            handler.handle(make_record(message, 1_700_000_000 + i))
+        handler.wait_for_compression()
+
+        with open(handler.index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        segments = index["segments"]
+        self.assertGreater(len(segments), 1)
+        self.assertTrue(all(s["file"].endswith(".gz") for s in segments))
+        self.assertEqual(sum(s["records"] for s in segments) + len(self.read_lines([self.log_file])), 50)
+        for earlier, later in zip(segments, segments[1:]):
+            self.assertLess(earlier["end"], later["start"])
+
+        # 전체 구간을 모으면 모든 메시지가 순서대로 나옴
+        paths = find_segments(self.log_file, 0, float("inf"))
+        self.assertEqual(self.read_lines(paths), messages)
+
+    def test_time_rotation_and_window_lookup(self):
+        """주기 경계를 넘으면 회전하고, 시간 범위로 해당 세그먼트만 찾는지 테스트"""
+        handler = self.make_handler(max_bytes=0, interval=3600, retention=100)
+        base = 1_700_000_000 - 1_700_000_000 % 3600
+        for hour in range(3):
+            for minute in range(3):
+                handler.handle(make_record(f"{hour}시 {minute}분", base + hour * 3600 + minute * 60))
+        # 늦게 도착한 이전 주기의 레코드는 회전을 일으키지 않음
+        handler.handle(make_record("늦은 기록", base + 2 * 3600 - 1))
+        handler.wait_for_compression()
+
+        paths = find_segments(self.log_file, base + 3600, base + 3600 + 120)
+        self.assertEqual(len(paths), 1)
+        self.assertEqual(self.read_lines(paths), ["1시 0분", "1시 1분", "1시 2분"])
+        self.assertEqual(self.read_lines([self.log_file]), ["2시 0분", "2시 1분", "2시 2분", "늦은 기록"])
+
+    def test_retention_limit(self):
+        """보존 개수를 넘는 오래된 세그먼트가 삭제되는지 테스트"""
+        handler = self.make_handler(max_bytes=0, interval=60, retention=2)
+        for minute in range(6):
+            handler.handle(make_record(f"{minute}분", 1_700_000_040 + minute * 60))
+        handler.wait_for_compression()
+
+        with open(handler.index_path, encoding="utf-8") as f:
+            segments = json.load(f)["segments"]
+        self.assertEqual(len(segments), 2)
+        rotated = [name for name in os.listdir(self.dir) if name.endswith(".gz")]
+        self.assertEqual(sorted(rotated), sorted(s["file"] for s in segments))
+
+    def test_batched_listener_rotates(self):
+        """비동기 리스너의 일괄 기록에서도 회전이 적용되는지 테스트"""
+        handler = self.make_handler(max_bytes=500, interval=0, retention=100)
+        log_queue = queue.Queue()
+        queue_handler = OverflowQueueHandler(log_queue, policy="block")
+        listener = BatchingQueueListener(log_queue, handler, batch_size=100)
+        for i in range(40):
+            queue_handler.handle(make_record(f"배치 {i}", 1_700_000_000 + i))
+        listener.start()
+        listener.stop()
+        handler.wait_for_compression()
+
+        self.assertEqual(self.read_lines(find_segments(self.log_file, 0, float("inf"))),
+                         [f"배치 {i}" for i in range(40)])
+        self.assertGreater(len(find_segments(self.log_file, 0, float("inf"))), 2)
+
+    def test_unknown_compression(self):
+        """알 수 없는 압축 방식은 ValueError가 발생하는지 테스트"""
+        with self.assertRaises(ValueError):
+            resolve_compression("brotli")
+
+if __name__ == "__main__":
+    unittest.main()
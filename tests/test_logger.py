@@ -0,0 +1,392 @@
+import unittest
+import io
+import json
+import queue
+import logging
+import threading
+import sys
+import os
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib import logger as logger_module
+from lib.logger import (
+    JSONFormatter, ContextLogger, OverflowQueueHandler, BatchingQueueListener, AsyncLogStats,
+    get_json_serializer, LogSampler, parse_level_rates
+)
+
+class FakeClock:
+    """테스트용 수동 시계"""
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+class CountingStream(io.StringIO):
+    """flush 호출 횟수를 세는 문자열 스트림"""
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+def make_logger(name, handler, level=logging.DEBUG):
+    """루트 로거와 분리된 테스트용 ContextLogger 생성"""
+    test_logger = ContextLogger(name)
+    test_logger.setLevel(level)
+    test_logger.propagate = False
+    test_logger.addHandler(handler)
+    return test_logger
+
+class TestAsyncLogging(unittest.TestCase):
+    """큐 기반 비동기 로깅 테스트 케이스"""
+
+    def test_drop_policy_counts_dropped_records(self):
+        """큐가 가득 차면 새 레코드를 버리고 개수를 세는지 테스트"""
+        handler = OverflowQueueHandler(queue.Queue(maxsize=2), policy="drop")
+        test_logger = make_logger("test.drop", handler)
+        for i in range(5):
+            test_logger.info(f"메시지 {i}")
+
+        self.assertEqual(handler.stats.enqueued, 2)
+        self.assertEqual(handler.stats.dropped, 3)
+
+    def test_sample_policy_keeps_warnings(self):
+        """sample 정책은 큐가 절반 이상 차면 INFO만 표본 추출하고 WARNING은 유지하는지 테스트"""
+        handler = OverflowQueueHandler(queue.Queue(maxsize=10), policy="sample",
+                                       sample_rate=0.5, rng=iter([0.9, 0.1] * 10).__next__)
+        test_logger = make_logger("test.sample", handler)
+        for i in range(5):
+            test_logger.info(f"채우기 {i}")
+        test_logger.info("버려짐")
+        test_logger.info("통과")
+        test_logger.warning("경고")
+
+        self.assertEqual(handler.stats.sampled_out, 1)
+        self.assertEqual(handler.stats.enqueued, 7)
+
+    def test_block_policy_times_out(self):
+        """block 정책은 대기 시간 초과 후 레코드를 버리는지 테스트"""
+        handler = OverflowQueueHandler(queue.Queue(maxsize=1), policy="block", block_timeout=0.01)
+        test_logger = make_logger("test.block", handler)
+        test_logger.info("첫 번째")
+        test_logger.info("두 번째")
+
+        self.assertEqual(handler.stats.blocked, 1)
+        self.assertEqual(handler.stats.dropped, 1)
+
+    def test_counters_from_many_threads(self):
+        """여러 스레드가 동시에 로그를 남겨도 접수/버림 카운터 합계가 정확한지 테스트"""
+        handler = OverflowQueueHandler(queue.Queue(maxsize=500), policy="drop")
+        test_logger = make_logger("test.threads", handler)
+
+        def produce():
+            for i in range(1000):
+                test_logger.info("메시지")
+
+        threads = [threading.Thread(target=produce) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = handler.stats.to_dict()
+        self.assertEqual(stats["enqueued"], 500)
+        self.assertEqual(stats["enqueued"] + stats["dropped"], 8000)
+
+    def test_listener_tracks_its_thread(self):
+        """리스너가 자기 스레드로 실행 상태를 관리하고 중복 시작/중지가 안전한지 테스트"""
+        log_queue = queue.Queue()
+        listener = BatchingQueueListener(log_queue, logging.NullHandler())
+        self.assertFalse(listener.is_running())
+        listener.start()
+        listener.start()
+        self.assertTrue(listener.is_running())
+        listener.stop()
+        listener.stop()
+        self.assertFalse(listener.is_running())
+
+    def test_unknown_policy(self):
+        """알 수 없는 overflow 정책은 ValueError가 발생하는지 테스트"""
+        with self.assertRaises(ValueError):
+            OverflowQueueHandler(queue.Queue(), policy="ignore")
+
+    def test_listener_writes_in_batches(self):
+        """리스너가 모든 레코드를 JSON으로 기록하되 배치마다 한 번만 flush하는지 테스트"""
+        stream = CountingStream()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(JSONFormatter())
+        stats = AsyncLogStats()
+        log_queue = queue.Queue(maxsize=1000)
+        handler = OverflowQueueHandler(log_queue, policy="block", stats=stats)
+        listener = BatchingQueueListener(log_queue, target, batch_size=50, stats=stats)
+        test_logger = make_logger("test.batch", handler)
+
+        # 리스너 시작 전에 쌓아 두어 배치 단위 처리를 확인
+        for i in range(200):
+            test_logger.info(f"요청 {i} 처리", context={"i": i})
+        try:
+            raise ValueError("테스트 오류")
+        except ValueError as e:
+            test_logger.error("오류 발생", error=e)
+        listener.start()
+        listener.stop()
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(len(lines), 201)
+        self.assertEqual(lines[5]["message"], "요청 5 처리")
+        self.assertEqual(lines[5]["context"], {"i": 5})
+        self.assertEqual(lines[-1]["exception"]["type"], "ValueError")
+        self.assertEqual(stats.written, 201)
+        self.assertLessEqual(stream.flushes, 5)
+
+    def test_start_and_stop_async_logging(self):
+        """전역 비동기 로깅을 시작/중지하면 남은 레코드가 모두 기록되는지 테스트"""
+        stream = io.StringIO()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(JSONFormatter())
+        handler = logger_module.start_async_logging([target], queue_size=100, policy="block")
+        test_logger = make_logger("test.global", handler)
+        for i in range(20):
+            test_logger.info(f"메시지 {i}")
+
+        self.assertTrue(logger_module.get_logging_stats()["async"])
+        logger_module.stop_async_logging()
+        self.assertEqual(len(stream.getvalue().splitlines()), 20)
+        self.assertEqual(logger_module.get_logging_stats(), {"async": False})
+
+class RecordingHandler(logging.Handler):
+    """받은 레코드를 보관하는 핸들러"""
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+class TestLazyContext(unittest.TestCase):
+    """지연 컨텍스트 테스트 케이스"""
+
+    def setUp(self):
+        self.handler = RecordingHandler()
+        self.logger = make_logger("test.lazy", self.handler, level=logging.INFO)
+        self.calls = 0
+
+    def build_context(self):
+        self.calls += 1
+        return {"top_keywords": ["AI", "SEO"]}
+
+    def test_builder_skipped_when_level_disabled(self):
+        """비활성 레벨에서는 컨텍스트 함수가 호출되지 않는지 테스트"""
+        self.logger.debug("디버그", context=self.build_context)
+        self.logger.log_dict(logging.DEBUG, {"a": 1}, context=self.build_context)
+        self.assertEqual(self.calls, 0)
+        self.assertEqual(self.handler.records, [])
+
+    def test_builder_called_once_when_enabled(self):
+        """활성 레벨에서는 컨텍스트 함수가 한 번 호출되어 레코드에 담기는지 테스트"""
+        self.logger.info("정보", context=self.build_context)
+        self.assertEqual(self.calls, 1)
+        record, = self.handler.records
+        self.assertEqual(record.context, {"top_keywords": ["AI", "SEO"]})
+        self.assertEqual(record.funcName, "test_builder_called_once_when_enabled")
+
+    def test_record_points_at_caller(self):
+        """레코드의 함수 이름과 줄 번호가 로거를 호출한 위치를 가리키는지 테스트"""
+        def log_here():
+            self.logger.info("호출 위치", context={"a": 1})
+            return sys._getframe().f_lineno - 1
+
+        lineno = log_here()
+        record, = self.handler.records
+        self.assertEqual((record.funcName, record.lineno), ("log_here", lineno))
+        self.assertEqual(record.module, "test_logger")
+
+    def test_builder_error_does_not_raise(self):
+        """컨텍스트 함수의 오류가 호출 코드로 전파되지 않는지 테스트"""
+        self.logger.warning("경고", context=lambda: {"x": 1 / 0})
+        record, = self.handler.records
+        self.assertIn("ZeroDivisionError", record.context["context_error"])
+
+class TestLogSampler(unittest.TestCase):
+    """로그 샘플링/속도 제한 테스트 케이스"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.handler = RecordingHandler()
+        self.logger = make_logger("test.sampling", self.handler)
+
+    def messages(self):
+        return [r.getMessage() for r in self.handler.records]
+
+    def test_rate_limit_per_key(self):
+        """메시지 키별로 초당 N개까지만 기록하는지 테스트"""
+        self.logger.sampler = LogSampler(rate_limit=2, clock=self.clock, summary_interval=60)
+        for _ in range(5):
+            self.logger.info("요청 시작")
+            self.logger.info("다른 메시지")
+        self.clock.now += 1
+        self.logger.info("요청 시작")
+
+        self.assertEqual(self.messages().count("요청 시작"), 3)
+        self.assertEqual(self.messages().count("다른 메시지"), 2)
+
+    def test_first_n_then_every_mth(self):
+        """처음 N개 이후에는 M번째마다 기록하는지 테스트"""
+        self.logger.sampler = LogSampler(first_n=3, every_m=5, clock=self.clock)
+        for i in range(1, 21):
+            self.logger.info("반복", sample_key="repeat", context={"i": i})
+
+        self.assertEqual([r.context["i"] for r in self.handler.records], [1, 2, 3, 8, 13, 18])
+
+    def test_every_mth_without_first_n(self):
+        """first_n 없이 every_m만 설정해도 M번째마다 기록하는지 테스트"""
+        self.logger.sampler = LogSampler(every_m=4, clock=self.clock)
+        for i in range(1, 13):
+            self.logger.info("반복", sample_key="repeat", context={"i": i})
+
+        self.assertEqual([r.context["i"] for r in self.handler.records], [4, 8, 12])
+
+    def test_level_probability(self):
+        """레벨별 확률 표본 추출은 지정한 레벨에만 적용되는지 테스트"""
+        values = iter([0.05, 0.5, 0.2, 0.9])
+        self.logger.sampler = LogSampler(level_rates=parse_level_rates("DEBUG=0.1, INFO=0.3"),
+                                         clock=self.clock, rng=lambda: next(values))
+        self.logger.debug("d1")
+        self.logger.debug("d2")
+        self.logger.info("i1")
+        self.logger.info("i2")
+        self.logger.warning("w1")
+
+        self.assertEqual(self.messages(), ["d1", "i1", "w1"])
+        with self.assertRaises(ValueError):
+            parse_level_rates("VERBOSE=0.5")
+
+    def test_errors_are_never_sampled(self):
+        """ERROR 이상은 어떤 정책에서도 생략되지 않는지 테스트"""
+        self.logger.sampler = LogSampler(level_rates={logging.ERROR: 0.0}, rate_limit=1,
+                                         first_n=1, clock=self.clock, rng=lambda: 0.99)
+        for _ in range(5):
+            self.logger.error("오류")
+            self.logger.critical("치명적 오류")
+        self.assertEqual(len(self.handler.records), 10)
+
+    def test_periodic_summary(self):
+        """주기마다 생략 건수 요약 레코드가 기록되는지 테스트"""
+        self.logger.sampler = LogSampler(rate_limit=1, clock=self.clock, summary_interval=10)
+        for _ in range(4):
+            self.logger.info("요청 시작")
+        self.clock.now += 11
+        self.logger.info("요청 시작")
+
+        summary = self.handler.records[1]
+        self.assertEqual(summary.getMessage(), "로그 샘플링으로 생략된 레코드 요약")
+        self.assertEqual(summary.context["suppressed"], {"test.sampling:요청 시작": 3})
+        self.assertEqual(summary.context["total"], 3)
+        self.assertIsNone(self.logger.sampler.take_summary(force=True))
+
+    def test_summary_respects_logger_level(self):
+        """INFO가 비활성인 로거는 요약을 기록하지 않고, INFO 로거가 나중에 요약을 기록하는지 테스트"""
+        sampler = LogSampler(rate_limit=1, clock=self.clock, summary_interval=10)
+        self.logger.sampler = sampler
+        for _ in range(3):
+            self.logger.info("요청 시작")
+        quiet_handler = RecordingHandler()
+        quiet_logger = make_logger("test.sampling.quiet", quiet_handler, level=logging.WARNING)
+        quiet_logger.sampler = sampler
+        self.clock.now += 11
+        quiet_logger.warning("경고")
+
+        self.assertEqual([r.getMessage() for r in quiet_handler.records], ["경고"])
+        self.logger.info("다른 메시지")
+        self.assertEqual(self.handler.records[1].getMessage(), "로그 샘플링으로 생략된 레코드 요약")
+        self.assertEqual(self.handler.records[1].context["total"], 2)
+
+    def test_suppressed_records_skip_lazy_context(self):
+        """생략된 레코드의 지연 컨텍스트는 만들지 않는지 테스트"""
+        calls = []
+        self.logger.sampler = LogSampler(rate_limit=1, clock=self.clock)
+        for _ in range(3):
+            self.logger.info("요청", context=lambda: calls.append(1) or {"n": 1})
+        self.assertEqual(len(calls), 1)
+
+class TestJSONFormatter(unittest.TestCase):
+    """JSON 포맷터 테스트 케이스"""
+
+    def make_record(self, msg="메시지", context=None, exc_info=None, lineno=10):
+        record = logging.LogRecord("test.formatter", logging.INFO, "/app/lib/rag_engine.py", lineno,
+                                   msg, None, exc_info, func="generate_analysis_text")
+        record.created = 1700000000.25
+        if context is not None:
+            record.context = context
+        return record
+
+    def test_fields_and_timestamp(self):
+        """필드 구성과 레코드 created 기반 타임스탬프 테스트"""
+        data = json.loads(JSONFormatter().format(self.make_record(context={"키워드": ["AI", 1]})))
+        self.assertEqual(data, {
+            "timestamp": "2023-11-14T22:13:20.250000",
+            "level": "INFO",
+            "module": "rag_engine",
+            "function": "generate_analysis_text",
+            "line": 10,
+            "message": "메시지",
+            "context": {"키워드": ["AI", 1]}
+        })
+
+    def test_backends_produce_same_document(self):
+        """표준 json과 orjson 백엔드가 같은 문서를 만드는지 테스트"""
+        record = self.make_record(context={"n": 1, "nested": {"a": [1.5, None]}})
+        stdlib = JSONFormatter(serializer=get_json_serializer("json")).format(record)
+        fast = JSONFormatter(serializer=get_json_serializer("auto")).format(self.make_record(
+            context={"n": 1, "nested": {"a": [1.5, None]}}))
+        self.assertEqual(json.loads(stdlib), json.loads(fast))
+        with self.assertRaises(ValueError):
+            get_json_serializer("yaml")
+
+    def test_static_fields_cached_per_call_site(self):
+        """같은 호출 위치의 고정 필드는 한 번만 직렬화되는지 테스트"""
+        calls = []
+
+        def counting_dumps(obj):
+            calls.append(obj)
+            return json.dumps(obj)
+
+        formatter = JSONFormatter(serializer=counting_dumps)
+        for i in range(3):
+            formatter.format(self.make_record(msg=f"메시지 {i}"))
+        formatter.format(self.make_record(lineno=20))
+        static_calls = [c for c in calls if isinstance(c, dict) and "level" in c]
+        self.assertEqual(len(static_calls), 2)
+
+    def test_record_formatted_once_for_multiple_handlers(self):
+        """여러 핸들러가 같은 레코드를 기록해도 한 번만 직렬화하는지 테스트"""
+        calls = []
+
+        def counting_dumps(obj):
+            calls.append(obj)
+            return json.dumps(obj)
+
+        formatter = JSONFormatter(serializer=counting_dumps)
+        record = self.make_record(context={"n": 1})
+        first = formatter.format(record)
+        count = len(calls)
+        self.assertEqual(formatter.format(record), first)
+        self.assertEqual(len(calls), count)
+
+    def test_exception_info(self):
+        """예외 정보가 구조화되어 기록되는지 테스트"""
+        try:
+            raise KeyError("없는 키")
+        except KeyError:
+            record = self.make_record(exc_info=sys.exc_info())
+        data = json.loads(JSONFormatter().format(record))
+        self.assertEqual(data["exception"]["type"], "KeyError")
+        self.assertIn("raise KeyError", "".join(data["exception"]["traceback"]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import sys
+import os
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.cache import CacheStats
+from lib.metrics import MetricsRegistry, _Metric, parse_buckets, metrics_registry
+from tests.helpers import call_app
+
+class TestMetricsRegistry(unittest.TestCase):
+    """지표 레지스트리 테스트 케이스"""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """히스토그램이 버킷 경계를 포함(le)하여 누적 카운트로 출력되는지 테스트"""
+        registry = MetricsRegistry(prefix="test")
+        histogram = registry.histogram("latency_seconds", "지연", ("route",), buckets=(0.1, 1))
+        child = histogram.labels("/a")
+        for value in (0.05, 0.1, 0.5, 3):
+            child.observe(value)
+
+        text = registry.render()
+        self.assertIn("# TYPE test_latency_seconds histogram", text)
+        self.assertIn('test_latency_seconds_bucket{route="/a",le="0.1"} 2', text)
+        self.assertIn('test_latency_seconds_bucket{route="/a",le="1"} 3', text)
+        self.assertIn('test_latency_seconds_bucket{route="/a",le="+Inf"} 4', text)
+        self.assertIn('test_latency_seconds_sum{route="/a"} 3.65', text)
+        self.assertIn('test_latency_seconds_count{route="/a"} 4', text)
+
+    def test_counter_gauge_and_cache_collector(self):
+        """카운터/게이지 출력과 캐시 통계 수집기의 히트율 계산 테스트"""
+        registry = MetricsRegistry(prefix="test")
+        registry.counter("errors", "오류", ("route",)).labels('/a"b').inc(2)
+        gauge = registry.gauge("in_flight", "처리 중")
+        gauge.set(3)
+        stats = CacheStats(hits=3, misses=1)
+        registry.register_cache("search", lambda: stats)
+
+        text = registry.render()
+        self.assertIn('test_errors_total{route="/a\\"b"} 2', text)
+        self.assertIn("test_in_flight 3", text)
+        self.assertIn('test_cache_hits_total{cache="search"} 3', text)
+        self.assertIn('test_cache_hit_ratio{cache="search"} 0.75', text)
+
+    def test_label_count_and_redefinition(self):
+        """라벨 개수가 틀리거나 같은 이름을 다른 형태로 등록하면 ValueError가 발생하는지 테스트"""
+        registry = MetricsRegistry(prefix="test")
+        counter = registry.counter("requests", "요청", ("route",))
+        self.assertIs(registry.counter("requests", "요청", ("route",)), counter)
+        with self.assertRaises(ValueError):
+            counter.labels("/a", "GET")
+        with self.assertRaises(ValueError):
+            registry.gauge("requests", "요청", ("route",))
+        with self.assertRaises(ValueError):
+            parse_buckets(" , ")
+
+    def test_incomplete_metric_rejected(self):
+        """samples를 구현하지 않은 지표는 생성 시점에 실패하는지 테스트"""
+        class PartialMetric(_Metric):
+            def _new_child(self):
+                return None
+
+        with self.assertRaises(TypeError):
+            PartialMetric("partial", "미완성 지표")
+
+class TestMetricsMiddleware(unittest.TestCase):
+    """지표 미들웨어와 /metrics 엔드포인트 테스트 케이스"""
+
+    def setUp(self):
+        """전역 지표 초기화"""
+        from api.main import app
+        self.app = app
+        metrics_registry.reset()
+
+    def test_requests_recorded_by_route_template(self):
+        """요청이 라우트 템플릿 라벨로 기록되고 /metrics에 노출되는지 테스트"""
+        status, _ = call_app(self.app, "GET", "/")
+        self.assertEqual(status, 200)
+        status, _ = call_app(self.app, "GET", "/api/notify/tickets/없는-티켓")
+        self.assertEqual(status, 404)
+        call_app(self.app, "GET", "/no/such/path")
+
+        status, text = call_app(self.app, "GET", "/metrics")
+        self.assertEqual(status, 200)
+        self.assertIn('keywordpulse_http_requests_total{method="GET",route="/",status="200"} 1', text)
+        self.assertIn('keywordpulse_http_requests_total{method="GET",route="/api/notify/tickets/{ticket_id}",status="404"} 1', text)
+        self.assertIn('keywordpulse_http_requests_total{method="GET",route="unmatched",status="404"} 1', text)
+        self.assertIn('keywordpulse_http_request_duration_seconds_count{method="GET",route="/"} 1', text)
+        # /metrics 자신을 처리하는 동안 처리 중 게이지에 잡힘
+        self.assertIn('keywordpulse_http_requests_in_flight{route="/metrics"} 1', text)
+        self.assertIn('keywordpulse_http_requests_in_flight{route="/"} 0', text)
+        self.assertIn('keywordpulse_cache_hit_ratio{cache="search"}', text)
+
+if __name__ == "__main__":
+    unittest.main()
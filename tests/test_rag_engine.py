@@ -1,4 +1,5 @@
 import unittest
+import json
 import sys
 import os
 from unittest import mock
@@ -8,7 +9,10 @@ from typing import List, Dict, Any
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # lib 모듈에서 RAG 엔진 임포트
-from lib.rag_engine import generate_analysis_text, generate_with_llm
+from lib.rag_engine import (
+    generate_analysis_text, generate_with_llm, iter_analysis_text, stream_analysis_text, ANALYSIS_ERROR_TEXT
+)
+from tests.helpers import call_app
 
 class TestRagEngine(unittest.TestCase):
     """RAG 엔진 테스트 케이스"""
@@ -110,5 +114,82 @@ class TestRagEngine(unittest.TestCase):
         # 추천 전략 섹션이 없는지 확인
         self.assertNotIn("## 추천 전략", result)
 
+class TestAnalysisStreaming(unittest.TestCase):
+    """분석 텍스트 스트리밍 테스트 케이스"""
+    
+    def setUp(self):
+        """테스트 데이터 설정"""
+        self.keywords = [
+            {"keyword": f"키워드 {i}", "monthlySearches": 1000 * i, "competitionRate": 0.3, "score": 60 + i * 5}
+            for i in range(8)
+        ]
+    
+    def test_chunks_join_to_full_text(self):
+        """섹션 조각을 이어 붙이면 generate_analysis_text 결과와 같은지 테스트"""
+        chunks = list(iter_analysis_text(self.keywords))
+        self.assertGreater(len(chunks), 5)
+        self.assertTrue(chunks[0].startswith("이번 분석된 키워드 중 '키워드 7'"))
+        self.assertEqual("".join(chunks), generate_analysis_text(self.keywords))
+        self.assertEqual(list(iter_analysis_text([])), ["분석할 키워드가 없습니다."])
+    
+    def test_stream_error_appends_notice(self):
+        """생성 도중 오류가 나면 보낸 내용 뒤에 오류 안내를 붙이고 끝나는지 테스트"""
+        broken = self.keywords + [{"score": 99}]  # keyword 키 없음
+        chunks = list(stream_analysis_text(broken))
+        self.assertTrue(chunks[-1].endswith(ANALYSIS_ERROR_TEXT))
+        self.assertEqual(generate_analysis_text(broken), ANALYSIS_ERROR_TEXT)
+    
+    def test_stream_endpoint(self):
+        """/api/analyze/stream이 여러 청크로 텍스트 또는 SSE를 보내는지 테스트"""
+        from api.main import app, build_keywords_info
+        names = [kw["keyword"] for kw in self.keywords]
+        body = json.dumps({"keywords": names}).encode("utf-8")
+        expected = generate_analysis_text(build_keywords_info(names))
+        
+        messages = []
+        status, text, headers = call_app(app, "POST", "/api/analyze/stream", body=body,
+                                         with_headers=True, messages=messages)
+        self.assertEqual(status, 200)
+        self.assertTrue(headers["content-type"].startswith("text/markdown"))
+        self.assertEqual(text, expected)
+        chunks = [m for m in messages if m["type"] == "http.response.body" and m.get("body")]
+        self.assertGreater(len(chunks), 1)
+        
+        status, text, headers = call_app(app, "POST", "/api/analyze/stream", body=body, with_headers=True,
+                                         headers={"Accept": "text/event-stream"})
+        self.assertTrue(headers["content-type"].startswith("text/event-stream"))
+        events = text.split("\n\n")
+        self.assertEqual(events[-2], "event: end\ndata: ")
+        data = ["\n".join(line[len("data: "):] for line in event.split("\n")) for event in events[:-2]]
+        self.assertEqual("".join(data), expected)
+
+    def test_sse_normalizes_carriage_returns(self):
+        """키워드에 CR/CRLF가 있어도 모든 줄이 data 필드로만 나가는지 테스트"""
+        from api.main import format_sse_events
+        text = "".join(format_sse_events(iter(["a\r\nevent: evil\rid: 9\n끝"])))
+        self.assertNotIn("\r", text)
+        self.assertEqual(text, "data: a\ndata: event: evil\ndata: id: 9\ndata: 끝\n\nevent: end\ndata: \n\n")
+
+    def test_stream_span_covers_body(self):
+        """스트리밍 추적 구간이 핸들러 반환이 아니라 본문 생성 전체를 측정하는지 테스트"""
+        import tempfile
+        from fastapi import FastAPI
+        from api.main import stream_analysis_api
+        from lib.tracing import ChromeTraceExporter, TracingMiddleware, load_chrome_trace
+
+        app = FastAPI()
+        app.post("/api/analyze/stream")(stream_analysis_api)
+        body = json.dumps({"keywords": [kw["keyword"] for kw in self.keywords]}).encode("utf-8")
+        with tempfile.TemporaryDirectory() as tmp:
+            exporter = ChromeTraceExporter(os.path.join(tmp, "trace.json"))
+            app.add_middleware(TracingMiddleware, exporter=exporter)
+            status, _ = call_app(app, "POST", "/api/analyze/stream", body=body)
+            exporter.flush()
+            events = load_chrome_trace(exporter.path)
+        self.assertEqual(status, 200)
+        stream_event, = [e for e in events if e["name"] == "api.analyze_stream"]
+        self.assertGreater(stream_event["args"]["chunks"], 5)
+        self.assertEqual(stream_event["args"]["parent_id"], events[0]["args"]["span_id"])
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
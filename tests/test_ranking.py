@@ -0,0 +1,54 @@
+import unittest
+import random
+import sys
+import os
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.ranking import rank_top_k
+
+def reference_top(keywords, k):
+    """비교 기준: 기존 전체 정렬 방식"""
+    return sorted(keywords, key=lambda x: x.get('score', 0), reverse=True)[:k]
+
+class TestRankTopK(unittest.TestCase):
+    """상위 k개 선별 테스트 케이스"""
+
+    def test_matches_sorted_with_ties(self):
+        """동점이 많은 입력에서도 전체 정렬과 같은 항목을 같은 순서로 고르는지 테스트"""
+        rng = random.Random(7)
+        for n in (0, 1, 4, 5, 6, 50, 1000):
+            keywords = [{"keyword": f"키워드 {i}", "score": rng.randint(0, 10)} for i in range(n)]
+            for k in (0, 1, 5, n + 3):
+                result = rank_top_k(keywords, k=k)
+                expected = reference_top(keywords, k)
+                self.assertEqual([id(kw) for kw in result.top], [id(kw) for kw in expected])
+                self.assertEqual(result.total, n)
+
+    def test_threshold_buckets(self):
+        """기준 점수별 구간 개수와 이상 개수가 직접 센 값과 같은지 테스트"""
+        rng = random.Random(3)
+        keywords = [{"keyword": str(i), "score": rng.uniform(0, 100)} for i in range(500)]
+        keywords += [{"keyword": "경계", "score": 80}, {"keyword": "점수 없음"}]
+        result = rank_top_k(keywords, k=5, thresholds=(80, 50))
+
+        self.assertEqual(result.thresholds, (50, 80))
+        self.assertEqual(sum(result.buckets), len(keywords))
+        for threshold in (50, 80):
+            expected = sum(1 for kw in keywords if kw.get('score', 0) >= threshold)
+            self.assertEqual(result.count_at_least(threshold), expected)
+        self.assertEqual(result.buckets[0], sum(1 for kw in keywords if kw.get('score', 0) < 50))
+        with self.assertRaises(ValueError):
+            result.count_at_least(90)
+
+    def test_generator_and_custom_key(self):
+        """제너레이터 입력과 다른 점수 필드에서도 동작하는지 테스트"""
+        keywords = [{"keyword": str(i), "volume": i % 7} for i in range(30)]
+        result = rank_top_k((kw for kw in keywords), k=3, thresholds=(6,), key="volume")
+        expected = sorted(keywords, key=lambda x: x["volume"], reverse=True)[:3]
+        self.assertEqual(result.top, expected)
+        self.assertEqual(result.count_at_least(6), 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import unittest
+import random
+import sys
+import os
+import json
+import tempfile
+from array import array
+from unittest import mock
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib import scoring
+from lib.scoring import ScoringProfile, CompiledProfile, get_profile, load_profiles
+from lib.search_utils import calculate_score, get_recommendation_label, apply_scoring_profile
+
+class TestScoring(unittest.TestCase):
+    """키워드 점수화 엔진 테스트 케이스"""
+
+    def setUp(self):
+        """무작위 및 경계값 테스트 데이터 설정"""
+        rng = random.Random(42)
+        self.searches = [rng.randint(0, 60000) for _ in range(5000)]
+        self.rates = [round(rng.uniform(0, 1), 2) for _ in range(5000)]
+        # 반올림 경계(.5)와 범위 경계 값
+        self.searches += [0, 1000, 3000, 10000, 10001, 50000, 5000, 0]
+        self.rates += [0.0, 0.91, 0.97, 0.0, 1.0, 0.5, 0.25, 1.0]
+
+    def expected(self):
+        scores = [calculate_score(m, c) for m, c in zip(self.searches, self.rates)]
+        return scores, [get_recommendation_label(s) for s in scores]
+
+    def test_scalar_wrappers_keep_behavior(self):
+        """기존 단건 함수 결과가 유지되는지 테스트"""
+        self.assertEqual(calculate_score(10000, 0.0), 100)
+        self.assertEqual(calculate_score(0, 1.0), 0)
+        self.assertEqual(calculate_score(5000, 0.5), 50)
+        self.assertEqual(get_recommendation_label(80), "Highly Recommended")
+        self.assertEqual(get_recommendation_label(50), "Recommended")
+        self.assertEqual(get_recommendation_label(49), "Low Priority")
+
+    @unittest.skipIf(scoring.np is None, "NumPy가 설치되지 않음")
+    def test_numpy_matches_scalar(self):
+        """NumPy 일괄 계산 결과가 단건 함수와 동일한지 테스트"""
+        expected_scores, expected_labels = self.expected()
+        scores, labels = scoring.score_and_label_many(
+            scoring.np.array(self.searches), scoring.np.array(self.rates)
+        )
+        self.assertEqual(scores.tolist(), expected_scores)
+        self.assertEqual(labels.tolist(), expected_labels)
+
+    def test_fallback_matches_scalar(self):
+        """NumPy 없이 array 기반으로 계산한 결과가 단건 함수와 동일한지 테스트"""
+        expected_scores, expected_labels = self.expected()
+        with mock.patch.object(scoring, "np", None):
+            scores, labels = scoring.score_and_label_many(
+                array("q", self.searches), array("d", self.rates)
+            )
+        self.assertEqual(list(scores), expected_scores)
+        self.assertEqual(list(labels), expected_labels)
+
+    def test_length_mismatch(self):
+        """열 길이가 다르면 ValueError가 발생하는지 테스트"""
+        with self.assertRaises(ValueError):
+            scoring.score_many([1, 2], [0.1])
+
+class TestScoringProfiles(unittest.TestCase):
+    """점수화 프로필 테스트 케이스"""
+
+    def setUp(self):
+        """테스트 프로필 설정"""
+        self.profile = CompiledProfile(ScoringProfile(
+            name="niche", volume_baseline=2000, volume_max_points=30,
+            competition_max_points=70, high_threshold=75, mid_threshold=45
+        ))
+
+    def test_default_profile_matches_scalar(self):
+        """기본 프로필이 기존 점수 공식과 같은지 테스트"""
+        default = get_profile()
+        for m, c in [(0, 1.0), (5000, 0.5), (25000, 0.25), (1000, 0.91)]:
+            self.assertEqual(default.score(m, c), calculate_score(m, c))
+        for score in range(101):
+            self.assertEqual(default.label(score), get_recommendation_label(score))
+
+    def test_custom_profile(self):
+        """사용자 정의 프로필의 점수와 레이블 계산 테스트"""
+        # 2000회 이상이면 검색량 점수 만점(30) + 경쟁률 점수 70×0.5(35) → 65점
+        self.assertEqual(self.profile.score(4000, 0.5), 65)
+        self.assertEqual(self.profile.label(75), "Highly Recommended")
+        self.assertEqual(self.profile.label(45), "Recommended")
+        self.assertEqual(self.profile.label(44), "Low Priority")
+
+    def test_custom_profile_bulk_matches_scalar(self):
+        """사용자 정의 프로필의 일괄 계산 결과가 단건 계산과 같은지 테스트"""
+        searches = [0, 500, 1999, 2000, 4000, 60000]
+        rates = [0.0, 0.33, 0.5, 0.95, 0.5, 1.0]
+        scores, labels = self.profile.score_and_label_many(searches, rates)
+        expected = [self.profile.score(m, c) for m, c in zip(searches, rates)]
+        self.assertEqual(list(scores), expected)
+        self.assertEqual(list(labels), [self.profile.label(s) for s in expected])
+
+    def test_validation(self):
+        """유효하지 않은 프로필이 거부되는지 테스트"""
+        with self.assertRaises(ValueError):
+            CompiledProfile(ScoringProfile(name="bad", volume_baseline=0))
+        with self.assertRaises(ValueError):
+            CompiledProfile(ScoringProfile(name="bad", high_threshold=40, mid_threshold=50))
+        with self.assertRaises(ValueError):
+            get_profile("존재하지 않는 프로필")
+
+    def test_load_profiles_from_file(self):
+        """JSON 파일에서 프로필을 읽어 이름으로 조회할 수 있는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profiles.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"test_aggressive": {"volume_baseline": 5000, "high_threshold": 70}}, f)
+            load_profiles(path)
+
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"test_typo": {"volume_basline": 5000}}, f)
+            with self.assertRaises(ValueError):
+                load_profiles(path)
+
+        profile = get_profile("test_aggressive")
+        self.assertEqual(profile.score(5000, 0.5), 75)
+        self.assertEqual(profile.label(70), "Highly Recommended")
+        self.assertIsInstance(profile.profile.volume_baseline, float)
+        self.assertIsInstance(profile.profile.high_threshold, int)
+
+    def test_load_profiles_rejects_non_numeric(self):
+        """숫자가 아닌 값은 프로필과 필드 이름을 담은 ValueError로 거부되는지 테스트"""
+        cases = [{"volume_baseline": "x"}, {"high_threshold": None}, {"mid_threshold": True},
+                 {"high_threshold": 70.5}]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profiles.json")
+            for values in cases + ["not an object"]:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump({"test_broken": values}, f)
+                with self.assertRaises(ValueError) as ctx:
+                    load_profiles(path)
+                self.assertIn("test_broken", str(ctx.exception))
+        with self.assertRaises(ValueError):
+            get_profile("test_broken")
+        with self.assertRaisesRegex(ValueError, "volume_baseline"):
+            CompiledProfile(ScoringProfile(name="bad", volume_baseline="10000"))
+
+    def test_apply_scoring_profile(self):
+        """검색 결과가 프로필 기준으로 재점수화되고 원본은 유지되는지 테스트"""
+        keywords = [{"keyword": "AI", "monthlySearches": 4000, "competitionRate": 0.5,
+                     "score": 45, "recommendation": "Low Priority"}]
+        rescored = apply_scoring_profile(keywords, self.profile)
+        self.assertEqual(rescored[0]["score"], 65)
+        self.assertEqual(rescored[0]["recommendation"], "Recommended")
+        self.assertEqual(keywords[0]["score"], 45)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import unittest
+import asyncio
+import sys
+import os
+from unittest import mock
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.cache import MemoryCache
+from lib.singleflight import SingleFlight
+from lib import search_utils
+
+class FakeClock:
+    """테스트용 수동 시계"""
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """검색 캐시 stale-while-revalidate 정책 테스트 케이스"""
+
+    def setUp(self):
+        """수동 시계를 쓰는 검색 캐시로 교체"""
+        self.clock = FakeClock()
+        cache = MemoryCache(default_ttl=100, clock=self.clock)
+        self.patches = [
+            mock.patch.object(search_utils, "search_cache", cache),
+            mock.patch.object(search_utils, "search_flight", SingleFlight()),
+            mock.patch.object(search_utils, "swr_stats", search_utils.SWRStats()),
+            mock.patch.object(search_utils, "SEARCH_CACHE_SOFT_TTL", 10),
+        ]
+        for p in self.patches:
+            p.start()
+        self.calls = []
+
+        def fake_search(keyword):
+            self.calls.append(keyword)
+            return [{"keyword": keyword, "version": len(self.calls)}]
+
+        self.patches.append(mock.patch("lib.search_utils.search_keywords", side_effect=fake_search))
+        self.patches[-1].start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    def test_fresh_entry_is_served_without_refresh(self):
+        """소프트 TTL 이내의 캐시는 갱신 없이 반환되는지 테스트"""
+        async def run():
+            first = await search_utils.get_search_results("AI 마케팅")
+            self.clock.now += 5
+            second = await search_utils.get_search_results("AI 마케팅")
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertFalse(second.stale)
+        self.assertEqual(second.age, 5)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_stale_entry_is_served_and_refreshed(self):
+        """소프트 TTL이 지난 캐시는 즉시 반환되고 백그라운드에서 갱신되는지 테스트"""
+        async def run():
+            await search_utils.get_search_results("AI 마케팅")
+            self.clock.now += 20
+            stale = await search_utils.get_search_results("AI 마케팅")
+            # 백그라운드 갱신 완료 대기
+            await asyncio.gather(*list(search_utils._refresh_tasks))
+            fresh = await search_utils.get_search_results("AI 마케팅")
+            return stale, fresh
+
+        stale, fresh = asyncio.run(run())
+        self.assertTrue(stale.cached)
+        self.assertTrue(stale.stale)
+        self.assertEqual(stale.keywords[0]["version"], 1)
+        self.assertFalse(fresh.stale)
+        self.assertEqual(fresh.keywords[0]["version"], 2)
+        self.assertEqual(search_utils.swr_stats.refreshes, 1)
+
+    def test_hard_ttl_expired_entry_waits_for_search(self):
+        """하드 TTL이 지난 캐시는 반환되지 않고 새 검색을 기다리는지 테스트"""
+        async def run():
+            await search_utils.get_search_results("AI 마케팅")
+            self.clock.now += 101
+            return await search_utils.get_search_results("AI 마케팅")
+
+        result = asyncio.run(run())
+        self.assertFalse(result.cached)
+        self.assertEqual(result.keywords[0]["version"], 2)
+
+class TestSearchMany(unittest.TestCase):
+    """일괄 검색 테스트 케이스"""
+
+    def setUp(self):
+        """빈 검색 캐시와 병합기로 교체"""
+        self.patches = [
+            mock.patch.object(search_utils, "search_cache", MemoryCache()),
+            mock.patch.object(search_utils, "search_flight", SingleFlight()),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+    def test_dedupes_and_answers_cache_hits(self):
+        """중복 시드는 한 번만 검색하고 캐시 히트는 검색하지 않는지 테스트"""
+        search_utils.save_to_cache("캐시됨", [{"keyword": "캐시됨"}])
+
+        with mock.patch("lib.search_utils.search_keywords",
+                        side_effect=lambda k: [{"keyword": k}]) as mock_search:
+            results = asyncio.run(search_utils.search_many(["AI 마케팅", " ai 마케팅", "캐시됨", "SEO"]))
+
+        self.assertEqual(mock_search.call_count, 2)
+        self.assertEqual(set(results), {"AI 마케팅", " ai 마케팅", "캐시됨", "SEO"})
+        self.assertIs(results["AI 마케팅"], results[" ai 마케팅"])
+        self.assertTrue(results["캐시됨"].cached)
+        self.assertFalse(results["SEO"].cached)
+
+    def test_per_seed_errors_do_not_fail_batch(self):
+        """일부 시드의 오류가 다른 시드 결과에 영향을 주지 않는지 테스트"""
+        def flaky_search(keyword):
+            if keyword == "실패":
+                raise RuntimeError("upstream error")
+            return [{"keyword": keyword}]
+
+        with mock.patch("lib.search_utils.search_keywords", side_effect=flaky_search):
+            results = asyncio.run(search_utils.search_many(["성공", "실패", "  "]))
+
+        self.assertEqual(results["성공"].keywords, [{"keyword": "성공"}])
+        self.assertIsInstance(results["실패"], RuntimeError)
+        self.assertIsInstance(results["  "], ValueError)
+
+    def test_concurrency_is_bounded(self):
+        """동시 검색 수가 max_concurrency를 넘지 않는지 테스트"""
+        active = []
+        peak = []
+
+        async def fake_coalesced(keyword):
+            active.append(keyword)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(keyword)
+            return [{"keyword": keyword}]
+
+        with mock.patch("lib.search_utils.search_keywords_coalesced", side_effect=fake_coalesced):
+            results = asyncio.run(search_utils.search_many([f"시드 {i}" for i in range(20)],
+                                                           max_concurrency=3))
+
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(max(peak), 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+import unittest
+import asyncio
+import tempfile
+import threading
+import sys
+import os
+from unittest import mock
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib import google_client
+from lib.sheets_sync import SheetSyncBuffer
+from tests.test_google_client import FakeClient, FakeSpreadsheet
+
+class FakeSheetWriter:
+    """지정한 횟수만큼 실패한 뒤 가짜 시트에 행을 기록하는 쓰기 함수"""
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+        self.threads = set()
+
+    def __call__(self, rows):
+        self.threads.add(threading.get_ident())
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("Sheets API 503")
+        self.batches.append(list(rows))
+        return "https://docs.google.com/spreadsheets/d/sheet-1"
+
+def make_keywords(prefix, n):
+    return [{"keyword": f"{prefix}{i}", "score": i} for i in range(n)]
+
+class TestSheetSyncBuffer(unittest.TestCase):
+    """Google Sheets 동기화 버퍼 테스트 케이스"""
+
+    def setUp(self):
+        """임시 보관 파일 경로 설정"""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.spill_path = os.path.join(tmp.name, "spill", "rows.jsonl")
+
+    def test_size_threshold_flushes_in_one_batch(self):
+        """행 수 기준에 도달하면 누적된 요청들이 한 번에 기록되는지 테스트"""
+        writer = FakeSheetWriter()
+        buffer = SheetSyncBuffer(write=writer, max_rows=6, flush_interval=60, spill_path=self.spill_path)
+
+        async def run():
+            pending = [buffer.add(make_keywords(f"k{r}-", 2), "2023-01-01") for r in range(3)]
+            self.assertEqual(pending, [2, 4, 6])
+            # add()는 기록을 기다리지 않고 반환
+            self.assertEqual(writer.batches, [])
+            for _ in range(100):
+                if writer.batches:
+                    break
+                await asyncio.sleep(0.01)
+            await buffer.stop()
+
+        asyncio.run(run())
+        self.assertEqual(len(writer.batches), 1)
+        self.assertEqual([row[0] for row in writer.batches[0]],
+                         ["k0-0", "k0-1", "k1-0", "k1-1", "k2-0", "k2-1"])
+        self.assertNotIn(threading.get_ident(), writer.threads)
+        self.assertEqual(buffer.get_stats()["written_rows"], 6)
+
+    def test_time_threshold_flushes(self):
+        """행 수가 적어도 대기 시간이 지나면 기록되는지 테스트"""
+        writer = FakeSheetWriter()
+        buffer = SheetSyncBuffer(write=writer, max_rows=1000, flush_interval=0.05,
+                                 spill_path=self.spill_path)
+
+        async def run():
+            buffer.add(make_keywords("a", 1), "2023-01-01")
+            buffer.add(make_keywords("b", 1), "2023-01-01")
+            await asyncio.sleep(0.2)
+            await buffer.stop()
+
+        asyncio.run(run())
+        self.assertEqual([[row[0] for row in batch] for batch in writer.batches], [["a0", "b0"]])
+
+    def test_failed_flush_spills_and_replays_in_order(self):
+        """기록 실패 시 디스크에 보관했다가 다음 플러시에서 순서대로 다시 기록하는지 테스트"""
+        # 플러시와 종료 시 재시도가 모두 실패
+        writer = FakeSheetWriter(failures=2)
+        buffer = SheetSyncBuffer(write=writer, max_rows=1000, flush_interval=60,
+                                 spill_path=self.spill_path)
+
+        async def fail_then_restart():
+            buffer.add(make_keywords("old", 2), "2023-01-01")
+            self.assertFalse(await buffer.flush())
+            await buffer.stop()
+
+        asyncio.run(fail_then_restart())
+        self.assertTrue(os.path.exists(self.spill_path))
+        self.assertEqual(buffer.get_stats()["spilled_rows"], 2)
+
+        # 프로세스 재시작 후 새 버퍼가 보관 파일을 이어받음
+        restarted = SheetSyncBuffer(write=writer, max_rows=1000, flush_interval=60,
+                                    spill_path=self.spill_path)
+        self.assertEqual(restarted.pending(), 2)
+
+        async def replay():
+            restarted.add(make_keywords("new", 1), "2023-01-01")
+            self.assertTrue(await restarted.flush())
+            await restarted.stop()
+
+        asyncio.run(replay())
+        self.assertEqual([row[0] for row in writer.batches[0]], ["old0", "old1", "new0"])
+        self.assertFalse(os.path.exists(self.spill_path))
+        self.assertEqual(restarted.pending(), 0)
+
+    def test_backlog_is_written_in_chunks(self):
+        """보관된 행이 많으면 max_rows개씩 나누어 기록하고, 조각마다 보관 파일을 줄이는지 테스트"""
+        async def fail():
+            failing = SheetSyncBuffer(write=FakeSheetWriter(failures=1), max_rows=1000, flush_interval=60,
+                                      spill_path=self.spill_path)
+            failing.add(make_keywords("s", 5), "2023-01-01")
+            await failing.flush()
+
+        asyncio.run(fail())
+
+        batches = []
+        remaining = []
+
+        def write(rows):
+            # 세 번째 조각에서 실패
+            if len(batches) == 2:
+                raise RuntimeError("Sheets API 503")
+            batches.append([row[0] for row in rows])
+            remaining.append(buffer.stats.spilled_rows)
+            return "https://docs.google.com/spreadsheets/d/sheet-1"
+
+        buffer = SheetSyncBuffer(write=write, max_rows=2, flush_interval=60, spill_path=self.spill_path)
+
+        async def drain():
+            buffer.add(make_keywords("n", 1), "2023-01-01")
+            return await buffer.flush()
+
+        self.assertFalse(asyncio.run(drain()))
+        self.assertEqual(batches, [["s0", "s1"], ["s2", "s3"]])
+        # 조각을 기록하기 직전의 보관 행 수: 앞 조각이 성공할 때마다 줄어듦
+        self.assertEqual(remaining, [5, 3])
+        self.assertEqual([row[0] for row in buffer._read_spill()], ["s4", "n0"])
+        self.assertEqual(buffer.stats.written_rows, 4)
+
+    def test_stop_flushes_remaining_rows(self):
+        """종료 시 남은 행을 기록하는지 테스트"""
+        writer = FakeSheetWriter()
+        buffer = SheetSyncBuffer(write=writer, max_rows=1000, flush_interval=60,
+                                 spill_path=self.spill_path)
+
+        async def run():
+            buffer.add(make_keywords("x", 3), "2023-01-01")
+            await buffer.stop()
+
+        asyncio.run(run())
+        self.assertEqual(len(writer.batches[0]), 3)
+
+    def test_stop_waits_for_in_flight_write(self):
+        """기록 도중 종료해도 진행 중인 배치를 끝까지 기다려 한 번만 기록하고 보관 파일을 남기지 않는지 테스트"""
+        started = threading.Event()
+        release = threading.Event()
+        writer = FakeSheetWriter()
+
+        def slow_writer(rows):
+            started.set()
+            release.wait(5)
+            return writer(rows)
+
+        buffer = SheetSyncBuffer(write=slow_writer, max_rows=2, flush_interval=60,
+                                 spill_path=self.spill_path)
+
+        async def run():
+            buffer.add(make_keywords("f", 2), "2023-01-01")
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, started.wait, 5)
+            stopping = asyncio.ensure_future(buffer.stop())
+            await asyncio.sleep(0.05)
+            self.assertFalse(stopping.done())
+            release.set()
+            await stopping
+
+        asyncio.run(run())
+        self.assertEqual([[row[0] for row in batch] for batch in writer.batches], [["f0", "f1"]])
+        self.assertFalse(os.path.exists(self.spill_path))
+
+    def test_cancelled_write_spills_rows(self):
+        """기록 도중 태스크가 취소되면 행을 디스크에 보관하는지 테스트"""
+        release = threading.Event()
+        buffer = SheetSyncBuffer(write=lambda rows: release.wait(5), max_rows=1000, flush_interval=60,
+                                 spill_path=self.spill_path)
+
+        async def run():
+            buffer.add(make_keywords("c", 3), "2023-01-01")
+            task = asyncio.ensure_future(buffer.flush())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            release.set()
+
+        asyncio.run(run())
+        self.assertEqual(buffer.get_stats()["spilled_rows"], 3)
+        self.assertTrue(os.path.exists(self.spill_path))
+
+    def test_spilled_rows_drained_without_new_rows(self):
+        """재시작 후 새 행이 없어도 start()와 stop()이 보관된 행을 기록하는지 테스트"""
+        async def fail():
+            failing = SheetSyncBuffer(write=FakeSheetWriter(failures=1), max_rows=1000, flush_interval=60,
+                                      spill_path=self.spill_path)
+            failing.add(make_keywords("s", 2), "2023-01-01")
+            await failing.flush()
+
+        asyncio.run(fail())
+
+        # 시작 시 워커가 flush_interval 뒤에 보관된 행을 기록
+        writer = FakeSheetWriter()
+        restarted = SheetSyncBuffer(write=writer, max_rows=1000, flush_interval=0.02,
+                                    spill_path=self.spill_path)
+
+        async def start_and_wait():
+            restarted.start()
+            await asyncio.sleep(0.2)
+            await restarted.stop()
+
+        asyncio.run(start_and_wait())
+        self.assertEqual([[row[0] for row in batch] for batch in writer.batches], [["s0", "s1"]])
+        self.assertEqual(restarted.pending(), 0)
+
+        # 종료 시에도 보관된 행만 남아 있으면 기록
+        asyncio.run(fail())
+        writer = FakeSheetWriter()
+        shutting_down = SheetSyncBuffer(write=writer, max_rows=1000, flush_interval=60,
+                                        spill_path=self.spill_path)
+        asyncio.run(shutting_down.stop())
+        self.assertEqual([[row[0] for row in batch] for batch in writer.batches], [["s0", "s1"]])
+        self.assertFalse(os.path.exists(self.spill_path))
+
+    def test_default_writer_uses_append_api(self):
+        """기본 쓰기 함수가 가짜 gspread 시트에 한 번의 append로 기록하는지 테스트"""
+        calls = []
+        spreadsheets = {"sheet-1": FakeSpreadsheet("sheet-1", calls)}
+        manager = google_client.SheetClientManager(
+            credentials_factory=lambda raw: object() if raw else None,
+            authorize=lambda credentials: FakeClient(calls, spreadsheets)
+        )
+        registry = google_client.SpreadsheetRegistry(os.path.join(os.path.dirname(self.spill_path), "registry.json"))
+        buffer = SheetSyncBuffer(max_rows=1000, flush_interval=60, spill_path=self.spill_path)
+
+        async def run():
+            for r in range(5):
+                buffer.add(make_keywords(f"r{r}-", 4), "2023-01-01")
+            await buffer.flush()
+
+        with mock.patch.object(google_client, "sheet_manager", manager), \
+                mock.patch.object(google_client, "sheet_registry", registry), \
+                mock.patch("lib.sheets_sync.SHEETS_SYNC_SPREADSHEET_ID", "sheet-1"), \
+                mock.patch.dict(os.environ, {"GOOGLE_SERVICE_ACCOUNT": "ZmFrZQ=="}):
+            asyncio.run(run())
+
+        worksheet = spreadsheets["sheet-1"].worksheets["Keywords"]
+        self.assertEqual(worksheet.appends, [20])
+        self.assertEqual(buffer.last_url, "https://docs.google.com/spreadsheets/d/sheet-1")
+
+if __name__ == "__main__":
+    unittest.main()
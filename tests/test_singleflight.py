@@ -0,0 +1,79 @@
+import unittest
+import asyncio
+import time
+import sys
+import os
+from unittest import mock
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.singleflight import SingleFlight
+from lib import search_utils
+
+class TestSingleFlight(unittest.TestCase):
+    """요청 병합 테스트 케이스"""
+
+    def setUp(self):
+        """검색 캐시 및 병합기 초기화"""
+        search_utils.search_cache.clear()
+        search_utils.search_flight = SingleFlight()
+
+    def tearDown(self):
+        search_utils.search_cache.clear()
+
+    def test_concurrent_calls_share_one_execution(self):
+        """동시 호출이 하나의 실행 결과를 공유하는지 테스트"""
+        flight = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def run():
+            return await asyncio.gather(*[flight.do("key", work) for _ in range(20)])
+
+        results = asyncio.run(run())
+        self.assertEqual(results, ["result"] * 20)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.stats.executions, 1)
+        self.assertEqual(flight.stats.coalesced, 19)
+        self.assertEqual(flight.in_flight(), 0)
+
+    def test_exception_propagates_to_all_callers(self):
+        """실행 중 예외가 모든 호출자에게 전달되는지 테스트"""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def run():
+            return await asyncio.gather(*[flight.do("key", fail) for _ in range(3)],
+                                        return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(r, ValueError) for r in results))
+
+    def test_thundering_herd_costs_one_search(self):
+        """같은 키워드(정규화 기준)의 동시 검색이 search_keywords를 한 번만 호출하는지 테스트"""
+        def slow_search(keyword):
+            time.sleep(0.05)
+            return [{"keyword": keyword}]
+
+        async def run():
+            keywords = ["AI 마케팅", " ai 마케팅 "] * 25
+            return await asyncio.gather(*[search_utils.search_keywords_coalesced(k) for k in keywords])
+
+        with mock.patch("lib.search_utils.search_keywords", side_effect=slow_search) as mock_search:
+            results = asyncio.run(run())
+
+        self.assertEqual(mock_search.call_count, 1)
+        self.assertEqual(len(results), 50)
+        self.assertEqual(search_utils.get_search_metrics()["singleflight"]["coalesced"], 49)
+        self.assertIsNotNone(search_utils.get_cached_results("AI 마케팅"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,245 @@
+import unittest
+import asyncio
+import json
+import threading
+import sys
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib import telegram_client
+from lib.telegram_client import AsyncTelegramClient, TelegramAPIError, split_message
+
+class StubTelegramServer:
+    """로컬 텔레그램 봇 API 스텁 서버"""
+
+    def __init__(self):
+        self.requests = []
+        self.responses = []
+        self.client_ports = set()
+        self.delay = 0.0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                stub.requests.append((self.path, body))
+                stub.client_ports.add(self.client_address[1])
+                if stub.delay:
+                    threading.Event().wait(stub.delay)
+                status, data = stub.responses.pop(0) if stub.responses else (
+                    200, {"ok": True, "result": {"message_id": len(stub.requests), "text": body.get("text")}}
+                )
+                payload = json.dumps(data).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+class TestTelegramClient(unittest.TestCase):
+    """비동기 텔레그램 클라이언트 테스트 케이스"""
+
+    def test_connection_is_reused(self):
+        """여러 메시지 전송 시 keep-alive 연결 하나를 재사용하는지 테스트"""
+        with StubTelegramServer() as stub:
+            client = AsyncTelegramClient("TOKEN", "42", api_base=stub.url)
+
+            async def run():
+                try:
+                    return [await client.send_message(f"메시지 {i}") for i in range(5)]
+                finally:
+                    await client.close()
+
+            responses = asyncio.run(run())
+
+        self.assertEqual([r["result"]["message_id"] for r in responses], [1, 2, 3, 4, 5])
+        self.assertEqual(stub.requests[0][0], "/botTOKEN/sendMessage")
+        self.assertEqual(stub.requests[0][1], {"chat_id": "42", "text": "메시지 0", "parse_mode": "Markdown"})
+        self.assertEqual(len(stub.client_ports), 1)
+
+    def test_rate_limit_error_carries_retry_after(self):
+        """429 응답이 retry_after를 포함한 TelegramAPIError로 변환되는지 테스트"""
+        with StubTelegramServer() as stub:
+            stub.responses.append((429, {"ok": False, "error_code": 429,
+                                         "description": "Too Many Requests",
+                                         "parameters": {"retry_after": 7}}))
+            client = AsyncTelegramClient("TOKEN", "42", api_base=stub.url)
+
+            async def run():
+                try:
+                    await client.send_message("hello")
+                finally:
+                    await client.close()
+
+            with self.assertRaises(TelegramAPIError) as ctx:
+                asyncio.run(run())
+
+        self.assertEqual(ctx.exception.status, 429)
+        self.assertEqual(ctx.exception.retry_after, 7)
+
+    def test_read_timeout(self):
+        """응답이 read timeout을 넘으면 TelegramAPIError가 발생하는지 테스트"""
+        with StubTelegramServer() as stub:
+            stub.delay = 0.5
+            client = AsyncTelegramClient("TOKEN", "42", api_base=stub.url, read_timeout=0.1)
+
+            async def run():
+                try:
+                    await client.send_message("hello")
+                finally:
+                    await client.close()
+
+            with self.assertRaises(TelegramAPIError):
+                asyncio.run(run())
+
+    def test_sync_wrapper(self):
+        """동기 래퍼가 공유 클라이언트로 메시지를 전송하는지 테스트"""
+        with StubTelegramServer() as stub:
+            env = {"TELEGRAM_BOT_TOKEN": "TOKEN", "TELEGRAM_CHAT_ID": "42"}
+            with mock.patch.dict(os.environ, env), \
+                    mock.patch.object(telegram_client, "TELEGRAM_API_BASE", stub.url):
+                try:
+                    first = telegram_client.send_telegram_message("첫 번째")
+                    second = telegram_client.send_telegram_message("두 번째")
+                    client = telegram_client.get_telegram_client()
+                finally:
+                    # 백그라운드 루프에서 만든 세션도 다른 루프에서 닫을 수 있어야 함
+                    asyncio.run(telegram_client.close_telegram_clients())
+
+        self.assertEqual(first["result"]["text"], "첫 번째")
+        self.assertEqual(second["result"]["message_id"], 2)
+        self.assertEqual(len(stub.client_ports), 1)
+        self.assertEqual(len(client._sessions), 0)
+
+    def test_test_mode_without_env(self):
+        """환경변수가 없으면 테스트 모드 응답을 반환하는지 테스트"""
+        with mock.patch.dict(os.environ, {}, clear=True):
+            response = asyncio.run(telegram_client.send_telegram_message_async("hello"))
+        self.assertEqual(response["result"]["message_id"], 12345)
+
+    def test_chat_allowlist(self):
+        """기본 채팅과 허용 목록에 있는 채팅만 허용하고, 알림 API가 그 외 채팅을 403으로 거부하는지 테스트"""
+        from api.main import app
+        from tests.helpers import call_app
+
+        env = {"TELEGRAM_CHAT_ID": "100", "TELEGRAM_ALLOWED_CHAT_IDS": "200, 300"}
+        with mock.patch.dict(os.environ, env, clear=True):
+            for chat_id in (None, "", "100", "200", "300"):
+                self.assertTrue(telegram_client.is_chat_allowed(chat_id))
+            self.assertFalse(telegram_client.is_chat_allowed("999"))
+            body = json.dumps({"analysisText": "hello", "chatId": "999", "queued": True}).encode("utf-8")
+            status, payload = call_app(app, "POST", "/api/notify", body=body)
+        self.assertEqual(status, 403)
+        self.assertIn("detail", payload)
+
+        with mock.patch.dict(os.environ, {"TELEGRAM_CHAT_ID": "100"}, clear=True):
+            self.assertFalse(telegram_client.is_chat_allowed("200"))
+
+class TestSplitMessage(unittest.TestCase):
+    """메시지 분할 테스트 케이스"""
+
+    def test_short_message_is_unchanged(self):
+        """길이 제한 이하 메시지는 그대로 반환되는지 테스트"""
+        self.assertEqual(split_message("*짧은* 메시지"), ["*짧은* 메시지"])
+
+    def test_list_items_are_kept_whole(self):
+        """목록 항목이 조각 사이에서 잘리지 않는지 테스트"""
+        lines = [f"• *키워드 {i}*: 검색량 {i * 100:,}회, 점수 {i % 100}점" for i in range(500)]
+        text = "\n".join(lines)
+        chunks = split_message(text, limit=1000)
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) <= 1000 for chunk in chunks))
+        self.assertEqual([line for chunk in chunks for line in chunk.split("\n")], lines)
+
+    def test_bold_span_is_not_cut(self):
+        """긴 줄을 나눌 때 *굵게* 구간 바깥에서 나누는지 테스트"""
+        words = [f"*굵은{i} 단어*" if i % 3 == 0 else f"일반{i}" for i in range(300)]
+        chunks = split_message(" ".join(words), limit=200)
+
+        self.assertTrue(all(len(chunk) <= 200 for chunk in chunks))
+        for chunk in chunks:
+            self.assertEqual(chunk.count("*") % 2, 0)
+        self.assertEqual(" ".join(chunks), " ".join(words))
+
+    def test_unavoidable_cut_reopens_markers(self):
+        """굵게 구간이 제한보다 길면 조각마다 기호를 닫고 다시 여는지 테스트"""
+        chunks = split_message("*" + "굵은 글씨 " * 100 + "끝*", limit=100)
+
+        self.assertTrue(all(len(chunk) <= 100 for chunk in chunks))
+        self.assertTrue(all(chunk.startswith("*") and chunk.endswith("*") for chunk in chunks))
+
+    def test_italic_span_crossing_cut_is_reopened(self):
+        """분할 지점을 가로지르는 _기울임_ 구간은 바깥에서 나누고, 불가피하면 닫고 다시 여는지 테스트"""
+        words = [f"_기울임{i} 단어_" if i % 3 == 0 else f"일반{i}" for i in range(300)]
+        chunks = split_message(" ".join(words), limit=200)
+        self.assertTrue(all(len(chunk) <= 200 for chunk in chunks))
+        for chunk in chunks:
+            self.assertEqual(chunk.count("_") % 2, 0)
+        self.assertEqual(" ".join(chunks), " ".join(words))
+
+        chunks = split_message("_" + "기울임 글씨 " * 100 + "끝_", limit=100)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunk.startswith("_") and chunk.endswith("_") for chunk in chunks))
+
+    def test_links_are_not_cut(self):
+        """[텍스트](URL) 링크가 조각 사이에서 잘리지 않는지 테스트"""
+        words = [f"[링크 {i} 설명](https://example.com/k_{i}?q=a b)" if i % 4 == 0 else f"일반{i}"
+                 for i in range(200)]
+        text = " ".join(words)
+        chunks = split_message(text, limit=150)
+
+        self.assertTrue(all(len(chunk) <= 150 for chunk in chunks))
+        self.assertEqual(" ".join(chunks), text)
+        for chunk in chunks:
+            self.assertEqual(chunk.count("["), chunk.count(")"))
+            # URL 안의 밑줄은 기울임 기호로 취급하지 않음
+            self.assertFalse(chunk.endswith("_"))
+
+class TestLongMessage(unittest.TestCase):
+    """긴 메시지 분할 전송 테스트 케이스"""
+
+    def test_chunks_are_sent_in_order_on_one_connection(self):
+        """조각들이 하나의 연결에서 순서대로 전송되고 모든 메시지 ID가 반환되는지 테스트"""
+        text = "\n".join(f"- *키워드 {i}*: 점수 {i}점" for i in range(600))
+        with StubTelegramServer() as stub:
+            client = AsyncTelegramClient("TOKEN", "42", api_base=stub.url)
+
+            async def run():
+                try:
+                    return await client.send_long_message(text)
+                finally:
+                    await client.close()
+
+            responses = asyncio.run(run())
+
+        sent = [body["text"] for _, body in stub.requests]
+        self.assertGreater(len(sent), 1)
+        self.assertEqual("\n".join(sent), text)
+        self.assertEqual([r["result"]["message_id"] for r in responses], list(range(1, len(sent) + 1)))
+        self.assertEqual(len(stub.client_ports), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+import unittest
+import asyncio
+import sys
+import os
+from unittest import mock
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.telegram_client import TelegramAPIError
+from lib import telegram_queue
+from lib.telegram_queue import TelegramOutbox, TokenBucket
+
+class FakeClock:
+    """테스트용 수동 시계"""
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+class FakeSender:
+    """지정한 오류를 순서대로 발생시킨 뒤 성공하는 가짜 전송 함수"""
+    def __init__(self, errors=None):
+        self.errors = list(errors or [])
+        self.sent = []
+
+    async def __call__(self, chat_id, text):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append((chat_id, text))
+        return {"ok": True, "result": {"message_id": len(self.sent)}}
+
+class TestTokenBucket(unittest.TestCase):
+    """토큰 버킷 테스트 케이스"""
+
+    def test_refill_and_block(self):
+        """토큰 소진, 재충전, retry_after 차단 동작 테스트"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+        bucket.consume()
+        bucket.consume()
+        self.assertAlmostEqual(bucket.wait_time(), 0.5)
+
+        clock.now += 0.5
+        self.assertEqual(bucket.wait_time(), 0.0)
+
+        bucket.block(3)
+        self.assertAlmostEqual(bucket.wait_time(), 3.0)
+        clock.now += 3.5
+        self.assertEqual(bucket.wait_time(), 0.0)
+
+class TestTelegramOutbox(unittest.TestCase):
+    """텔레그램 발신 큐 테스트 케이스"""
+
+    def run_outbox(self, outbox, messages, chat_id="42"):
+        async def run():
+            tickets = [outbox.enqueue(text, chat_id=chat_id) for text in messages]
+            try:
+                return await asyncio.gather(*[outbox.wait(t) for t in tickets])
+            finally:
+                await outbox.stop()
+        return asyncio.run(run())
+
+    def test_burst_is_coalesced_in_order(self):
+        """한꺼번에 쌓인 작은 메시지들이 순서대로 합쳐 한 번에 전송되는지 테스트"""
+        sender = FakeSender()
+        outbox = TelegramOutbox(send=sender, chat_rate=20, chat_burst=1)
+        tickets = self.run_outbox(outbox, [f"알림 {i}" for i in range(10)])
+
+        self.assertTrue(all(t.status == "sent" for t in tickets))
+        self.assertEqual(sender.sent, [("42", "\n\n".join(f"알림 {i}" for i in range(10)))])
+        self.assertEqual(outbox.stats.coalesced, 9)
+        self.assertEqual(outbox.get_stats()["depth"], 0)
+
+    def test_rate_limit_spaces_sends(self):
+        """채팅별 속도 제한을 넘는 전송은 대기 중 쌓인 메시지와 합쳐지는지 테스트"""
+        sender = FakeSender()
+        outbox = TelegramOutbox(send=sender, chat_rate=20, chat_burst=1)
+
+        async def run():
+            first = outbox.enqueue("첫 알림", chat_id="42")
+            await outbox.wait(first)
+            # 토큰이 소진된 상태에서 도착한 메시지들은 다음 토큰까지 모여 함께 전송됨
+            rest = [outbox.enqueue(f"알림 {i}", chat_id="42") for i in range(3)]
+            await asyncio.sleep(0)
+            rest.append(outbox.enqueue("늦은 알림", chat_id="42"))
+            await asyncio.gather(*[outbox.wait(t) for t in rest])
+            await outbox.stop()
+
+        asyncio.run(run())
+        self.assertEqual(len(sender.sent), 2)
+        self.assertEqual(sender.sent[1][1], "알림 0\n\n알림 1\n\n알림 2\n\n늦은 알림")
+
+    def test_large_messages_are_not_coalesced(self):
+        """큰 메시지는 합치지 않고 개별 전송하는지 테스트"""
+        sender = FakeSender()
+        outbox = TelegramOutbox(send=sender, chat_rate=50, chat_burst=1, coalesce_max_chars=10)
+        self.run_outbox(outbox, ["x" * 20, "y" * 20, "z" * 20])
+        self.assertEqual([text for _, text in sender.sent], ["x" * 20, "y" * 20, "z" * 20])
+
+    def test_retry_after_is_respected(self):
+        """429 응답의 retry_after 이후 재시도하여 성공하는지 테스트"""
+        sender = FakeSender([TelegramAPIError("Too Many Requests", status=429, retry_after=0.05)])
+        outbox = TelegramOutbox(send=sender, chat_rate=100, chat_burst=5)
+        ticket, = self.run_outbox(outbox, ["hello"])
+
+        self.assertEqual(ticket.status, "sent")
+        self.assertEqual(ticket.attempts, 2)
+        self.assertEqual(ticket.message_ids, ["1"])
+        self.assertEqual(outbox.stats.rate_limited, 1)
+        self.assertGreaterEqual(ticket.sent_at - ticket.enqueued_at, 0.05)
+
+    def test_retry_after_blocks_other_chats(self):
+        """한 채팅에서 받은 429의 retry_after 동안 다른 채팅으로도 전송하지 않는지 테스트"""
+        sender = FakeSender([TelegramAPIError("Too Many Requests", status=429, retry_after=0.1)])
+        outbox = TelegramOutbox(send=sender, chat_rate=100, chat_burst=5)
+
+        async def run():
+            limited = outbox.enqueue("제한", chat_id="1")
+            await asyncio.sleep(0.01)
+            other = outbox.enqueue("다른 채팅", chat_id="2")
+            try:
+                return await asyncio.gather(outbox.wait(limited), outbox.wait(other))
+            finally:
+                await outbox.stop()
+
+        limited, other = asyncio.run(run())
+        self.assertEqual((limited.status, other.status), ("sent", "sent"))
+        self.assertGreaterEqual(other.sent_at - limited.enqueued_at, 0.1)
+
+    def test_backoff_gives_up_after_max_retries(self):
+        """서버 오류가 계속되면 최대 재시도 후 실패 처리되는지 테스트"""
+        errors = [TelegramAPIError("server error", status=502) for _ in range(5)]
+        outbox = TelegramOutbox(send=FakeSender(errors), chat_rate=100, chat_burst=5,
+                                max_retries=2, backoff_base=0.001)
+        ticket, = self.run_outbox(outbox, ["hello"])
+
+        self.assertEqual(ticket.status, "failed")
+        self.assertEqual(ticket.attempts, 3)
+        self.assertEqual(outbox.stats.retries, 2)
+
+    def test_long_message_resumes_after_failed_chunk(self):
+        """긴 메시지의 조각 전송이 실패하면 실패한 조각부터 재개하는지 테스트"""
+        class FailSecondChunk(FakeSender):
+            async def __call__(self, chat_id, text):
+                if len(self.sent) == 1 and not getattr(self, "failed", False):
+                    self.failed = True
+                    raise TelegramAPIError("server error", status=500)
+                return await super().__call__(chat_id, text)
+
+        sender = FailSecondChunk()
+        outbox = TelegramOutbox(send=sender, chat_rate=100, chat_burst=5, backoff_base=0.001)
+        text = "\n".join(f"- 항목 {i}" for i in range(1000))
+        ticket, = self.run_outbox(outbox, [text])
+
+        self.assertEqual(ticket.status, "sent")
+        self.assertEqual(ticket.attempts, 2)
+        self.assertEqual("\n".join(t for _, t in sender.sent), text)
+        self.assertEqual(ticket.message_ids, [str(i) for i in range(1, len(sender.sent) + 1)])
+
+    def test_drained_chats_are_removed(self):
+        """큐를 다 비운 채팅의 큐와 워커는 정리되고, 버킷은 토큰이 다시 찬 뒤 정리되는지 테스트"""
+        clock = FakeClock()
+        outbox = TelegramOutbox(send=FakeSender(), chat_rate=1, chat_burst=5, clock=clock)
+        for chat_id in ("1", "2", "3"):
+            self.run_outbox(outbox, ["hello"], chat_id=chat_id)
+
+        self.assertEqual(outbox._queues, {})
+        self.assertEqual(outbox._workers, {})
+        self.assertEqual(outbox.get_stats()["chats"], 0)
+        # 방금 토큰을 쓴 버킷은 속도 제한 상태를 유지
+        self.assertEqual(set(outbox._buckets), {"1", "2", "3"})
+
+        clock.now += 10
+        self.run_outbox(outbox, ["hello"], chat_id="4")
+        self.assertEqual(set(outbox._buckets), {"4"})
+
+    def test_stop_cancels_pending_tickets(self):
+        """중지 시 전송 중이거나 대기 중인 티켓이 cancelled 상태로 끝나고 대기가 풀리는지 테스트"""
+        outbox = TelegramOutbox(chat_rate=100, chat_burst=10, coalesce_max_chars=0)
+
+        async def run():
+            started = asyncio.Event()
+
+            async def hang(chat_id, text):
+                started.set()
+                await asyncio.Event().wait()
+
+            outbox.send = hang
+            tickets = [outbox.enqueue(f"알림 {i}", chat_id="42") for i in range(3)]
+            await started.wait()
+            await outbox.stop()
+            return await asyncio.wait_for(asyncio.gather(*[outbox.wait(t) for t in tickets]), 1)
+
+        tickets = asyncio.run(run())
+        self.assertEqual([t.status for t in tickets], ["cancelled"] * 3)
+        self.assertTrue(all(t.error for t in tickets))
+        self.assertEqual(outbox.stats.cancelled, 3)
+        self.assertEqual(outbox.get_stats()["depth"], 0)
+
+    def test_history_is_capped_with_stuck_chat(self):
+        """한 채팅이 멈춰 있어도 끝난 티켓 기록은 상한을 넘지 않고, 대기 중인 티켓은 계속 조회되는지 테스트"""
+        sender = FakeSender()
+        outbox = TelegramOutbox(chat_rate=100, chat_burst=100)
+
+        async def run():
+            async def send(chat_id, text):
+                if chat_id == "stuck":
+                    await asyncio.Event().wait()
+                return await sender(chat_id, text)
+
+            outbox.send = send
+            stuck = outbox.enqueue("멈춘 알림", chat_id="stuck")
+            try:
+                for i in range(20):
+                    await outbox.wait(outbox.enqueue(f"알림 {i}", chat_id="42"))
+                return stuck, outbox.get_ticket(stuck.ticket_id)
+            finally:
+                await outbox.stop()
+
+        with mock.patch.object(telegram_queue, "TELEGRAM_TICKET_HISTORY", 5):
+            stuck, found = asyncio.run(run())
+            self.assertLessEqual(len(outbox._tickets), 5)
+        self.assertIs(found, stuck)
+        self.assertEqual(len(sender.sent), 20)
+        self.assertEqual(outbox._pending, {})
+
+    def test_client_errors_are_not_retried(self):
+        """400 오류는 재시도하지 않는지 테스트"""
+        outbox = TelegramOutbox(send=FakeSender([TelegramAPIError("bad request", status=400)]),
+                                chat_rate=100, chat_burst=5)
+        ticket, = self.run_outbox(outbox, ["hello"])
+
+        self.assertEqual(ticket.status, "failed")
+        self.assertEqual(ticket.attempts, 1)
+        self.assertEqual(outbox.get_ticket(ticket.ticket_id).to_dict()["error"], "bad request")
+
+if __name__ == "__main__":
+    unittest.main()
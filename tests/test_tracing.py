@@ -0,0 +1,161 @@
+import unittest
+import asyncio
+import json
+import tempfile
+import threading
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# 상위 디렉토리를 시스템 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lib.tracing import (
+    span, traced, start_trace, bind_context, get_trace_id, current_span,
+    ChromeTraceExporter, load_chrome_trace, TracingMiddleware
+)
+from tests.helpers import call_app
+
+@traced("test.async_step")
+async def async_step(delay: float) -> str:
+    await asyncio.sleep(delay)
+    return get_trace_id()
+
+@traced()
+def sync_step() -> int:
+    return threading.get_ident()
+
+class TestSpans(unittest.TestCase):
+    """추적 구간 테스트 케이스"""
+
+    def test_noop_without_trace(self):
+        """추적 중이 아니면 구간이 기록되지 않고 함수 결과는 그대로인지 테스트"""
+        with span("outside") as s:
+            self.assertIsNone(s)
+        self.assertIsNone(get_trace_id())
+        self.assertEqual(sync_step(), threading.get_ident())
+
+    def test_nested_spans_across_tasks_and_threads(self):
+        """태스크와 bind_context로 넘긴 실행기 스레드의 구간이 같은 트리에 연결되는지 테스트"""
+        trace = start_trace("root", trace_id="abc123")
+
+        async def handler():
+            with trace.root:
+                with span("stage", size=2):
+                    ids = await asyncio.gather(async_step(0.001), async_step(0.002))
+                loop = asyncio.get_running_loop()
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    await loop.run_in_executor(executor, bind_context(sync_step))
+                self.assertIs(current_span(), trace.root)
+                return ids
+
+        self.assertEqual(asyncio.run(handler()), ["abc123", "abc123"])
+        names = [s.name for s in trace.spans()]
+        self.assertEqual(names, ["root", "stage", "test.async_step", "test.async_step", "test_tracing.sync_step"])
+        stage = trace.root.children[0]
+        self.assertEqual(stage.attributes, {"size": 2})
+        self.assertTrue(all(child.parent is stage for child in stage.children))
+        self.assertTrue(all(s.end is not None for s in trace.spans()))
+        self.assertGreaterEqual(stage.duration, 0.002)
+        self.assertIsNone(current_span())
+
+    def test_error_recorded(self):
+        """구간 안에서 발생한 예외가 속성으로 기록되고 다시 발생하는지 테스트"""
+        trace = start_trace("root")
+        with self.assertRaises(ValueError):
+            with trace.root:
+                with span("failing"):
+                    raise ValueError("잘못된 값")
+        self.assertEqual(trace.root.children[0].attributes["error"], "ValueError: 잘못된 값")
+
+    def test_server_timing_and_chrome_export(self):
+        """Server-Timing 값이 이름별로 합산되고, Chrome 추적 파일로 덧붙여 읽히는지 테스트"""
+        trace = start_trace("root")
+        with trace.root:
+            for _ in range(3):
+                with span("rag.categorize"):
+                    pass
+            with span("잘못된 이름"):
+                pass
+        timing = trace.server_timing()
+        entries = [entry.split(";")[0] for entry in timing.split(", ")]
+        self.assertEqual(entries, ["rag.categorize", "______", "total"])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "traces", "trace.json")
+            exporter = ChromeTraceExporter(path)
+            exporter.export(trace)
+            exporter.export(trace)
+            events = load_chrome_trace(path)
+        self.assertEqual(len(events), 10)
+        root_event = events[0]
+        self.assertEqual(root_event["ph"], "X")
+        self.assertIsNone(root_event["args"]["parent_id"])
+        self.assertTrue(all(e["args"]["trace_id"] == trace.trace_id for e in events))
+        child = events[1]
+        self.assertEqual(child["args"]["parent_id"], root_event["args"]["span_id"])
+        self.assertGreaterEqual(child["ts"], root_event["ts"])
+
+    def test_submit_writes_on_background_thread(self):
+        """submit()은 호출한 스레드에서 파일을 쓰지 않고, flush() 뒤에는 모든 추적이 기록되는지 테스트"""
+        traces = []
+        for _ in range(5):
+            trace = start_trace("root")
+            with trace.root:
+                pass
+            traces.append(trace)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            exporter = ChromeTraceExporter(os.path.join(tmp, "trace.json"))
+            writer_threads = []
+            write = exporter._write
+            exporter._write = lambda batch: writer_threads.append(threading.get_ident()) or write(batch)
+            self.assertTrue(all(exporter.submit(trace) for trace in traces))
+            exporter.flush()
+            events = load_chrome_trace(exporter.path)
+        self.assertEqual(len(events), 5)
+        self.assertNotIn(threading.get_ident(), writer_threads)
+        self.assertEqual(exporter.dropped, 0)
+
+class TestTracingMiddleware(unittest.TestCase):
+    """추적 미들웨어 테스트 케이스"""
+
+    def test_analyze_server_timing_header(self):
+        """헤더를 요청하면 /api/analyze의 단계별 Server-Timing과 추적 ID가 반환되는지 테스트"""
+        from api.main import app
+        body = json.dumps({"keywords": ["AI 마케팅", "블렌더 모델링"]}).encode("utf-8")
+        status, _, headers = call_app(app, "POST", "/api/analyze", body=body, with_headers=True,
+                                      headers={"X-Server-Timing": "1", "X-Trace-Id": "req-42"})
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["x-trace-id"], "req-42")
+        names = [entry.split(";")[0] for entry in headers["server-timing"].split(", ")]
+        for stage in ("api.analyze", "rag.generate_analysis", "request.parse", "response.serialize", "total"):
+            self.assertIn(stage, names)
+
+        # 헤더가 없으면 추적하지 않음
+        status, _, headers = call_app(app, "POST", "/api/analyze", body=body, with_headers=True)
+        self.assertEqual(status, 200)
+        self.assertNotIn("server-timing", headers)
+
+    def test_export_all_requests(self):
+        """내보내기 경로가 설정되면 헤더 없이도 요청 구간이 파일에 기록되는지 테스트"""
+        from api.main import root
+        from fastapi import FastAPI
+
+        app = FastAPI()
+        app.get("/")(root)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+            exporter = ChromeTraceExporter(path)
+            app.add_middleware(TracingMiddleware, exporter=exporter)
+            status, _, headers = call_app(app, "GET", "/", with_headers=True)
+            exporter.flush()
+            events = load_chrome_trace(path)
+        self.assertEqual(status, 200)
+        self.assertNotIn("server-timing", headers)
+        self.assertEqual(events[0]["name"], "request")
+        self.assertEqual(events[0]["args"]["status"], 200)
+        self.assertEqual(events[0]["args"]["trace_id"], headers["x-trace-id"])
+
+if __name__ == "__main__":
+    unittest.main()